@@ -1,30 +1,70 @@
 """
 Air Drawing Game Module
 Draw in the air using your index finger
+
+The canvas is unbounded: strokes live in world coordinates, their pixels in
+sparse TileMaps (tiles exist only where there is ink), one per layer plus a
+cached flattened composite, and the screen shows a pan/zoom view of the
+composite that is rebuilt from the visible tiles only.
+Finished strokes are autosaved by a DrawingSession in the background.
 """
 
+import os
+import time
 import cv2
 import numpy as np
-from collections import deque
+from text_sprites import put_text
+from tiled_canvas import TiledCanvas
+from layer_stack import LayerStack
+from stroke_model import StrokeDocument, RENDER_MARGIN
+from drawing_session import DrawingSession
 
 
 class AirDrawingGame:
     """Drawing application using finger tracking"""
     
-    def __init__(self, width=1280, height=720):
+    # How the canvas is shown over the video: 'ink' blends only drawn pixels
+    # (live video elsewhere), 'full' blends the whole canvas over the frame
+    COMPOSITE_MODES = ('ink', 'full')
+    
+    # View zoom limits (screen pixels per world pixel)
+    MIN_ZOOM = 0.5
+    MAX_ZOOM = 4.0
+    
+    # Palm width ratio (relative to the start of a pan/zoom) that leaves the
+    # zoom alone, so a pan does not drift the zoom level
+    ZOOM_DEADBAND = (0.87, 1.15)
+    
+    def __init__(self, width=1280, height=720, session_path=None):
         """
         Initialize the drawing game
         
         Args:
             width: Screen width
             height: Screen height
+            session_path: Autosave journal; a drawing left in it is recovered
+                (None disables autosave)
         """
         self.width = width
         self.height = height
         
-        # Drawing canvas
-        self.canvas = np.zeros((height, width, 3), dtype=np.uint8)
-        self.canvas.fill(255)  # White background
+        # The drawing is a list of vector strokes in world coordinates; the
+        # world raster is a sparse tile map per layer plus their flattened
+        # composite, and the canvas (white background) is a screen-sized
+        # tiled cache of the current view of the composite
+        self.document = StrokeDocument(width, height)
+        self.layers = LayerStack(self.document.layers, self.document.background)
+        self.active_layer = 1  # ink
+        self.tiles = TiledCanvas(width, height)
+        
+        # View: world position of the screen's top-left corner and zoom
+        self.view_x = 0
+        self.view_y = 0
+        self.zoom = 1.0
+        self._view_maps = None
+        self._pan_anchor = None
+        self.composite_mode = 'ink'
+        self.canvas_alpha = 0.7
         
         # Drawing state
         self.drawing = False
@@ -34,10 +74,6 @@ class AirDrawingGame:
         self.eraser_size = 30
         self.tool = 'pen'  # pen, eraser, none
         
-        # Drawing history for undo
-        self.history = []
-        self.max_history = 20
-        
         # Color palette
         self.colors = [
             ((0, 0, 255), 'Red'),
@@ -56,22 +92,155 @@ class AirDrawingGame:
         self.show_palette = False
         self.show_help = True
         
+        # Autosave and export worker; pick up a drawing an earlier run left behind
+        self.session = DrawingSession(session_path, width, height, self.document.background)
+        recovered = self.session.recover()
+        if recovered:
+            self._set_document(recovered)
+            print(f"Recovered {len(recovered.strokes)} strokes from {session_path}")
+        
+    @property
+    def canvas(self):
+        """Canvas image (BGR, white background)"""
+        return self.tiles.image
+    
+    @property
+    def world(self):
+        """Flattened world raster (TileMap) that the view shows"""
+        return self.layers.flat
+    
+    def _set_document(self, document):
+        """Switch to another drawing and rebuild its layers"""
+        self.layers.close()
+        self.document = document
+        self.layers = LayerStack(document.layers, document.background)
+        self.active_layer = min(self.active_layer, len(document.layers) - 1)
+        self._rerender(document.strokes)
+        self._refresh_view()
+    
     def save_to_history(self):
-        """Save current canvas to history"""
-        self.history.append(self.canvas.copy())
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+        """Finish the current stroke as one undo step (and queue it for autosave)"""
+        stroke = self.document.end_stroke()
+        if stroke:
+            if stroke.count == 1:
+                # A tap has no segment yet: draw its dot now
+                self._draw_segment(stroke, 0)
+            self.session.record('stroke', stroke)
+    
+    def _draw_segment(self, stroke, index):
+        """
+        Rasterize one segment of a stroke into its layer and refresh what shows it
+        
+        The segment is drawn with a margin (see StrokeDocument.render_box), the
+        composite is recomputed in its box, then the screen tiles showing it
+        are refreshed; pen and eraser take the same path.
+        
+        Args:
+            stroke: Stroke being drawn
+            index: Point index of the segment (0 for the dot of a tap)
+        """
+        x0, y0, x1, y1 = (int(v) for v in stroke.segment_box(index))
+        margin = RENDER_MARGIN
+        layer_map = self.layers.maps[stroke.layer]
+        block = layer_map.read(x0 - margin, y0 - margin, x1 + 1 + margin, y1 + 1 + margin)
+        stroke.draw(block, start=index, end=index + 1, offset=(x0 - margin, y0 - margin))
+        layer_map.write(x0, y0, block[margin:-margin, margin:-margin])
+        self.layers.flatten(x0, y0, x1 + 1, y1 + 1)
+        self._refresh_screen_box(x0, y0, x1, y1)
+    
+    def screen_to_world(self, point):
+        """Convert a screen position to world coordinates"""
+        return (self.view_x + int(point[0] // self.zoom), self.view_y + int(point[1] // self.zoom))
+    
+    def _world_to_screen_box(self, x0, y0, x1, y1):
+        """Convert an inclusive world box to the inclusive screen box showing it"""
+        zoom = self.zoom
+        return (int((x0 - self.view_x) * zoom), int((y0 - self.view_y) * zoom),
+                int((x1 + 1 - self.view_x) * zoom), int((y1 + 1 - self.view_y) * zoom))
+    
+    def _render_view(self, image, x0, y0, x1, y1):
+        """
+        Rebuild a box of the screen canvas from the world tiles it shows
+        
+        Args:
+            image: Screen canvas
+            x0, y0: Top-left screen corner (inclusive)
+            x1, y1: Bottom-right screen corner (exclusive)
+        """
+        out = image[y0:y1, x0:x1]
+        if self.zoom == 1.0:
+            self.world.read(self.view_x + x0, self.view_y + y0,
+                            self.view_x + x1, self.view_y + y1, out=out)
+            return
+        
+        # Nearest-neighbour sampling through screen-sized remap tables (world
+        # offset of every pixel, cached per zoom), shifted to the block read
+        if self._view_maps is None or self._view_maps[0] != self.zoom:
+            columns = (np.arange(self.width) // self.zoom).astype(np.float32)
+            rows = (np.arange(self.height) // self.zoom).astype(np.float32)
+            self._view_maps = (self.zoom, np.tile(columns, (self.height, 1)),
+                               np.tile(rows[:, None], (1, self.width)))
+        _, map_x, map_y = self._view_maps
+        bx0, by0 = int(map_x[0, x0]), int(map_y[y0, 0])
+        bx1, by1 = int(map_x[0, x1 - 1]) + 1, int(map_y[y1 - 1, 0]) + 1
+        block = self.world.read(self.view_x + bx0, self.view_y + by0, self.view_x + bx1, self.view_y + by1)
+        cv2.remap(block, map_x[y0:y1, x0:x1] - bx0, map_y[y0:y1, x0:x1] - by0,
+                  cv2.INTER_NEAREST, dst=out)
+    
+    def _refresh_view(self):
+        """Rebuild the whole screen canvas (after the view moved)"""
+        tiles = self.tiles
+        tiles.redraw_tiles(np.ones((tiles.rows, tiles.cols), dtype=bool), self._render_view)
+    
+    def _refresh_screen_box(self, x0, y0, x1, y1):
+        """Rebuild the screen tiles showing an inclusive world box"""
+        tiles = self.tiles
+        mask = tiles.tile_mask([self._world_to_screen_box(x0, y0, x1, y1)])
+        if mask.any():
+            tiles.redraw_tiles(mask, self._render_view)
+    
+    def _rerender(self, strokes):
+        """Rebuild the layer tiles covered by some strokes, then their composite"""
+        if not strokes:
+            return
+        layers = self.layers
+        boxes = np.concatenate([stroke.segment_boxes() for stroke in strokes])
+        keys = layers.flat.keys_touched(boxes)
+        
+        # Only the layers of these strokes changed, one horizontal run of tiles at a time
+        runs = layers.flat.runs(keys)
+        for index in sorted({stroke.layer for stroke in strokes}):
+            for x0, y0, x1, y1 in runs:
+                layers.maps[index].write(x0, y0, self.document.render_box(x0, y0, x1, y1, layer=index))
+        layers.flatten_keys(keys)
+        self._refresh_view()
     
     def undo(self):
-        """Undo last drawing action"""
-        if self.history:
-            self.canvas = self.history.pop()
+        """Undo last drawing action (re-renders only the tiles it covered)"""
+        self.prev_point = None
+        self.save_to_history()
+        strokes = self.document.undo()
+        if strokes is not None:
+            self.session.record('undo')
+        self._rerender(strokes)
+    
+    def redo(self):
+        """Redo the last undone drawing action"""
+        self.prev_point = None
+        self.save_to_history()
+        strokes = self.document.redo()
+        if strokes is not None:
+            self.session.record('redo')
+        self._rerender(strokes)
     
     def clear_canvas(self):
         """Clear the entire canvas"""
+        self.prev_point = None
         self.save_to_history()
-        self.canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        self.canvas.fill(255)
+        if self.document.clear():
+            self.session.record('clear')
+        self.layers.clear()
+        self.tiles.fill()
     
     def set_color(self, color_index):
         """
@@ -103,6 +272,151 @@ class AirDrawingGame:
         else:
             self.eraser_size = max(self.eraser_size - 5, 10)
     
+    def next_layer(self):
+        """Draw on the next layer"""
+        self.save_to_history()
+        self.prev_point = None
+        self.active_layer = (self.active_layer + 1) % len(self.document.layers)
+    
+    def _layer_changed(self, index):
+        """Recompute the composite after a layer's visibility or opacity changed"""
+        layer = self.document.layers[index]
+        self.session.record('layer', (index, layer.visible, layer.opacity))
+        self.layers.refresh()
+        self._refresh_view()
+    
+    def toggle_layer_visibility(self, index=None):
+        """
+        Show or hide a layer
+        
+        Args:
+            index: Layer index (the active layer if None)
+        """
+        index = self.active_layer if index is None else index
+        layer = self.document.layers[index]
+        layer.visible = not layer.visible
+        self._layer_changed(index)
+    
+    def change_layer_opacity(self, delta, index=None):
+        """
+        Make a layer more or less opaque
+        
+        Args:
+            delta: Opacity change (e.g. 0.1)
+            index: Layer index (the active layer if None)
+        """
+        index = self.active_layer if index is None else index
+        layer = self.document.layers[index]
+        opacity = round(min(max(layer.opacity + delta, 0.1), 1.0), 2)
+        if opacity != layer.opacity:
+            layer.opacity = opacity
+            self._layer_changed(index)
+    
+    def toggle_composite_mode(self):
+        """Switch between blending only the ink and blending the whole canvas"""
+        modes = self.COMPOSITE_MODES
+        self.composite_mode = modes[(modes.index(self.composite_mode) + 1) % len(modes)]
+    
+    def composite(self, frame):
+        """
+        Show the canvas over a video frame
+        
+        In 'ink' mode only inked pixels are blended, in place, tile run by
+        tile run, so the cost follows the amount of ink rather than the
+        frame size. 'full' mode blends the whole canvas into a new frame.
+        
+        Args:
+            frame: Video frame
+        
+        Returns:
+            np.ndarray: Frame with the canvas (the same array in 'ink' mode)
+        """
+        alpha = self.canvas_alpha
+        if self.composite_mode == 'full':
+            return cv2.addWeighted(self.canvas, alpha, frame, 1 - alpha, 0)
+        
+        tiles = self.tiles
+        for y0, y1, x0, x1 in tiles.ink_regions():
+            roi = frame[y0:y1, x0:x1]
+            blended = cv2.addWeighted(tiles.image[y0:y1, x0:x1], alpha, roi, 1 - alpha, 0)
+            cv2.copyTo(blended, tiles.ink[y0:y1, x0:x1], roi)
+        return frame
+    
+    def set_view(self, view_x, view_y, zoom=None):
+        """
+        Move the view (refreshing the screen canvas only if it changed)
+        
+        Args:
+            view_x, view_y: World position of the screen's top-left corner
+            zoom: Screen pixels per world pixel (clamped; unchanged if None)
+        """
+        if zoom is None:
+            zoom = self.zoom
+        zoom = min(max(zoom, self.MIN_ZOOM), self.MAX_ZOOM)
+        view = (int(round(view_x)), int(round(view_y)), zoom)
+        if view == (self.view_x, self.view_y, self.zoom):
+            return
+        self.view_x, self.view_y, self.zoom = view
+        self.prev_point = None
+        self._refresh_view()
+    
+    def pan(self, dx, dy):
+        """Move the view by a screen-space offset (drag direction)"""
+        self.set_view(self.view_x - dx / self.zoom, self.view_y - dy / self.zoom)
+    
+    def zoom_at(self, factor, center=None):
+        """
+        Zoom keeping the world point under a screen position in place
+        
+        Args:
+            factor: Zoom multiplier
+            center: Screen (x, y) to zoom about (screen center if None)
+        """
+        if center is None:
+            center = (self.width // 2, self.height // 2)
+        zoom = min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        wx = self.view_x + center[0] / self.zoom
+        wy = self.view_y + center[1] / self.zoom
+        self.set_view(wx - center[0] / zoom, wy - center[1] / zoom, zoom)
+    
+    def reset_view(self):
+        """Go back to the origin at 1:1"""
+        self.set_view(0, 0, 1.0)
+    
+    def pan_zoom(self, palm_pos, palm_width):
+        """
+        Grab-and-move the canvas with an open hand
+        
+        The world point under the palm when the gesture starts stays under
+        the palm; spreading the hand toward or away from the camera (its
+        apparent width) zooms once it leaves the deadband.
+        
+        Args:
+            palm_pos: Screen (x, y) of the palm
+            palm_width: Apparent palm width in pixels
+        """
+        if self.drawing:
+            self.update(None, False)
+        if self._pan_anchor is None:
+            anchor_x = self.view_x + palm_pos[0] / self.zoom
+            anchor_y = self.view_y + palm_pos[1] / self.zoom
+            self._pan_anchor = (anchor_x, anchor_y, max(palm_width, 1.0), self.zoom)
+            return
+        anchor_x, anchor_y, anchor_width, anchor_zoom = self._pan_anchor
+        ratio = palm_width / anchor_width
+        low, high = self.ZOOM_DEADBAND
+        zoom = anchor_zoom
+        if ratio > high:
+            zoom = anchor_zoom * ratio / high
+        elif ratio < low:
+            zoom = anchor_zoom * ratio / low
+        zoom = min(max(zoom, self.MIN_ZOOM), self.MAX_ZOOM)
+        self.set_view(anchor_x - palm_pos[0] / zoom, anchor_y - palm_pos[1] / zoom, zoom)
+    
+    def end_pan_zoom(self):
+        """Release the canvas after pan_zoom()"""
+        self._pan_anchor = None
+    
     def toggle_tool(self):
         """Switch between pen and eraser"""
         if self.tool == 'pen':
@@ -115,18 +429,21 @@ class AirDrawingGame:
         Update drawing state
         
         Args:
-            finger_pos: (x, y) position of finger
+            finger_pos: (x, y) screen position of finger
             is_drawing: Boolean indicating if drawing mode is active
         """
         if finger_pos and is_drawing:
-            if self.prev_point is not None:
-                # Draw line from previous point to current point
-                if self.tool == 'pen':
-                    cv2.line(self.canvas, self.prev_point, finger_pos,
-                            self.current_color, self.brush_size)
-                elif self.tool == 'eraser':
-                    cv2.circle(self.canvas, finger_pos, self.eraser_size,
-                              (255, 255, 255), -1)
+            document = self.document
+            if self.prev_point is None:
+                self.save_to_history()
+                size = self.brush_size if self.tool == 'pen' else self.eraser_size
+                document.begin_stroke(self.tool, self.current_color, size, self.active_layer)
+            stroke = document.current
+            stroke.append(self.screen_to_world(finger_pos), time.perf_counter())
+            
+            if stroke.count > 1:
+                # Rasterize only the new segment into its layer's tiles
+                self._draw_segment(stroke, stroke.count - 1)
             
             self.prev_point = finger_pos
             self.drawing = True
@@ -148,52 +465,63 @@ class AirDrawingGame:
             Combined frame with canvas and UI
         """
         # Blend canvas with video frame
-        alpha = 0.7
-        result = cv2.addWeighted(self.canvas, alpha, frame, 1 - alpha, 0)
+        result = self.composite(frame)
         
         # Draw toolbar background
-        cv2.rectangle(result, (10, 10), (350, 120), (50, 50, 50), -1)
-        cv2.rectangle(result, (10, 10), (350, 120), (255, 255, 255), 2)
+        cv2.rectangle(result, (10, 10), (350, 150), (50, 50, 50), -1)
+        cv2.rectangle(result, (10, 10), (350, 150), (255, 255, 255), 2)
         
         # Draw current tool indicator
         tool_text = f"Tool: {self.tool.upper()}"
-        cv2.putText(result, tool_text, (20, 35),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        put_text(result, tool_text, (20, 35),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
         # Draw current color indicator
         color_name = self.colors[self.current_color_index][1]
-        cv2.putText(result, f"Color: {color_name}", (20, 65),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        put_text(result, f"Color: {color_name}", (20, 65),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         cv2.rectangle(result, (180, 45), (220, 70), self.current_color, -1)
         cv2.rectangle(result, (180, 45), (220, 70), (255, 255, 255), 2)
         
         # Draw brush size indicator
         size = self.brush_size if self.tool == 'pen' else self.eraser_size
-        cv2.putText(result, f"Size: {size}", (20, 95),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        put_text(result, f"Size: {size}", (20, 95),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        
+        # Draw active layer with its opacity
+        layer = self.document.layers[self.active_layer]
+        layer_text = f"Layer: {layer.name.title()} {layer.opacity * 100:.0f}%"
+        if not layer.visible:
+            layer_text += " (hidden)"
+        put_text(result, layer_text, (20, 125),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        
+        # Draw zoom and view position when away from the home view
+        if self.zoom != 1.0 or self.view_x or self.view_y:
+            put_text(result, f"{self.zoom * 100:.0f}% @ {self.view_x},{self.view_y}", (180, 95),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         
         # Draw drawing indicator
         if self.drawing:
             cv2.circle(result, (320, 60), 15, (0, 255, 0), -1)
-            cv2.putText(result, "DRAWING", (240, 70),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+            put_text(result, "DRAWING", (240, 70),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
         
         # Draw help text
         if self.show_help:
             help_texts = [
                 "C: Next Color | T: Toggle Tool | +/-: Brush Size",
-                "U: Undo | X: Clear | H: Toggle Help",
-                "ESC: Menu | Q: Quit"
+                "U: Undo | Y: Redo | X: Clear | H: Toggle Help",
+                "B: Blend Mode | E: Export | ESC: Menu | Q: Quit",
+                "Open Palm: Pan/Zoom | [ / ]: Zoom | O: Reset View",
+                "L: Next Layer | K: Show/Hide Layer | , / .: Layer Opacity"
             ]
-            y = self.height - 90
+            y = self.height - 150
             for text in help_texts:
-                cv2.putText(result, text, (10, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                # Black outline for better visibility
-                cv2.putText(result, text, (10, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 3)
-                cv2.putText(result, text, (10, y),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                # Black outline for better visibility (one cached sprite)
+                put_text(result, text, (10, y),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1,
+                       outline_color=(0, 0, 0), outline_thickness=3)
                 y += 30
         
         # Draw color palette if visible
@@ -218,8 +546,8 @@ class AirDrawingGame:
                      (255, 255, 255), 2)
         
         # Title
-        cv2.putText(frame, "Color Palette", (palette_x + 20, palette_y + 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        put_text(frame, "Color Palette", (palette_x + 20, palette_y + 30),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
         # Colors
         y = palette_y + 60
@@ -231,16 +559,35 @@ class AirDrawingGame:
                          (palette_x + 60, y + 30), (255, 255, 255), 2)
             
             # Color name
-            cv2.putText(frame, f"{i + 1}. {name}", (palette_x + 70, y + 22),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+            put_text(frame, f"{i + 1}. {name}", (palette_x + 70, y + 22),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
             
             # Selection indicator
             if i == self.current_color_index:
-                cv2.putText(frame, "<", (palette_x + 200, y + 22),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+                put_text(frame, "<", (palette_x + 200, y + 22),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
             
             y += 40
     
+    def export(self, output_dir='drawings'):
+        """
+        Save the drawing as PNG and SVG plus its stroke log, in the background
+        
+        Only the list of finished strokes is handed over; rendering and
+        writing happen on the session's worker thread.
+        
+        Args:
+            output_dir: Directory for the files
+        
+        Returns:
+            str: Output path without extension (.png, .svg and .npz follow)
+        """
+        self.save_to_history()
+        base = os.path.join(output_dir, f"drawing_{time.strftime('%Y%m%d_%H%M%S')}")
+        self.session.export(base, self.document.strokes,
+                            [layer.copy() for layer in self.document.layers])
+        return base
+    
     def toggle_palette(self):
         """Toggle color palette visibility"""
         self.show_palette = not self.show_palette
@@ -252,9 +599,19 @@ class AirDrawingGame:
     def reset(self):
         """Reset the drawing application"""
         self.clear_canvas()
-        self.history = []
+        self.active_layer = 1
+        self._set_document(StrokeDocument(self.width, self.height))
+        self.session.restart()
+        self._pan_anchor = None
+        self.reset_view()
         self.tool = 'pen'
         self.current_color_index = 0
         self.current_color = self.colors[0][0]
         self.brush_size = 5
         self.eraser_size = 30
+    
+    def close(self):
+        """Finish the current stroke and write everything still queued"""
+        self.save_to_history()
+        self.session.close()
+        self.layers.close()
@@ -0,0 +1,367 @@
+"""
+Arcade Host Module
+Runs several game stations in one process with a shared hand tracking pool
+"""
+
+import argparse
+import os
+import queue
+import threading
+import time
+from collections import deque
+import cv2
+from hand_tracker import HandTracker
+from landmark_renderer import LandmarkRenderer
+from game_launcher import GameLauncher
+
+
+class TrackingPool:
+    """
+    Shared hand tracking workers for several stations
+    
+    Each worker owns one HandTracker and serves the stations assigned to it
+    (station i goes to worker i % num_workers) in round-robin order. A
+    station holds at most one pending frame and submitting a new one replaces
+    it, so a station producing frames quickly cannot get ahead of the others.
+    Frames are tracked with the HandTracker profile of the station's current
+    game; a worker builds one tracker per distinct profile on first use.
+    """
+    
+    def __init__(self, num_stations, num_workers=None, **tracker_options):
+        """
+        Initialize and start the workers
+        
+        Args:
+            num_stations: Number of stations submitting frames
+            num_workers: Number of tracking workers (CPU core count if None)
+            **tracker_options: Settings overriding every profile's values
+        """
+        self.num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_stations))
+        self.running = True
+        
+        self._condition = threading.Condition()
+        self._pending = [None] * num_stations
+        self._completed = queue.Queue()
+        self._workers = []
+        
+        for worker_id in range(self.num_workers):
+            stations = list(range(worker_id, num_stations, self.num_workers))
+            # A tracker shared by several streams must not carry state between frames
+            options = dict(tracker_options, static_image_mode=len(stations) > 1)
+            thread = threading.Thread(target=self._worker, args=(stations, options), daemon=True)
+            thread.start()
+            self._workers.append(thread)
+    
+    def submit(self, station_id, frame, profile='full'):
+        """
+        Queue a frame for tracking (replaces the station's pending frame)
+        
+        Args:
+            station_id: Station index
+            frame: Mirrored camera frame (not modified until returned)
+            profile: HandTracker profile to track it with
+        """
+        with self._condition:
+            self._pending[station_id] = (frame, profile)
+            self._condition.notify_all()
+    
+    def get_completed(self, timeout=0.05):
+        """
+        Collect tracked frames
+        
+        Args:
+            timeout: Seconds to wait for the first result
+        
+        Returns:
+            list: (station_id, frame, results) tuples
+        """
+        completed = []
+        try:
+            completed.append(self._completed.get(timeout=timeout))
+            while True:
+                completed.append(self._completed.get_nowait())
+        except queue.Empty:
+            pass
+        return completed
+    
+    def _worker(self, stations, tracker_options):
+        """Tracking worker: serve assigned stations round-robin"""
+        trackers = {}
+        turn = 0
+        
+        while True:
+            with self._condition:
+                station = None
+                while self.running and station is None:
+                    for offset in range(len(stations)):
+                        candidate = stations[(turn + offset) % len(stations)]
+                        if self._pending[candidate] is not None:
+                            station = candidate
+                            turn = (turn + offset + 1) % len(stations)
+                            break
+                    else:
+                        self._condition.wait(timeout=0.5)
+                if station is None:
+                    break
+                frame, profile = self._pending[station]
+                self._pending[station] = None
+            
+            key = HandTracker.graph_key(profile, **tracker_options)
+            tracker = trackers.get(key)
+            if tracker is None:
+                tracker = HandTracker.from_profile(profile, **dict(tracker_options, landmark_style=None))
+                trackers[key] = tracker
+            frame, results = tracker.find_hands(frame, draw=False)
+            self._completed.put((station, frame, results))
+        
+        for tracker in trackers.values():
+            tracker.close()
+    
+    def close(self):
+        """Stop the workers"""
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+        for thread in self._workers:
+            thread.join(timeout=2)
+
+
+class PooledHandTracker(HandTracker):
+    """HandTracker interface for one station; results come from the TrackingPool"""
+    
+    def __init__(self, landmark_style='default'):
+        """
+        Initialize the station tracker (no MediaPipe graph of its own)
+        
+        Args:
+            landmark_style: LandmarkRenderer style used when drawing
+        """
+        self.renderer = LandmarkRenderer(landmark_style)
+        self.latest_results = None
+        self.profile = 'full'
+    
+    def use_profile(self, name):
+        """Track this station's next frames with a HandTracker profile"""
+        self.profile = name
+    
+    def find_hands(self, frame, draw=True):
+        """Return the pool's results for this frame (same signature as HandTracker)"""
+        if draw:
+            self.draw_landmarks(frame, self.latest_results)
+        return frame, self.latest_results
+    
+    def close(self):
+        """Nothing to release; the pool owns the trackers"""
+        pass
+
+
+class ArcadeStation:
+    """One camera station: frame source, launcher session and FPS meter"""
+    
+    def __init__(self, station_id, source, pool, game=None, config_file=None, loop=False,
+                 seed=None):
+        """
+        Initialize a station
+        
+        Args:
+            station_id: Station index
+            source: Camera index or video file path
+            pool: Shared TrackingPool
+            game: Game key to start immediately (game selection screen if None)
+            config_file: Settings file for this station
+            loop: Restart video files when they end
+            seed: Session seed for this station's games (random if None)
+        """
+        self.station_id = station_id
+        self.source = source
+        self.pool = pool
+        self.loop = loop
+        
+        capture = cv2.VideoCapture(int(source) if str(source).isdigit() else source)
+        self.tracker = PooledHandTracker()
+        self.launcher = GameLauncher(
+            capture=capture,
+            hand_tracker=self.tracker,
+            config_file=config_file or f'station_{station_id + 1}.json',
+            event_log_path=f'logs/station_{station_id + 1}/events.jsonl',
+            seed=seed,
+            drawing_session_path=f'drawings/station_{station_id + 1}/autosave.jsonl'
+        )
+        if game:
+            self.launcher.start_game(game)
+        
+        self.in_flight = False
+        self.finished = False
+        self.frames = 0
+        self.last_frame = None
+        self._frame_times = deque(maxlen=60)
+    
+    def submit_next(self):
+        """Read the next frame and hand it to the tracking pool"""
+        frame = self.launcher.read_frame()
+        if frame is None and self.loop:
+            self.launcher.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            frame = self.launcher.read_frame()
+        if frame is None:
+            self.finished = True
+            return
+        
+        self.pool.submit(self.station_id, frame, self.tracker.profile)
+        self.in_flight = True
+    
+    def complete(self, frame, results):
+        """
+        Run the game on a tracked frame
+        
+        Returns:
+            frame: Composited frame
+        """
+        self.tracker.latest_results = results
+        frame = self.launcher.process_frame(frame)
+        self.last_frame = frame
+        self.in_flight = False
+        self.frames += 1
+        self._frame_times.append(time.perf_counter())
+        return frame
+    
+    def get_fps(self):
+        """Frames per second over the last 60 frames"""
+        if len(self._frame_times) < 2:
+            return 0.0
+        elapsed = self._frame_times[-1] - self._frame_times[0]
+        return (len(self._frame_times) - 1) / elapsed if elapsed > 0 else 0.0
+    
+    def close(self):
+        """Release the station's frame source, recorder, drawing autosave and event log"""
+        self.launcher.close_game()
+        self.launcher.cap.release()
+        self.launcher.recorder.close()
+        if self.launcher.event_log:
+            self.launcher.event_log.log('session_end')
+            self.launcher.event_log.close()
+
+
+class ArcadeHost:
+    """Runs N independent stations sharing one tracking pool"""
+    
+    def __init__(self, sources, games=None, config_files=None, num_workers=None,
+                 show=True, loop=False, seed=None):
+        """
+        Initialize the host
+        
+        Args:
+            sources: Camera indices or video file paths, one per station
+            games: Game keys per station (None entries show game selection)
+            config_files: Settings files per station
+            num_workers: Tracking workers (CPU core count if None)
+            show: Display one window per station
+            loop: Restart video files when they end
+            seed: Base session seed; station i uses seed + i (random if None)
+        """
+        games = games or [None] * len(sources)
+        config_files = config_files or [None] * len(sources)
+        self.show = show
+        self.pool = TrackingPool(len(sources), num_workers)
+        self.stations = [
+            ArcadeStation(i, source, self.pool, games[i], config_files[i], loop,
+                          None if seed is None else seed + i)
+            for i, source in enumerate(sources)
+        ]
+    
+    def get_station_fps(self):
+        """
+        Get the current frame rate of every station
+        
+        Returns:
+            list: FPS per station
+        """
+        return [station.get_fps() for station in self.stations]
+    
+    def report(self):
+        """Print per-station frame rates"""
+        print(" | ".join(
+            f"Station {s.station_id + 1}: {s.get_fps():5.1f} FPS ({s.frames} frames)"
+            for s in self.stations
+        ))
+    
+    def run(self, max_frames=None, report_interval=2.0):
+        """
+        Run all stations until every source ends, Q is pressed or max_frames is reached
+        
+        Args:
+            max_frames: Stop after each station has processed this many frames
+            report_interval: Seconds between FPS reports
+        """
+        print(f"Running {len(self.stations)} stations on {self.pool.num_workers} tracking workers")
+        next_report = time.perf_counter() + report_interval
+        
+        try:
+            while True:
+                for station in self.stations:
+                    if not station.in_flight and not station.finished:
+                        if max_frames is None or station.frames < max_frames:
+                            station.submit_next()
+                
+                if not any(station.in_flight for station in self.stations):
+                    break
+                
+                for station_id, frame, results in self.pool.get_completed():
+                    station = self.stations[station_id]
+                    frame = station.complete(frame, results)
+                    if self.show:
+                        cv2.imshow(f"Station {station_id + 1}", frame)
+                
+                if self.show:
+                    key = cv2.waitKey(1) & 0xFF
+                    if key != 255 and not all([
+                        s.launcher.handle_key(key, s.last_frame)
+                        for s in self.stations if s.last_frame is not None
+                    ]):
+                        break
+                
+                if time.perf_counter() >= next_report:
+                    self.report()
+                    next_report += report_interval
+        finally:
+            self.report()
+            self.cleanup()
+    
+    def cleanup(self):
+        """Release resources"""
+        self.pool.close()
+        for station in self.stations:
+            station.close()
+        if self.show:
+            cv2.destroyAllWindows()
+
+
+def main():
+    """Entry point: python arcade_host.py 0 1 or python arcade_host.py a.mp4 b.mp4 --headless"""
+    parser = argparse.ArgumentParser(description="Run several game stations in one process")
+    parser.add_argument('sources', nargs='+', help="Camera indices or video files, one per station")
+    parser.add_argument('--games', nargs='+', default=None, choices=list(GameLauncher.GAMES),
+                        help="Game to start on each station")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Tracking workers (default: CPU core count)")
+    parser.add_argument('--frames', type=int, default=None,
+                        help="Stop after this many frames per station")
+    parser.add_argument('--headless', action='store_true', help="Do not open windows")
+    parser.add_argument('--loop', action='store_true', help="Loop video files")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Base session seed (station i uses seed + i)")
+    args = parser.parse_args()
+    
+    games = None
+    if args.games:
+        games = (args.games * len(args.sources))[:len(args.sources)]
+    
+    try:
+        host = ArcadeHost(args.sources, games=games, num_workers=args.workers,
+                          show=not args.headless, loop=args.loop, seed=args.seed)
+        host.run(max_frames=args.frames)
+    except KeyboardInterrupt:
+        print("\nArcade host interrupted by user")
+
+
+if __name__ == "__main__":
+    main()
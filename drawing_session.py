@@ -0,0 +1,253 @@
+"""
+Drawing Session Module
+Background autosave, crash recovery and export for Air Drawing
+
+The drawing is saved as a journal of what happened to it: one JSON line
+per finished stroke, undo, redo, clear or layer setting change, after a
+header line with the drawing size and layers. The frame loop only appends (operation, stroke) references to
+a deque - a finished Stroke never changes again, so the reference is the
+snapshot. A background thread encodes and appends pending lines every
+`interval` seconds and fsyncs them, so a crash loses at most the last
+interval. On the next start the journal is replayed (a torn last line is
+ignored) and rewritten compactly as just the remaining strokes.
+
+Exports (PNG, SVG and the stroke log) run on the same thread from a tuple
+of the strokes at the time of the request.
+"""
+
+import json
+import os
+import threading
+from collections import deque
+import numpy as np
+from stroke_model import Layer, Stroke, StrokeDocument
+
+
+class DrawingSession:
+    """Journal writer and export worker for one Air Drawing session"""
+    
+    def __init__(self, path='drawings/session/autosave.jsonl', width=1280, height=720,
+                 background=(255, 255, 255), interval=2.0):
+        """
+        Initialize the session and start the writer thread
+        
+        Args:
+            path: Journal file (None disables autosave; exports still work)
+            width: Drawing width in pixels
+            height: Drawing height in pixels
+            background: BGR background color
+            interval: Seconds between journal writes
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.background = tuple(background)
+        self.interval = interval
+        
+        self.records_written = 0
+        self.exports_written = 0
+        
+        self._pending = deque()
+        self._running = True
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+    
+    def record(self, op, payload=None):
+        """
+        Queue a journal entry (never blocks)
+        
+        Args:
+            op: 'stroke', 'undo', 'redo', 'clear' or 'layer'
+            payload: The finished Stroke for 'stroke', (index, visible, opacity) for 'layer'
+        """
+        if self.path:
+            self._pending.append(('record', op, payload))
+    
+    def restart(self, strokes=(), layers=None):
+        """
+        Start the journal over with just some strokes (no history)
+        
+        Args:
+            strokes: Strokes to keep, oldest first
+            layers: Copies of the drawing's layers (the defaults if None)
+        """
+        if self.path:
+            self._pending.append(('rewrite', tuple(strokes), layers))
+    
+    def export(self, base, strokes, layers=None):
+        """
+        Queue an export of base.png, base.svg and base.npz
+        
+        Args:
+            base: Output path without extension
+            strokes: Strokes to export, oldest first
+            layers: Copies of the drawing's layers (the defaults if None)
+        """
+        self._pending.append(('export', base, (tuple(strokes), layers)))
+        self._wakeup.set()
+    
+    def recover(self):
+        """
+        Read the journal left by an earlier run
+        
+        Replays every entry in order; an incomplete last line (a crash
+        mid-write) is skipped. The journal is then rewritten as just the
+        remaining strokes.
+        
+        Returns:
+            StrokeDocument: The recovered drawing (each stroke undoable), or
+                None if there was nothing to recover
+        """
+        if not self.path or not os.path.exists(self.path):
+            return None
+        
+        document = StrokeDocument(self.width, self.height, self.background)
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    self._replay(document, entry)
+        except OSError as e:
+            print(f"Error reading drawing session: {e}")
+            return None
+        
+        strokes = document.strokes
+        self.restart(strokes, [layer.copy() for layer in document.layers])
+        if not strokes:
+            return None
+        recovered = StrokeDocument(self.width, self.height, self.background, document.layers)
+        for stroke in strokes:
+            recovered.current = stroke
+            recovered.end_stroke()
+        return recovered
+    
+    def _replay(self, document, entry):
+        """Apply one journal entry to a document"""
+        op = entry.get('op')
+        if op == 'stroke':
+            points = np.array(entry['points'], dtype=np.int32).reshape(-1, 2)
+            document.current = Stroke(entry['tool'], entry['color'], entry['size'],
+                                      points, entry.get('times'), entry.get('layer', 0))
+            document.end_stroke()
+        elif op == 'session' and 'layers' in entry:
+            document.layers = [Layer(name, visible, opacity)
+                               for name, visible, opacity in entry['layers']]
+        elif op == 'layer' and entry['index'] < len(document.layers):
+            layer = document.layers[entry['index']]
+            layer.visible = entry['visible']
+            layer.opacity = entry['opacity']
+        elif op == 'undo':
+            document.undo()
+        elif op == 'redo':
+            document.redo()
+        elif op == 'clear':
+            document.clear()
+    
+    def _encode(self, op, payload=None):
+        """Format one journal line"""
+        entry = {'op': op}
+        if op == 'stroke':
+            stroke = payload
+            entry.update(tool=stroke.tool, color=list(stroke.color), size=stroke.size,
+                         layer=stroke.layer, points=stroke.points.ravel().tolist(),
+                         times=np.round(stroke.times - stroke.times[0], 4).tolist())
+        elif op == 'layer':
+            index, visible, opacity = payload
+            entry.update(index=index, visible=visible, opacity=opacity)
+        return json.dumps(entry, separators=(',', ':')) + '\n'
+    
+    def _header(self, layers=None):
+        """Format the journal header line"""
+        entry = {'op': 'session', 'size': [self.width, self.height],
+                 'background': list(self.background)}
+        if layers is not None:
+            entry['layers'] = [[layer.name, layer.visible, layer.opacity] for layer in layers]
+        return json.dumps(entry, separators=(',', ':')) + '\n'
+    
+    def _write_batch(self):
+        """Write pending journal lines and run pending exports, in order"""
+        lines = []
+        while self._pending:
+            kind, first, second = self._pending.popleft()
+            if kind == 'record':
+                lines.append(self._encode(first, second))
+            elif kind == 'rewrite':
+                lines = []
+                self._rewrite(first, second)
+            else:
+                self._flush_lines(lines)
+                lines = []
+                self._export(first, *second)
+        self._flush_lines(lines)
+    
+    def _flush_lines(self, lines):
+        """Append lines to the journal and make them durable"""
+        if not lines:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        new_file = not os.path.exists(self.path)
+        with open(self.path, 'a') as f:
+            if new_file:
+                f.write(self._header())
+            f.write(''.join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        self.records_written += len(lines)
+    
+    def _rewrite(self, strokes, layers=None):
+        """Replace the journal with a compact one (header plus strokes)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w') as f:
+            f.write(self._header(layers))
+            f.write(''.join(self._encode('stroke', stroke) for stroke in strokes))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+    
+    def _export(self, base, strokes, layers=None):
+        """Write base.png, base.svg and base.npz"""
+        directory = os.path.dirname(base)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        document = StrokeDocument(self.width, self.height, self.background, layers)
+        document.strokes = list(strokes)
+        document.save(base + '.npz')
+        document.save_svg(base + '.svg')
+        if document.save_png(base + '.png'):
+            self.exports_written += 1
+            print(f"Drawing saved to {base}.png (.svg, .npz)")
+        else:
+            print(f"Error writing drawing: {base}.png")
+    
+    def _writer(self):
+        """Writer thread: write the journal periodically"""
+        while self._running:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self._write_batch()
+            except (OSError, ValueError) as e:
+                print(f"Error saving drawing session: {e}")
+        try:
+            self._write_batch()
+        except (OSError, ValueError) as e:
+            print(f"Error saving drawing session: {e}")
+    
+    def flush(self):
+        """Ask the writer thread to write pending entries now"""
+        self._wakeup.set()
+    
+    def close(self):
+        """Write remaining entries, finish exports and stop the writer thread"""
+        self._running = False
+        self._wakeup.set()
+        self._thread.join(timeout=10)
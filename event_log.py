@@ -0,0 +1,235 @@
+"""
+Event Log Module
+Append-only gameplay event log written in batches by a background thread
+
+Records are JSON lines: {"t": time, "s": session, "e": event, ...fields}
+"""
+
+import argparse
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+
+
+class EventLog:
+    """
+    Buffered, rotating gameplay event log
+    
+    `log()` only appends a tuple to an in-memory deque, so it never blocks
+    the frame loop on disk I/O. A background thread drains the deque every
+    `flush_interval` seconds and writes the whole batch at once. When the
+    current file would exceed `max_bytes` it is rotated to events.1.jsonl,
+    events.2.jsonl, ... keeping `backup_count` old files.
+    """
+    
+    def __init__(self, path='logs/events.jsonl', max_bytes=5 * 1024 * 1024, backup_count=5,
+                 flush_interval=1.0, max_pending=100000, session_id=None):
+        """
+        Initialize the log and start the writer thread
+        
+        Args:
+            path: Log file path
+            max_bytes: Rotate when the file would grow beyond this size
+            backup_count: Number of rotated files to keep
+            flush_interval: Seconds between batch writes
+            max_pending: Records kept in memory before new ones are dropped
+            session_id: Session identifier (random if None)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.session_id = session_id or uuid.uuid4().hex[:12]
+        
+        self.records_written = 0
+        self.records_dropped = 0
+        
+        self._pending = deque()
+        self._running = True
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+    
+    def log(self, event, **fields):
+        """
+        Record an event (never blocks)
+        
+        Args:
+            event: Event name, e.g. 'food_eaten'
+            **fields: JSON-serializable event fields
+        """
+        if len(self._pending) >= self.max_pending:
+            self.records_dropped += 1
+            return
+        self._pending.append((time.time(), event, fields))
+    
+    def _format_batch(self):
+        """Drain pending records into one string"""
+        lines = []
+        session = self.session_id
+        while self._pending:
+            timestamp, event, fields = self._pending.popleft()
+            record = {'t': round(timestamp, 3), 's': session, 'e': event}
+            record.update(fields)
+            lines.append(json.dumps(record, separators=(',', ':'), default=str))
+        return '\n'.join(lines) + '\n' if lines else ''
+    
+    def _rotate(self):
+        """Shift events.N.jsonl files and start a new log file"""
+        base, extension = os.path.splitext(self.path)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{base}.{index}{extension}"
+            if os.path.exists(source):
+                os.replace(source, f"{base}.{index + 1}{extension}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{base}.1{extension}")
+        else:
+            os.remove(self.path)
+    
+    def _write_batch(self):
+        """Write all pending records, rotating first if needed"""
+        batch = self._format_batch()
+        if not batch:
+            return
+        
+        data = batch.encode('utf-8')
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path) and os.path.getsize(self.path) + len(data) > self.max_bytes:
+            self._rotate()
+        
+        with open(self.path, 'ab') as f:
+            f.write(data)
+        self.records_written += batch.count('\n')
+    
+    def _writer(self):
+        """Writer thread: flush batches periodically"""
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self._write_batch()
+            except OSError as e:
+                print(f"Error writing event log: {e}")
+        self._write_batch()
+    
+    def flush(self):
+        """Ask the writer thread to write pending records now"""
+        self._wakeup.set()
+    
+    def close(self):
+        """Write remaining records and stop the writer thread"""
+        self._running = False
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+
+
+def read_events(path):
+    """
+    Read all records of a log, oldest rotated file first
+    
+    Args:
+        path: Log file path (rotated siblings are included) or a directory
+    
+    Yields:
+        dict: Event records
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, 'events.jsonl')
+    base, extension = os.path.splitext(path)
+    
+    def rotation_index(name):
+        suffix = name[len(base) + 1:-len(extension)] if extension else name[len(base) + 1:]
+        return int(suffix) if suffix.isdigit() else 0
+    
+    rotated = sorted(glob.glob(f"{base}.*{extension}"), key=rotation_index, reverse=True)
+    files = [name for name in rotated if rotation_index(name) > 0]
+    if os.path.exists(path):
+        files.append(path)
+    
+    for name in files:
+        with open(name, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def summarize_sessions(records):
+    """
+    Aggregate records per session
+    
+    Args:
+        records: Iterable of event records
+    
+    Returns:
+        dict: session id -> summary dictionary
+    """
+    sessions = defaultdict(lambda: {
+        'start': None, 'end': None, 'events': defaultdict(int),
+        'games_started': defaultdict(int), 'game_overs': defaultdict(int),
+        'best_scores': {},
+    })
+    
+    for record in records:
+        summary = sessions[record.get('s')]
+        timestamp = record.get('t', 0)
+        if summary['start'] is None or timestamp < summary['start']:
+            summary['start'] = timestamp
+        if summary['end'] is None or timestamp > summary['end']:
+            summary['end'] = timestamp
+        
+        event = record.get('e')
+        summary['events'][event] += 1
+        game = record.get('game')
+        if event == 'game_start':
+            summary['games_started'][game] += 1
+        elif event == 'game_over':
+            summary['game_overs'][game] += 1
+            score = record.get('score')
+            if score is not None and score > summary['best_scores'].get(game, float('-inf')):
+                summary['best_scores'][game] = score
+    
+    return sessions
+
+
+def main():
+    """Reader tool: python event_log.py logs/"""
+    parser = argparse.ArgumentParser(description="Summarize gameplay event logs")
+    parser.add_argument('path', nargs='?', default='logs/events.jsonl',
+                        help="Log file or directory")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    records = 0
+    
+    def counted(events):
+        nonlocal records
+        for record in events:
+            records += 1
+            yield record
+    
+    sessions = summarize_sessions(counted(read_events(args.path)))
+    elapsed = time.perf_counter() - start
+    
+    for session_id, summary in sorted(sessions.items(), key=lambda item: item[1]['start'] or 0):
+        started = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(summary['start']))
+        duration = summary['end'] - summary['start']
+        print(f"Session {session_id}  {started}  {duration:.0f}s")
+        for game, count in sorted(summary['games_started'].items()):
+            best = summary['best_scores'].get(game, '-')
+            overs = summary['game_overs'].get(game, 0)
+            print(f"  {game:<14} started {count:<4} game overs {overs:<4} best score {best}")
+        events = ', '.join(f"{name}={count}" for name, count in sorted(summary['events'].items()))
+        print(f"  events: {events}")
+    
+    print(f"{records} records, {len(sessions)} sessions in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
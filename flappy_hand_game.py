@@ -5,6 +5,8 @@ A Flappy Bird-style game controlled by hand height
 
 import random
 import cv2
+from compositing import blend_rect
+from text_sprites import put_text
 
 
 class Pipe:
@@ -76,14 +78,18 @@ class Pipe:
 class FlappyHandGame:
     """Flappy Bird-style game controlled by hand height"""
     
-    def __init__(self, width=1280, height=720):
+    def __init__(self, width=1280, height=720, event_log=None, rng=None):
         """
         Initialize the game
         
         Args:
             width: Screen width
             height: Screen height
+            event_log: Optional EventLog for gameplay events
+            rng: random.Random stream for this game (unseeded if None)
         """
+        self.event_log = event_log
+        self.rng = rng or random.Random()
         self.width = width
         self.height = height
         self.bird_x = 200
@@ -95,11 +101,10 @@ class FlappyHandGame:
         self.pipe_timer = 0
         self.pipe_interval = 100  # Frames between pipes
         self.hand_target_y = height // 2
-        self.smoothing_factor = 0.3  # Smoothing for bird movement
         
     def spawn_pipe(self):
         """Spawn a new pipe"""
-        gap_y = random.randint(150, self.height - 150)
+        gap_y = self.rng.randint(150, self.height - 150)
         pipe = Pipe(self.width, gap_y)
         self.pipes.append(pipe)
         
@@ -118,12 +123,11 @@ class FlappyHandGame:
         
         points_earned = 0
         
-        # Update bird position based on hand height
+        # Update bird position based on hand height (already filtered by the
+        # launcher's landmark filter; the bird holds still while the hand is lost)
         if hand_y is not None:
             self.hand_target_y = hand_y
-        
-        # Smooth bird movement
-        self.bird_y += (self.hand_target_y - self.bird_y) * self.smoothing_factor
+        self.bird_y = self.hand_target_y
         
         # Check boundaries
         if self.bird_y - self.bird_radius < 0:
@@ -153,6 +157,8 @@ class FlappyHandGame:
                 pipe.passed = True
                 self.score += 1
                 points_earned += 1
+                if self.event_log:
+                    self.event_log.log('pipe_passed', game='flappy_hand', score=self.score)
             
             # Remove off-screen pipes
             if pipe.is_off_screen():
@@ -161,14 +167,15 @@ class FlappyHandGame:
         for pipe in pipes_to_remove:
             self.pipes.remove(pipe)
         
+        if self.game_over and self.event_log:
+            self.event_log.log('game_over', game='flappy_hand', score=self.score)
+        
         return points_earned
     
     def draw(self, frame):
         """Draw game elements on frame"""
         # Draw background gradient
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (self.width, self.height), (100, 200, 255), -1)
-        cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+        blend_rect(frame, (0, 0), (self.width, self.height), (100, 200, 255), 0.3)
         
         # Draw pipes
         for pipe in self.pipes:
@@ -194,29 +201,27 @@ class FlappyHandGame:
         cv2.fillPoly(frame, [np.array(beak_points)], (0, 165, 255))
         
         # Draw score
-        cv2.putText(frame, f"Score: {self.score}", (10, 50),
-                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
+        put_text(frame, f"Score: {self.score}", (10, 50),
+               cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
         
         # Draw instructions
         if not self.game_over:
-            cv2.putText(frame, "Move your hand UP and DOWN to control the bird!",
-                       (10, self.height - 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            put_text(frame, "Move your hand UP and DOWN to control the bird!",
+                   (10, self.height - 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
         # Draw game over
         if self.game_over:
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (self.width//4, self.height//3),
-                         (3*self.width//4, 2*self.height//3), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+            blend_rect(frame, (self.width//4, self.height//3),
+                       (3*self.width//4, 2*self.height//3), (0, 0, 0), 0.7)
             
             game_over_text = "GAME OVER!"
             score_text = f"Final Score: {self.score}"
             
-            cv2.putText(frame, game_over_text, (self.width//4 + 80, self.height//2 - 30),
-                       cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 0, 255), 3)
-            cv2.putText(frame, score_text, (self.width//4 + 120, self.height//2 + 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+            put_text(frame, game_over_text, (self.width//4 + 80, self.height//2 - 30),
+                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 0, 255), 3)
+            put_text(frame, score_text, (self.width//4 + 120, self.height//2 + 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
         
         return frame
     
@@ -1,137 +1,309 @@
 """
 Fruit Slicer Game Module
 A Fruit Ninja-style game controlled by hand gestures
+
+Fruit state lives in a FruitPool: preallocated NumPy arrays (position,
+velocity, type, sliced and alive flags) indexed by slot. Gravity, slice
+tests and off-screen culling run over whole arrays, and freed slots are
+reused by later spawns, so thousands of fruits cost a few array passes
+per frame instead of thousands of Python method calls.
 """
 
 import random
 import time
-import math
 import cv2
+import numpy as np
+from compositing import blend_rect
+from text_sprites import put_text
+
+
+# Fruit colors by type (BGR): apple, orange, banana, kiwi, grape
+FRUIT_COLORS = [
+    (0, 0, 255),    # Red - Apple
+    (0, 165, 255),  # Orange
+    (0, 255, 255),  # Yellow - Banana
+    (0, 255, 0),    # Green - Kiwi
+    (255, 0, 255),  # Purple - Grape
+]
+FRUIT_RADIUS = 30
+
+
+def _make_fruit_sprites():
+    """
+    Pre-render each fruit type (fill and white rim) with its mask
+    
+    Returns:
+        list: (sprite, mask) per fruit type, centered in a square patch
+    """
+    half = FRUIT_RADIUS + 3
+    size = 2 * half + 1
+    sprites = []
+    for color in FRUIT_COLORS:
+        sprite = np.zeros((size, size, 3), dtype=np.uint8)
+        mask = np.zeros((size, size), dtype=np.uint8)
+        for image, fill, rim in ((sprite, color, (255, 255, 255)), (mask, 255, 255)):
+            cv2.circle(image, (half, half), FRUIT_RADIUS, fill, -1)
+            cv2.circle(image, (half, half), FRUIT_RADIUS, rim, 2)
+        sprites.append((sprite, mask))
+    return sprites
+
+
+FRUIT_SPRITES = _make_fruit_sprites()
+FRUIT_SPRITE_HALF = FRUIT_RADIUS + 3
+
+
+def swipe_path(trail, substeps=8):
+    """
+    Interpolate the fingertip's motion over the latest span of its trail
+    
+    A Catmull-Rom curve through the trail samples, so a curved swipe is
+    followed between camera frames instead of being cut straight across.
+    
+    Args:
+        trail: Finger positions, oldest first (at least two)
+        substeps: Segments to split the span into
+    
+    Returns:
+        np.ndarray: (substeps + 1, 2) points from trail[-2] to trail[-1]
+    """
+    p1 = np.asarray(trail[-2], dtype=np.float64)
+    p2 = np.asarray(trail[-1], dtype=np.float64)
+    p0 = np.asarray(trail[-3], dtype=np.float64) if len(trail) > 2 else p1
+    p3 = p2
+    t = np.linspace(0.0, 1.0, substeps + 1)[:, None]
+    return 0.5 * (2 * p1 + (p2 - p0) * t + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t ** 2
+                  + (3 * p1 - p0 - 3 * p2 + p3) * t ** 3)
+
+
+def sweep_slices(x, y, velocity_x, velocity_y, paths, reach):
+    """
+    Test every fruit against every segment of every swipe in one pass
+    
+    Segment k of a path is taken to be swept at time (k + 0.5) / substeps
+    of the frame, and each fruit is tested where it was at that moment (it moved by its
+    velocity this frame), so neither a fast swipe nor a fast fruit skips
+    past the other between camera frames. A fruit is sliced by the
+    earliest segment within reach, ties going to the earlier path.
+    
+    Args:
+        x, y: Fruit positions at the end of the frame, (N,)
+        velocity_x, velocity_y: Fruit velocities this frame, (N,)
+        paths: Swipe paths of this frame, each (substeps + 1, 2) (see swipe_path)
+        reach: Largest blade-to-center distance that slices
+    
+    Returns:
+        tuple: (path index per fruit or -1, (N, 2) slice points on the
+            blade, (N,) blade angles in degrees)
+    """
+    count = len(x)
+    hit_path = np.full(count, -1)
+    points = np.zeros((count, 2))
+    angles = np.zeros(count)
+    if not count or not paths:
+        return hit_path, points, angles
+    
+    # Segments as (substep, path) columns, time-major
+    stacked = np.stack(paths, axis=1)
+    substeps = len(stacked) - 1
+    x1, y1 = stacked[:-1, :, 0].ravel(), stacked[:-1, :, 1].ravel()
+    x2, y2 = stacked[1:, :, 0].ravel(), stacked[1:, :, 1].ravel()
+    path_index = np.tile(np.arange(len(paths)), substeps)
+    rewind = 1.0 - np.repeat((np.arange(substeps) + 0.5) / substeps, len(paths))
+    
+    # Fruit position at each segment's moment, (N, segments)
+    px = x[:, None] - velocity_x[:, None] * rewind
+    py = y[:, None] - velocity_y[:, None] * rewind
+    
+    # Closest point on each segment
+    dx = x2 - x1
+    dy = y2 - y1
+    length_sq = dx * dx + dy * dy
+    t = np.clip(((px - x1) * dx + (py - y1) * dy) / np.where(length_sq > 0, length_sq, 1.0), 0, 1)
+    closest_x = x1 + t * dx
+    closest_y = y1 + t * dy
+    within = (px - closest_x) ** 2 + (py - closest_y) ** 2 < reach * reach
+    
+    sliced = within.any(axis=1)
+    fruit = np.flatnonzero(sliced)
+    first = within[fruit].argmax(axis=1)
+    hit_path[fruit] = path_index[first]
+    points[fruit, 0] = closest_x[fruit, first]
+    points[fruit, 1] = closest_y[fruit, first]
+    angles[fruit] = np.degrees(np.arctan2(dy[first], dx[first]))
+    return hit_path, points, angles
 
 
-class Fruit:
-    """Represents a falling fruit"""
+class FruitPool:
+    """Fruit state as arrays indexed by slot, with slot reuse"""
     
-    def __init__(self, x, y, fruit_type, velocity_y, velocity_x=0):
+    def __init__(self, capacity=64):
         """
-        Initialize a fruit
+        Initialize an empty pool
         
         Args:
-            x: Initial x position
-            y: Initial y position
-            fruit_type: Type of fruit (0-4)
-            velocity_y: Vertical velocity
-            velocity_x: Horizontal velocity
-        """
-        self.x = x
-        self.y = y
-        self.fruit_type = fruit_type
-        self.velocity_y = velocity_y
-        self.velocity_x = velocity_x
-        self.sliced = False
-        self.radius = 30
-        
-        # Fruit colors (BGR)
-        self.colors = [
-            (0, 0, 255),    # Red - Apple
-            (0, 165, 255),  # Orange
-            (0, 255, 255),  # Yellow - Banana
-            (0, 255, 0),    # Green - Kiwi
-            (255, 0, 255),  # Purple - Grape
-        ]
-        
-    def update(self, gravity=0.5):
-        """Update fruit position"""
-        self.velocity_y += gravity
-        self.y += self.velocity_y
-        self.x += self.velocity_x
-        
-    def draw(self, frame):
-        """Draw the fruit on frame"""
-        if not self.sliced:
-            color = self.colors[self.fruit_type]
-            cv2.circle(frame, (int(self.x), int(self.y)), self.radius, color, -1)
-            cv2.circle(frame, (int(self.x), int(self.y)), self.radius, (255, 255, 255), 2)
-        
-    def is_off_screen(self, height):
-        """Check if fruit is off screen"""
-        return self.y > height + 50
+            capacity: Initial number of slots (doubled when full)
+        """
+        self.position = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float64)
+        self.fruit_type = np.zeros(capacity, dtype=np.int8)
+        self.sliced = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Spawn number of each slot (slots are reused, this keeps spawn order)
+        self.serial = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
+        self._free = list(range(capacity - 1, -1, -1))
+        self._next_serial = 0
+    
+    def __len__(self):
+        return self.count
     
-    def check_slice(self, finger_x, finger_y, prev_x, prev_y):
+    @property
+    def capacity(self):
+        """Number of slots"""
+        return len(self.alive)
+    
+    def _grow(self):
+        """Double the number of slots"""
+        capacity = self.capacity
+        for name in ('position', 'velocity', 'fruit_type', 'sliced', 'alive', 'serial'):
+            array = getattr(self, name)
+            grown = np.zeros((capacity * 2,) + array.shape[1:], dtype=array.dtype)
+            grown[:capacity] = array
+            setattr(self, name, grown)
+        self._free.extend(range(capacity * 2 - 1, capacity - 1, -1))
+    
+    def spawn(self, x, y, fruit_type, velocity_x, velocity_y):
         """
-        Check if finger path slices this fruit
+        Put a fruit in a free slot
         
-        Args:
-            finger_x: Current finger x
-            finger_y: Current finger y
-            prev_x: Previous finger x
-            prev_y: Previous finger y
-            
         Returns:
-            bool: True if sliced
+            int: The slot
         """
-        if self.sliced:
-            return False
-        
-        # Calculate distance from line segment to circle
-        distance = self._point_to_segment_distance(
-            self.x, self.y, finger_x, finger_y, prev_x, prev_y
-        )
-        
-        if distance < self.radius + 20:  # 20 pixel tolerance
-            self.sliced = True
-            return True
-        
-        return False
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.position[slot] = (x, y)
+        self.velocity[slot] = (velocity_x, velocity_y)
+        self.fruit_type[slot] = fruit_type
+        self.sliced[slot] = False
+        self.alive[slot] = True
+        self.serial[slot] = self._next_serial
+        self._next_serial += 1
+        self.count += 1
+        return slot
     
-    def _point_to_segment_distance(self, px, py, x1, y1, x2, y2):
-        """Calculate distance from point to line segment"""
-        dx = x2 - x1
-        dy = y2 - y1
-        
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-        
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-        projection_x = x1 + t * dx
-        projection_y = y1 + t * dy
+    def step(self, gravity):
+        """Integrate one frame of motion for every slot (free slots are ignored elsewhere)"""
+        self.velocity[:, 1] += gravity
+        self.position += self.velocity
+    
+    def active(self):
+        """
+        Get the live slots in spawn order
         
-        return math.sqrt((px - projection_x) ** 2 + (py - projection_y) ** 2)
+        Returns:
+            np.ndarray: Slot indices
+        """
+        slots = np.flatnonzero(self.alive)
+        return slots[np.argsort(self.serial[slots], kind='stable')]
+    
+    def remove(self, slots):
+        """Free some slots for reuse"""
+        self.alive[slots] = False
+        self._free.extend(np.asarray(slots).tolist())
+        self.count -= len(slots)
+    
+    def clear(self):
+        """Free every slot"""
+        self.alive[:] = False
+        self.count = 0
+        self._free = list(range(self.capacity - 1, -1, -1))
 
 
 class FruitSlicerGame:
     """Fruit Ninja-style game with hand gestures"""
     
-    def __init__(self, width=1280, height=720):
+    # Finger trail color per player (BGR)
+    TRAIL_COLORS = [(0, 255, 255), (255, 0, 255), (255, 255, 0), (0, 255, 0)]
+    
+    # Fall acceleration (pixels per frame squared) and how close to the
+    # rim a swipe must pass to slice a fruit
+    GRAVITY = 0.5
+    SLICE_TOLERANCE = 20
+    
+    # Interpolated blade segments per frame of swipe, and how many frames
+    # a slash mark stays on screen
+    SWIPE_SUBSTEPS = 8
+    SLASH_FRAMES = 6
+    
+    def __init__(self, width=1280, height=720, event_log=None, rng=None, num_players=1):
         """
         Initialize the game
         
         Args:
             width: Screen width
             height: Screen height
+            event_log: Optional EventLog for gameplay events
+            rng: random.Random stream for this game (unseeded if None)
+            num_players: Players slicing the same fruits (2+ is versus: shared
+                lives, highest score wins)
         """
+        self.event_log = event_log
+        self.rng = rng or random.Random()
         self.width = width
         self.height = height
-        self.fruits = []
-        self.score = 0
+        self.num_players = num_players
+        self.game_name = 'fruit_versus' if num_players > 1 else 'fruit_slicer'
+        self.fruits = FruitPool()
+        self.scores = [0] * num_players
         self.lives = 3
         self.game_over = False
         self.spawn_timer = 0
         self.spawn_interval = 60  # Frames between spawns
-        self.prev_finger_pos = None
-        self.finger_trail = []
+        self.prev_finger_positions = [None] * num_players
+        self.finger_trails = [[] for _ in range(num_players)]
         self.max_trail_length = 10
         
-    def spawn_fruit(self):
-        """Spawn a new fruit"""
-        x = random.randint(100, self.width - 100)
-        y = self.height - 50
-        fruit_type = random.randint(0, 4)
-        velocity_y = random.uniform(-15, -10)
-        velocity_x = random.uniform(-3, 3)
+        # This frame's slices as (player, (x, y) on the blade, blade angle in
+        # degrees, fruit type), and the slash marks drawn for recent ones
+        self.slices = []
+        self.slashes = []
+        
+    @property
+    def score(self):
+        """Player 1's score (the score in single-player)"""
+        return self.scores[0]
+    
+    @property
+    def finger_trail(self):
+        """Player 1's finger trail"""
+        return self.finger_trails[0]
+    
+    def get_winner(self):
+        """
+        Get the leading player in versus mode
+        
+        Returns:
+            int: Player index with the highest score, or None on a tie
+        """
+        best = max(self.scores)
+        leaders = [player for player, score in enumerate(self.scores) if score == best]
+        return leaders[0] if len(leaders) == 1 else None
+        
+    def spawn_fruit(self, count=1):
+        """
+        Spawn new fruits
         
-        fruit = Fruit(x, y, fruit_type, velocity_y, velocity_x)
-        self.fruits.append(fruit)
+        Args:
+            count: Number of fruits (a whole "storm" can be spawned at once)
+        """
+        for _ in range(count):
+            x = self.rng.randint(100, self.width - 100)
+            y = self.height - 50
+            fruit_type = self.rng.randint(0, 4)
+            velocity_y = self.rng.uniform(-15, -10)
+            velocity_x = self.rng.uniform(-3, 3)
+            self.fruits.spawn(x, y, fruit_type, velocity_x, velocity_y)
     
     def update(self, finger_pos):
         """
@@ -143,16 +315,38 @@ class FruitSlicerGame:
         Returns:
             int: Points earned this frame
         """
-        if self.game_over:
-            return 0
+        return self.update_players([finger_pos])[0]
+    
+    def update_players(self, finger_positions):
+        """
+        Update game state with one finger per player
         
-        points_earned = 0
+        Args:
+            finger_positions: (x, y) finger position or None per player
+            
+        Returns:
+            list: Points earned this frame per player
+        """
+        points_earned = [0] * self.num_players
+        if self.game_over:
+            return points_earned
         
-        # Update finger trail
-        if finger_pos:
-            self.finger_trail.append(finger_pos)
-            if len(self.finger_trail) > self.max_trail_length:
-                self.finger_trail.pop(0)
+        # Update finger trails; a finger seen last frame too swipes along
+        # the interpolated latest span of its trail
+        slicers = []
+        paths = []
+        for player, finger_pos in enumerate(finger_positions):
+            if finger_pos:
+                trail = self.finger_trails[player]
+                trail.append(finger_pos)
+                if len(trail) > self.max_trail_length:
+                    trail.pop(0)
+                if self.prev_finger_positions[player]:
+                    slicers.append(player)
+                    paths.append(swipe_path(trail, self.SWIPE_SUBSTEPS))
+            else:
+                # A lost finger starts a fresh trail, not a swipe from where it vanished
+                self.finger_trails[player].clear()
         
         # Spawn fruits
         self.spawn_timer += 1
@@ -162,49 +356,112 @@ class FruitSlicerGame:
             # Increase difficulty over time
             self.spawn_interval = max(30, self.spawn_interval - 1)
         
-        # Update fruits
-        fruits_to_remove = []
-        for fruit in self.fruits:
-            fruit.update()
-            
-            # Check if sliced
-            if finger_pos and self.prev_finger_pos and not fruit.sliced:
-                if fruit.check_slice(finger_pos[0], finger_pos[1],
-                                    self.prev_finger_pos[0], self.prev_finger_pos[1]):
-                    self.score += 10
-                    points_earned += 10
-            
-            # Check if off screen
-            if fruit.is_off_screen(self.height):
-                if not fruit.sliced:
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.game_over = True
-                fruits_to_remove.append(fruit)
+        # Move every fruit at once, then test the live ones in spawn order
+        fruits = self.fruits
+        fruits.step(self.GRAVITY)
+        slots = fruits.active()
+        x = fruits.position[slots, 0]
+        y = fruits.position[slots, 1]
+        
+        # Swept slicing: every unsliced fruit against every blade segment
+        candidates = np.flatnonzero(~fruits.sliced[slots])
+        hit_path, hit_points, hit_angles = sweep_slices(
+            x[candidates], y[candidates], fruits.velocity[slots[candidates], 0],
+            fruits.velocity[slots[candidates], 1], paths, FRUIT_RADIUS + self.SLICE_TOLERANCE)
+        sliced_by = np.full(len(slots), -1)
+        slice_points = np.zeros((len(slots), 2))
+        slice_angles = np.zeros(len(slots))
+        hit = hit_path >= 0
+        sliced_by[candidates[hit]] = np.asarray(slicers, dtype=int)[hit_path[hit]]
+        slice_points[candidates[hit]] = hit_points[hit]
+        slice_angles[candidates[hit]] = hit_angles[hit]
+        fruits.sliced[slots[sliced_by >= 0]] = True
+        
+        # Age the slash marks
+        self.slices = []
+        self.slashes = [(point, angle, frames - 1) for point, angle, frames in self.slashes
+                        if frames > 1]
         
-        # Remove off-screen fruits
-        for fruit in fruits_to_remove:
-            self.fruits.remove(fruit)
+        # Fruits that fell off the bottom (a miss unless sliced)
+        off_screen = y > self.height + 50
+        missed = off_screen & ~fruits.sliced[slots]
         
-        self.prev_finger_pos = finger_pos
+        # Scores, lives and events per fruit, in spawn order
+        for i in np.flatnonzero((sliced_by >= 0) | missed).tolist():
+            player = int(sliced_by[i])
+            if player >= 0:
+                self.scores[player] += 10
+                points_earned[player] += 10
+                point = (int(slice_points[i, 0]), int(slice_points[i, 1]))
+                angle = float(slice_angles[i])
+                fruit_type = int(fruits.fruit_type[slots[i]])
+                self.slices.append((player, point, angle, fruit_type))
+                self.slashes.append((point, angle, self.SLASH_FRAMES))
+                if self.event_log:
+                    self.event_log.log('fruit_sliced', game=self.game_name, player=player,
+                                       fruit_type=fruit_type, x=int(x[i]), y=int(y[i]),
+                                       angle=round(angle, 1), score=self.scores[player])
+            if missed[i]:
+                self.lives -= 1
+                if self.event_log:
+                    self.event_log.log('fruit_missed', game=self.game_name,
+                                       lives=self.lives)
+                if self.lives <= 0 and not self.game_over:
+                    self.game_over = True
+                    if self.event_log:
+                        versus = {'scores': self.scores} if self.num_players > 1 else {}
+                        self.event_log.log('game_over', game=self.game_name,
+                                           score=self.score, **versus)
+        
+        # Free off-screen slots for reuse
+        fruits.remove(slots[off_screen])
+        
+        for player, finger_pos in enumerate(finger_positions):
+            self.prev_finger_positions[player] = finger_pos
         
         return points_earned
     
     def draw(self, frame):
         """Draw game elements on frame"""
-        # Draw fruits
-        for fruit in self.fruits:
-            fruit.draw(frame)
+        # Draw unsliced fruits in spawn order: stamp the pre-rendered sprite,
+        # or draw the circles where the sprite would cross the frame edge
+        fruits = self.fruits
+        slots = fruits.active()
+        slots = slots[~fruits.sliced[slots]]
+        half = FRUIT_SPRITE_HALF
+        frame_height, frame_width = frame.shape[:2]
+        for (x, y), fruit_type in zip(fruits.position[slots].astype(int).tolist(),
+                                      fruits.fruit_type[slots].tolist()):
+            if half <= x < frame_width - half and half <= y < frame_height - half:
+                sprite, mask = FRUIT_SPRITES[fruit_type]
+                cv2.copyTo(sprite, mask, frame[y - half:y + half + 1, x - half:x + half + 1])
+            else:
+                cv2.circle(frame, (x, y), FRUIT_RADIUS, FRUIT_COLORS[fruit_type], -1)
+                cv2.circle(frame, (x, y), FRUIT_RADIUS, (255, 255, 255), 2)
         
-        # Draw finger trail
-        if len(self.finger_trail) > 1:
-            for i in range(1, len(self.finger_trail)):
-                thickness = int(5 * (i / len(self.finger_trail)))
-                cv2.line(frame, self.finger_trail[i-1], self.finger_trail[i],
-                        (0, 255, 255), max(1, thickness))
+        # Draw slash marks across recently sliced fruits, thinning out
+        length = FRUIT_RADIUS + self.SLICE_TOLERANCE
+        for (x, y), angle, frames in self.slashes:
+            dx = int(length * np.cos(np.radians(angle)))
+            dy = int(length * np.sin(np.radians(angle)))
+            cv2.line(frame, (x - dx, y - dy), (x + dx, y + dy), (255, 255, 255),
+                     max(1, 6 * frames // self.SLASH_FRAMES))
+        
+        # Draw finger trails
+        for player, trail in enumerate(self.finger_trails):
+            color = self.TRAIL_COLORS[player % len(self.TRAIL_COLORS)]
+            for i in range(1, len(trail)):
+                thickness = int(5 * (i / len(trail)))
+                cv2.line(frame, trail[i-1], trail[i], color, max(1, thickness))
         
         # Draw score
-        cv2.putText(frame, f"Score: {self.score}", (10, 30),
+        if self.num_players == 1:
+            put_text(frame, f"Score: {self.score}", (10, 30),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        else:
+            score_text = "  ".join(f"P{player + 1}: {score}"
+                                   for player, score in enumerate(self.scores))
+            put_text(frame, score_text, (10, 30),
                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
         
         # Draw lives
@@ -213,33 +470,37 @@ class FruitSlicerGame:
         
         # Draw instructions
         if not self.game_over:
-            cv2.putText(frame, "Slice the fruits! Don't let them fall!", (10, self.height - 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            put_text(frame, "Slice the fruits! Don't let them fall!", (10, self.height - 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
         # Draw game over
         if self.game_over:
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (self.width//4, self.height//3),
-                         (3*self.width//4, 2*self.height//3), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+            blend_rect(frame, (self.width//4, self.height//3),
+                       (3*self.width//4, 2*self.height//3), (0, 0, 0), 0.7)
             
             game_over_text = "GAME OVER!"
             score_text = f"Final Score: {self.score}"
+            if self.num_players > 1:
+                winner = self.get_winner()
+                game_over_text = "DRAW!" if winner is None else f"PLAYER {winner + 1} WINS!"
+                score_text = " - ".join(str(score) for score in self.scores)
             
-            cv2.putText(frame, game_over_text, (self.width//4 + 80, self.height//2 - 30),
-                       cv2.FONT_HERSHEY_BOLD, 1.5, (0, 0, 255), 3)
-            cv2.putText(frame, score_text, (self.width//4 + 120, self.height//2 + 20),
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+            put_text(frame, game_over_text, (self.width//4 + 80, self.height//2 - 30),
+                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 0, 255), 3)
+            put_text(frame, score_text, (self.width//4 + 120, self.height//2 + 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
         
         return frame
     
     def reset(self):
         """Reset the game"""
-        self.fruits = []
-        self.score = 0
+        self.fruits.clear()
+        self.scores = [0] * self.num_players
         self.lives = 3
         self.game_over = False
         self.spawn_timer = 0
         self.spawn_interval = 60
-        self.prev_finger_pos = None
-        self.finger_trail = []
+        self.prev_finger_positions = [None] * self.num_players
+        self.finger_trails = [[] for _ in range(self.num_players)]
+        self.slices = []
+        self.slashes = []
@@ -5,6 +5,7 @@ Manages game settings, difficulty levels, and high scores
 
 import json
 import os
+import time
 from enum import Enum
 
 
@@ -39,14 +40,16 @@ class GameConfig:
         }
     }
     
-    def __init__(self, config_file='game_data.json'):
+    def __init__(self, config_file='game_data.json', save_observer=None):
         """
         Initialize game configuration
         
         Args:
             config_file: Path to configuration file
+            save_observer: Optional function called with each save duration in seconds
         """
         self.config_file = config_file
+        self.save_observer = save_observer
         self.difficulty = Difficulty.MEDIUM
         self.sound_enabled = True
         self.high_scores = {}
@@ -80,6 +83,7 @@ class GameConfig:
     
     def save_config(self):
         """Save configuration to file"""
+        start = time.perf_counter()
         try:
             data = {
                 'difficulty': self.difficulty.value,
@@ -92,6 +96,9 @@ class GameConfig:
                 
         except Exception as e:
             print(f"Error saving config: {e}")
+        
+        if self.save_observer:
+            self.save_observer(time.perf_counter() - start)
     
     def reset_to_defaults(self):
         """Reset configuration to default values"""
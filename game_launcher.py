@@ -3,11 +3,17 @@ Game Launcher Module
 Main entry point that allows selecting and switching between different games
 """
 
+import argparse
+import random
+import time
 import cv2
 import numpy as np
 from hand_tracker import HandTracker
-from gesture_recognizer import GestureRecognizer
-from snake_game import SnakeGame
+from gesture_recognizer import GestureRecognizer, MotionGestureDetector
+from gesture_events import GestureEventBus
+from gesture_classifier import GestureClassifier, landmarks_to_points
+from landmark_filter import LandmarkFilter
+from snake_game import SnakeGame, SnakeVersusGame
 from fruit_slicer_game import FruitSlicerGame
 from flappy_hand_game import FlappyHandGame
 from rock_paper_scissors_game import RockPaperScissorsGame
@@ -15,6 +21,14 @@ from air_drawing_game import AirDrawingGame
 from game_config import GameConfig, Difficulty
 from sound_manager import SoundManager
 from game_menu import GameMenu
+from game_recorder import GameRecorder
+from spectator_stream import SpectatorStream
+from remote_landmarks import RemoteHandTracker
+from metrics import GameMetrics
+from event_log import EventLog
+from player_hands import PlayerHands
+from compositing import blend_rect
+from text_sprites import put_text, get_text_size
 
 
 class GameLauncher:
@@ -26,39 +40,171 @@ class GameLauncher:
         'flappy_hand': 'Flappy Hand',
         'rps': 'Rock Paper Scissors',
         'air_drawing': 'Air Drawing',
+        'snake_versus': 'Snake Versus',
+        'fruit_versus': 'Fruit Slicer Versus',
     }
     
-    def __init__(self):
-        """Initialize the game launcher"""
-        # Initialize webcam
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-        
-        # Get actual dimensions
-        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        
-        # Initialize hand tracker
-        self.hand_tracker = HandTracker(
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+    # Snake colors per player (head, body; BGR)
+    PLAYER_COLORS = [((0, 255, 0), (0, 200, 0)), ((255, 160, 0), (200, 120, 0))]
+    
+    # Tracker profile per screen (HandTracker.PROFILES: model, confidences,
+    # max hands, inference scale and landmark drawing style)
+    TRACKER_PROFILES = {
+        'menu': 'full',
+        'snake': 'fingertip',
+        'fruit_slicer': 'fast',
+        'flappy_hand': 'fast',
+        'rps': 'full',
+        'air_drawing': 'pointer',
+        'snake_versus': 'two_hands',
+        'fruit_versus': 'two_hands',
+    }
+    
+    # Landmark filter per game (LandmarkFilter.PRESETS; raw landmarks if absent)
+    LANDMARK_FILTERS = {
+        'snake': 'steady',
+        'fruit_slicer': 'responsive',
+        'flappy_hand': 'smooth',
+        'air_drawing': 'steady',
+    }
+    
+    def __init__(self, spectator_host='127.0.0.1', spectator_port=None, remote_landmarks=None,
+                 capture=None, hand_tracker=None, config_file='game_data.json',
+                 metrics_host='127.0.0.1', metrics_port=None,
+                 event_log_path='logs/events.jsonl', seed=None,
+                 gesture_model=None, gesture_data=None,
+                 drawing_session_path='drawings/session/autosave.jsonl'):
+        """
+        Initialize the game launcher
+        
+        Args:
+            spectator_host: Interface for the spectator stream
+            spectator_port: Port for the MJPEG spectator stream (None disables it)
+            remote_landmarks: Address to receive landmarks on instead of tracking
+                locally, e.g. 'udp:0.0.0.0:5005' (None tracks locally)
+            capture: Frame source with read()/get()/release() (webcam 0 if None)
+            hand_tracker: Tracker with the HandTracker interface (created if None)
+            config_file: Settings and high score file
+            metrics_host: Interface for the Prometheus metrics endpoint
+            metrics_port: Port for /metrics (None keeps metrics in-process only)
+            event_log_path: Gameplay event log file (None disables event logging)
+            seed: Session seed for all game RNG streams (random if None)
+            gesture_model: Trained GestureClassifier file (finger-state rules if None)
+            gesture_data: Gesture recordings; the model is retrained into
+                gesture_model when they change
+            drawing_session_path: Air Drawing autosave journal (None disables autosave)
+        """
+        # Initialize webcam (or use the given frame source)
+        if capture is None:
+            capture = cv2.VideoCapture(0)
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        self.cap = capture
         
-        # Initialize gesture recognizer
-        self.gesture_recognizer = GestureRecognizer()
+        # Get actual dimensions (fall back to 720p when no camera is attached)
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 1280
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 720
+        
+        # Initialize hand tracker (local MediaPipe, or landmarks from a remote sender)
+        self.remote_landmarks = remote_landmarks
+        self.trackers = None
+        if hand_tracker is not None:
+            self.hand_tracker = hand_tracker
+        elif remote_landmarks:
+            self.hand_tracker = RemoteHandTracker(remote_landmarks)
+            print("Remote landmarks: tracking settings come from the sender's profile "
+                  "(remote_landmarks.py --profile); games only set the drawing style")
+        else:
+            # One tracker per profile, built up front so switching games does
+            # not stall on graph construction; profiles differing only in
+            # drawing style share a tracker
+            self.trackers = {}
+            built = {}
+            for name in sorted(set(self.TRACKER_PROFILES.values())):
+                key = HandTracker.graph_key(name)
+                if key not in built:
+                    built[key] = HandTracker.from_profile(name)
+                self.trackers[name] = built[key]
+            self.hand_tracker = self.trackers[self.TRACKER_PROFILES['menu']]
+        self.tracker_profile = None
+        self.use_tracker_profile('menu')
+        
+        # Initialize gesture recognizer (learned classifier if a model is given)
+        classifier = None
+        if gesture_data:
+            classifier = GestureClassifier.from_dataset(
+                gesture_data, gesture_model or 'models/gesture_classifier.npz')
+        elif gesture_model:
+            classifier = GestureClassifier.load(gesture_model)
+        self.gesture_recognizer = GestureRecognizer(classifier)
+        
+        # Gesture stage: classify once per frame, each consumer debounces on its own
+        self.gesture_bus = GestureEventBus(self.gesture_recognizer)
+        self.navigation_gestures = self.gesture_bus.subscribe(MotionGestureDetector.MOTION_GESTURES)
+        # A throw counts once the pose has been steady briefly
+        self.rps_gestures = self.gesture_bus.subscribe(
+            ('fist', 'open_palm', 'peace'), press_delay=0.15, release_delay=0.2)
+        # Pen stays down through a few misclassified frames
+        self.drawing_gestures = self.gesture_bus.subscribe(
+            ('point',), press_delay=0.05, release_delay=0.15)
+        # Open hand grabs the drawing canvas to pan/zoom it
+        self.pan_gestures = self.gesture_bus.subscribe(
+            ('open_palm',), press_delay=0.1, release_delay=0.15)
+        
+        # Air Drawing autosave journal (recovered when Air Drawing starts)
+        self.drawing_session_path = drawing_session_path
+        
+        # Hands assigned to players in versus games
+        self.player_hands = PlayerHands(num_players=2)
+        
+        # Landmark filter of the current game, capture time of the current
+        # frame and smoothed capture-to-output latency (prediction horizon)
+        self.landmark_filter = None
+        self.frame_time = None
+        self.latency = 0.0
         
         # Initialize config and sound
-        self.config = GameConfig()
+        self.config = GameConfig(config_file)
         self.sound_manager = SoundManager(self.config.sound_enabled)
         
         # Initialize menu
         self.menu = GameMenu(self.config)
         
+        # Session seed: every game started in this session draws from a stream
+        # derived from it, so the same seed and input reproduce the same run
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.games_started = 0
+        print(f"Session seed: {self.seed}")
+        
+        # Gameplay recorder (V: toggle recording, S: screenshot)
+        self.recorder = GameRecorder(width=self.width, height=self.height)
+        self.recorder.metadata['seed'] = self.seed
+        self._indicator_patch = None
+        
+        # Metrics (collected always, served only when a port is given)
+        self.metrics = GameMetrics(
+            list(self.GAMES.keys()),
+            dropped_frames_callback=lambda: self.recorder.total_dropped_frames
+        )
+        self.config.save_observer = self.metrics.config_save_seconds.observe
+        if metrics_port is not None:
+            self.metrics.start_server(metrics_host, metrics_port)
+        
+        # Optional MJPEG spectator stream
+        self.spectator = None
+        if spectator_port is not None:
+            self.spectator = SpectatorStream(host=spectator_host, port=spectator_port)
+        
+        # Gameplay event log
+        self.event_log = EventLog(event_log_path) if event_log_path else None
+        if self.event_log:
+            self.event_log.log('session_start', width=self.width, height=self.height,
+                               difficulty=self.config.difficulty.value, seed=self.seed)
+        
         # Game state
         self.current_game = None
         self.game_instance = None
+        self.was_game_over = False
         self.show_game_select = True
         self.selected_game_index = 0
         self.in_menu = False
@@ -73,29 +219,27 @@ class GameLauncher:
         
     def show_game_selection(self, frame):
         """Draw game selection menu"""
-        overlay = frame.copy()
-        
         # Semi-transparent background
-        cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        blend_rect(frame, (0, 0), (self.width, self.height), (0, 0, 0), 0.7)
         
         # Title
         title = "GESTURE GAME COLLECTION"
-        title_size = cv2.getTextSize(title, cv2.FONT_HERSHEY_DUPLEX, 2, 3)[0]
+        title_size = get_text_size(title, cv2.FONT_HERSHEY_DUPLEX, 2, 3)[0]
         title_x = (self.width - title_size[0]) // 2
-        cv2.putText(frame, title, (title_x, 100),
-                    cv2.FONT_HERSHEY_DUPLEX, 2, (0, 255, 255), 3)
+        put_text(frame, title, (title_x, 100),
+                cv2.FONT_HERSHEY_DUPLEX, 2, (0, 255, 255), 3)
         
         # Subtitle
         subtitle = "Select a game to play"
-        subtitle_size = cv2.getTextSize(subtitle, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
+        subtitle_size = get_text_size(subtitle, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
         subtitle_x = (self.width - subtitle_size[0]) // 2
-        cv2.putText(frame, subtitle, (subtitle_x, 160),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        put_text(frame, subtitle, (subtitle_x, 160),
+               cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
         
         # Game list
         game_keys = list(self.GAMES.keys())
-        y_start = 250
+        y_start = 220
+        spacing = 44
         
         for i, game_key in enumerate(game_keys):
             game_name = self.GAMES[game_key]
@@ -103,8 +247,8 @@ class GameLauncher:
             prefix = "> " if i == self.selected_game_index else "  "
             
             text = f"{prefix}{i + 1}. {game_name}"
-            cv2.putText(frame, text, (self.width // 4, y_start + i * 80),
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.2, color, 2)
+            put_text(frame, text, (self.width // 4, y_start + i * spacing),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
             
             # Description
             descriptions = {
@@ -113,31 +257,83 @@ class GameLauncher:
                 'flappy_hand': 'Avoid pipes - Move hand up/down',
                 'rps': 'Play against computer - Show hand gestures',
                 'air_drawing': 'Draw in the air - Use your finger as brush',
+                'snake_versus': 'Two players, two hands - Each steers a snake',
+                'fruit_versus': 'Two players, two hands - Out-slice each other',
             }
             desc = descriptions.get(game_key, '')
-            cv2.putText(frame, desc, (self.width // 4 + 40, y_start + i * 80 + 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (150, 150, 150), 1)
+            put_text(frame, desc, (self.width // 4 + 40, y_start + i * spacing + 20),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
         
         # Instructions
         instructions = [
-            "Use NUMBER keys (1-5) to select a game",
-            "Press ENTER to start selected game",
+            "Use NUMBER keys (1-7) or swipe up/down to select a game",
+            "Press ENTER or flick a finger to start selected game",
             "Press ESC to show this menu during gameplay",
+            "Press V to record video | S for a screenshot",
             "Press Q to quit"
         ]
         
-        y_inst = self.height - 150
+        y_inst = self.height - 180
         for instruction in instructions:
-            cv2.putText(frame, instruction, (50, y_inst),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
+            put_text(frame, instruction, (50, y_inst),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
             y_inst += 30
         
         return frame
     
+    def create_rng(self, game_key):
+        """
+        Create the RNG stream for the next game started in this session
+        
+        Args:
+            game_key: Game being started
+        
+        Returns:
+            random.Random: Stream seeded from the session seed, game and start count
+        """
+        self.games_started += 1
+        return random.Random(f"{self.seed}:{game_key}:{self.games_started}")
+    
+    def use_tracker_profile(self, screen):
+        """
+        Switch hand tracking to the profile of a screen
+        
+        Local tracking swaps to the pre-built tracker of the profile, and a
+        given tracker with a use_profile method (the arcade host's pooled
+        one) is told the profile. A remote tracker keeps the sender's
+        settings (remote_landmarks.py --profile) and only takes the drawing
+        style.
+        
+        Args:
+            screen: Game key or 'menu'
+        """
+        name = self.TRACKER_PROFILES.get(screen, 'full')
+        if self.trackers:
+            self.hand_tracker = self.trackers[name]
+        elif hasattr(self.hand_tracker, 'use_profile'):
+            self.hand_tracker.use_profile(name)
+        self.hand_tracker.set_landmark_style(HandTracker.PROFILES[name]['landmark_style'])
+        self.tracker_profile = name
+    
     def start_game(self, game_key):
         """Start a specific game"""
+        rng = self.create_rng(game_key)
+        self.close_game()
         self.current_game = game_key
         self.show_game_select = False
+        self.was_game_over = False
+        self.metrics.game_starts.labels(game_key).inc()
+        self.use_tracker_profile(game_key)
+        if self.event_log:
+            self.event_log.log('game_start', game=game_key, start_index=self.games_started)
+        self.recorder.metadata.update(game=game_key, start_index=self.games_started)
+        # Gestures made before the game started must not act in it
+        self.rps_gestures.reset()
+        self.drawing_gestures.reset()
+        self.pan_gestures.reset()
+        self.player_hands.reset()
+        preset = self.LANDMARK_FILTERS.get(game_key)
+        self.landmark_filter = LandmarkFilter.from_preset(preset) if preset else None
         
         if game_key == 'snake':
             # Use difficulty settings from config
@@ -146,16 +342,33 @@ class GameLauncher:
                 grid_width=20, 
                 grid_height=15, 
                 cell_size=30,
-                speed_delay=speed_delay
+                speed_delay=speed_delay,
+                event_log=self.event_log,
+                rng=rng
             )
         elif game_key == 'fruit_slicer':
-            self.game_instance = FruitSlicerGame(self.width, self.height)
+            self.game_instance = FruitSlicerGame(self.width, self.height,
+                                                 event_log=self.event_log, rng=rng)
         elif game_key == 'flappy_hand':
-            self.game_instance = FlappyHandGame(self.width, self.height)
+            self.game_instance = FlappyHandGame(self.width, self.height,
+                                                event_log=self.event_log, rng=rng)
         elif game_key == 'rps':
-            self.game_instance = RockPaperScissorsGame(self.width, self.height)
+            self.game_instance = RockPaperScissorsGame(self.width, self.height,
+                                                       event_log=self.event_log, rng=rng)
         elif game_key == 'air_drawing':
-            self.game_instance = AirDrawingGame(self.width, self.height)
+            self.game_instance = AirDrawingGame(self.width, self.height,
+                                                session_path=self.drawing_session_path)
+        elif game_key == 'snake_versus':
+            speed_delay = self.config.get_difficulty_setting('snake_speed_delay')
+            self.game_instance = SnakeVersusGame(
+                num_players=2,
+                speed_delay=speed_delay,
+                event_log=self.event_log,
+                rng=rng
+            )
+        elif game_key == 'fruit_versus':
+            self.game_instance = FruitSlicerGame(self.width, self.height, event_log=self.event_log,
+                                                 rng=rng, num_players=2)
     
     def run_snake_game(self, frame, results):
         """Run snake game logic"""
@@ -163,7 +376,7 @@ class GameLauncher:
         from main import SnakeVideoGame
         
         # Get finger position
-        finger_pos = self.hand_tracker.get_index_finger_position(frame, results)
+        finger_pos = self.get_finger_position(frame, results)
         
         # Update game
         if finger_pos and not self.game_instance.is_game_over():
@@ -195,84 +408,156 @@ class GameLauncher:
         
         return frame
     
-    def _draw_snake_game(self, frame, finger_pos):
-        """Draw snake game elements on frame"""
-        game_x_offset = 50
-        game_y_offset = 50
-        cell_size = self.game_instance.cell_size
+    def _draw_snake_board(self, frame, game, game_x_offset, game_y_offset, colors=None):
+        """Draw one snake board (grid, food and snake) on frame"""
+        head_color, body_color = colors or self.PLAYER_COLORS[0]
+        cell_size = game.cell_size
         
         # Draw grid
-        grid_width, grid_height = self.game_instance.get_grid_dimensions()
+        grid_width, grid_height = game.get_grid_dimensions()
         cv2.rectangle(frame, (game_x_offset, game_y_offset),
                      (game_x_offset + grid_width, game_y_offset + grid_height),
                      (30, 30, 30), -1)
         
         # Draw grid lines
-        for i in range(self.game_instance.grid_width + 1):
+        for i in range(game.grid_width + 1):
             x = game_x_offset + i * cell_size
             cv2.line(frame, (x, game_y_offset), (x, game_y_offset + grid_height),
                     (50, 50, 50), 1)
-        for i in range(self.game_instance.grid_height + 1):
+        for i in range(game.grid_height + 1):
             y = game_y_offset + i * cell_size
             cv2.line(frame, (game_x_offset, y), (game_x_offset + grid_width, y),
                     (50, 50, 50), 1)
         
         # Draw food
-        food = self.game_instance.get_food_position()
+        food = game.get_food_position()
         food_x = game_x_offset + food[0] * cell_size + cell_size // 2
         food_y = game_y_offset + food[1] * cell_size + cell_size // 2
         cv2.circle(frame, (food_x, food_y), cell_size // 3, (0, 0, 255), -1)
         
         # Draw snake
-        head = self.game_instance.get_snake_head()
+        head = game.get_snake_head()
         if head:
             x = game_x_offset + head[0] * cell_size
             y = game_y_offset + head[1] * cell_size
             cv2.rectangle(frame, (x + 2, y + 2), (x + cell_size - 2, y + cell_size - 2),
-                         (0, 255, 0), -1)
+                         head_color, -1)
         
-        for segment in self.game_instance.get_snake_body():
+        for segment in game.get_snake_body():
             x = game_x_offset + segment[0] * cell_size
             y = game_y_offset + segment[1] * cell_size
             cv2.rectangle(frame, (x + 3, y + 3), (x + cell_size - 3, y + cell_size - 3),
-                         (0, 200, 0), -1)
+                         body_color, -1)
+    
+    def _draw_snake_game(self, frame, finger_pos):
+        """Draw snake game elements on frame"""
+        self._draw_snake_board(frame, self.game_instance, 50, 50)
         
         # Draw UI
         score = self.game_instance.get_score()
         high_score = self.config.get_high_score()
         difficulty = self.config.DIFFICULTY_SETTINGS[self.config.difficulty]['name']
         
-        cv2.putText(frame, f"Score: {score}", (10, 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-        cv2.putText(frame, f"High Score: {high_score}", (10, 70),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-        cv2.putText(frame, f"Difficulty: {difficulty}", (10, 110),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+        put_text(frame, f"Score: {score}", (10, 30),
+               cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        put_text(frame, f"High Score: {high_score}", (10, 70),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+        put_text(frame, f"Difficulty: {difficulty}", (10, 110),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
         
         # Instructions
-        cv2.putText(frame, "R: Restart | M: Menu | ESC: Game Select | Q: Quit",
-                   (10, self.height - 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        put_text(frame, "R: Restart | M: Menu | ESC: Game Select | Q: Quit",
+               (10, self.height - 20),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
         
         # Game over message
         if self.game_instance.is_game_over():
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (self.width//4, self.height//3),
-                         (3*self.width//4, 2*self.height//3), (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+            blend_rect(frame, (self.width//4, self.height//3),
+                       (3*self.width//4, 2*self.height//3), (0, 0, 0), 0.7)
 
-            cv2.putText(frame, "GAME OVER!", (self.width // 4 + 100, self.height // 2 - 20),
-                        cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 0, 255), 3)
-            cv2.putText(frame, f"Score: {score}", (self.width//4 + 150, self.height//2 + 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+            put_text(frame, "GAME OVER!", (self.width // 4 + 100, self.height // 2 - 20),
+                    cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 0, 255), 3)
+            put_text(frame, f"Score: {score}", (self.width//4 + 150, self.height//2 + 30),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
     
-    def run_fruit_slicer(self, frame, results):
-        """Run fruit slicer game logic"""
-        # Get finger position
-        finger_pos = self.hand_tracker.get_index_finger_position(frame, results)
+    def _snake_board_offsets(self):
+        """Top-left corner of each versus board (one per half of the screen)"""
+        boards = self.game_instance.boards
+        board_width, board_height = boards[0].get_grid_dimensions()
+        share = self.width // len(boards)
+        y = (self.height - board_height) // 2
+        return [(i * share + (share - board_width) // 2, y) for i in range(len(boards))]
+    
+    def run_snake_versus(self, frame, results):
+        """Run two-player snake: each player steers the snake on their half"""
+        game = self.game_instance
+        hands = self.player_hands.update(results)
+        finger_positions = [hand.get_index_finger_position(self.width, self.height)
+                            for hand in hands]
         
-        # Update game
-        points = self.game_instance.update(finger_pos)
+        for player, (x_offset, y_offset) in enumerate(self._snake_board_offsets()):
+            finger_pos = finger_positions[player]
+            board = game.boards[player]
+            if not finger_pos or board.is_game_over():
+                continue
+            adjusted_x = finger_pos[0] - x_offset
+            adjusted_y = finger_pos[1] - y_offset
+            grid_width, grid_height = board.get_grid_dimensions()
+            if 0 <= adjusted_x < grid_width and 0 <= adjusted_y < grid_height:
+                continues, ate_food = game.update_player(player, (adjusted_x, adjusted_y))
+                if ate_food:
+                    self.sound_manager.play_eat_sound()
+                if not continues:
+                    self.sound_manager.play_game_over_sound()
+        
+        self._draw_snake_versus(frame, finger_positions)
+        
+        return frame
+    
+    def _draw_snake_versus(self, frame, finger_positions):
+        """Draw both snake boards, scores and player cursors on frame"""
+        game = self.game_instance
+        winner = game.get_winner()
+        
+        for player, (x_offset, y_offset) in enumerate(self._snake_board_offsets()):
+            board = game.boards[player]
+            colors = self.PLAYER_COLORS[player % len(self.PLAYER_COLORS)]
+            self._draw_snake_board(frame, board, x_offset, y_offset, colors)
+            put_text(frame, f"P{player + 1}: {board.get_score()}", (x_offset, y_offset - 15),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, colors[0], 2)
+            
+            grid_width, grid_height = board.get_grid_dimensions()
+            if game.game_over:
+                label = "DRAW" if winner is None else ("WINNER" if winner == player else "")
+            else:
+                label = "OUT" if board.is_game_over() else ""
+            if label:
+                label_size = get_text_size(label, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)[0]
+                put_text(frame, label, (x_offset + (grid_width - label_size[0]) // 2,
+                                       y_offset + grid_height // 2),
+                       cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 0, 255), 3)
+            
+            finger_pos = finger_positions[player]
+            if finger_pos:
+                cv2.circle(frame, finger_pos, 10, colors[0], 2)
+        
+        put_text(frame, "R: Restart | ESC: Game Select | Q: Quit",
+               (10, self.height - 20),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+    
+    def run_fruit_slicer(self, frame, results):
+        """Run fruit slicer game logic (one finger per player in versus mode)"""
+        if self.game_instance.num_players > 1:
+            hands = self.player_hands.update(results)
+            points = sum(self.game_instance.update_players([
+                hand.get_index_finger_position(self.width, self.height) for hand in hands
+            ]))
+        else:
+            # Get finger position
+            finger_pos = self.get_finger_position(frame, results)
+            
+            # Update game
+            points = self.game_instance.update(finger_pos)
         if points > 0:
             self.sound_manager.play_eat_sound()
         
@@ -283,16 +568,16 @@ class GameLauncher:
         frame = self.game_instance.draw(frame)
         
         # Instructions
-        cv2.putText(frame, "R: Restart | ESC: Game Select | Q: Quit",
-                   (10, 70),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        put_text(frame, "R: Restart | ESC: Game Select | Q: Quit",
+               (10, 70),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
         
         return frame
     
     def run_flappy_hand(self, frame, results):
         """Run flappy hand game logic"""
-        # Get hand position (use palm center for better control)
-        finger_pos = self.hand_tracker.get_index_finger_position(frame, results)
+        # Get hand position (filtered, so the bird follows without jitter)
+        finger_pos = self.get_finger_position(frame, results)
         hand_y = finger_pos[1] if finger_pos else None
         
         # Update game
@@ -307,19 +592,18 @@ class GameLauncher:
         frame = self.game_instance.draw(frame)
         
         # Instructions
-        cv2.putText(frame, "R: Restart | ESC: Game Select | Q: Quit",
-                   (10, 100),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
+        put_text(frame, "R: Restart | ESC: Game Select | Q: Quit",
+               (10, 100),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
         
         return frame
     
     def run_rock_paper_scissors(self, frame, results):
         """Run rock paper scissors game logic"""
-        # Recognize gesture
-        if results.multi_hand_landmarks:
-            gesture = self.gesture_recognizer.recognize_gesture(results.multi_hand_landmarks[0])
-            if gesture:
-                self.game_instance.detect_gesture(gesture)
+        # Throw on each new pose
+        for event in self.rps_gestures.poll():
+            if event.kind == 'press':
+                self.game_instance.detect_gesture(event.gesture, event.confidence)
         
         # Update game
         self.game_instance.update()
@@ -332,135 +616,402 @@ class GameLauncher:
     def run_air_drawing(self, frame, results):
         """Run air drawing game logic"""
         # Get finger position
-        finger_pos = self.hand_tracker.get_index_finger_position(frame, results)
+        finger_pos = self.get_finger_position(frame, results)
         
-        # Check if drawing (all fingers extended means not drawing)
-        is_drawing = False
-        if results.multi_hand_landmarks:
-            gesture = self.gesture_recognizer.recognize_gesture(results.multi_hand_landmarks[0])
-            # Draw only when pointing (index finger up)
-            is_drawing = (gesture == 'point')
-        
-        # Update drawing
-        self.game_instance.update(finger_pos, is_drawing)
+        # Open palm pans/zooms the canvas; otherwise draw only while pointing
+        palm = self.get_palm(results) if self.pan_gestures.is_held('open_palm') else None
+        if palm:
+            self.game_instance.pan_zoom(*palm)
+        else:
+            self.game_instance.end_pan_zoom()
+            is_drawing = self.drawing_gestures.is_held('point')
+            
+            # Update drawing
+            self.game_instance.update(finger_pos, is_drawing)
         
         # Draw UI
         frame = self.game_instance.draw_ui(frame)
         
         return frame
     
+    def get_finger_position(self, frame, results):
+        """
+        Get the index finger tip for the current game
+        
+        Args:
+            frame: Current frame
+            results: Hand tracking results
+        
+        Returns:
+            tuple: (x, y) from the game's landmark filter if it has one, else raw
+        """
+        if self.landmark_filter:
+            return self.landmark_filter.get_index_finger_position(self.width, self.height)
+        return self.hand_tracker.get_index_finger_position(frame, results)
+    
+    def get_palm(self, results):
+        """
+        Get the palm center and apparent palm width of the first hand
+        
+        Args:
+            results: Hand tracking results
+        
+        Returns:
+            tuple: ((x, y), width) in pixels, or None without a hand
+        """
+        points = self.landmark_filter.points if self.landmark_filter else None
+        if points is None:
+            if not results.multi_hand_landmarks:
+                return None
+            points = landmarks_to_points(results.multi_hand_landmarks[0])
+        scale = np.array([self.width, self.height], dtype=np.float32)
+        center = points[9, :2] * scale
+        width = float(np.linalg.norm((points[5, :2] - points[17, :2]) * scale))
+        return (int(center[0]), int(center[1])), width
+    
+    def read_frame(self):
+        """
+        Read and mirror the next frame from the frame source
+        
+        Returns:
+            frame: BGR frame, or None if the source has no more frames
+        """
+        success, frame = self.cap.read()
+        self.frame_time = time.perf_counter()
+        if success:
+            # Flip frame horizontally for mirror effect
+            return cv2.flip(frame, 1)
+        if self.remote_landmarks:
+            # Remote tracking does not need a local camera
+            return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        return None
+    
+    def process_frame(self, frame):
+        """
+        Track hands, update and draw the active screen for one frame
+        
+        Args:
+            frame: Mirrored camera frame
+            
+        Returns:
+            frame: Composited frame to display
+        """
+        metrics = self.metrics
+        stage_start = time.perf_counter()
+        
+        # Find hands in the frame
+        frame, results = self.hand_tracker.find_hands(frame, draw=True)
+        metrics.tracker_frames.inc()
+        if results.multi_hand_landmarks:
+            metrics.tracker_detections.inc()
+        
+        now = time.perf_counter()
+        metrics.tracking_stage.observe(now - stage_start)
+        stage_start = now
+        
+        # Gesture stage: pose and motion gestures for every consumer
+        hand = None
+        if results.multi_hand_landmarks:
+            hand = results.multi_hand_landmarks[0]
+            metrics.gesture_attempts.inc()
+        if self.gesture_bus.process(hand, self.hand_tracker.get_handedness(results)):
+            metrics.gesture_recognitions.inc()
+        
+        # Filtered landmarks, predicted ahead by the measured latency
+        frame_time = self.frame_time if self.frame_time is not None else stage_start
+        if self.landmark_filter:
+            points = landmarks_to_points(hand) if hand else None
+            self.landmark_filter.update(points, frame_time, self.latency)
+        for event in self.navigation_gestures.poll():
+            if event.kind == 'press':
+                self.handle_motion_gesture(event.gesture)
+        
+        # Show game selection menu
+        if self.show_game_select:
+            frame = self.show_game_selection(frame)
+        elif self.in_menu:
+            # Show game menu
+            frame = self.menu.show_main_menu(frame)
+        else:
+            # Run current game
+            if self.current_game == 'snake':
+                frame = self.run_snake_game(frame, results)
+            elif self.current_game in ('fruit_slicer', 'fruit_versus'):
+                frame = self.run_fruit_slicer(frame, results)
+            elif self.current_game == 'flappy_hand':
+                frame = self.run_flappy_hand(frame, results)
+            elif self.current_game == 'rps':
+                frame = self.run_rock_paper_scissors(frame, results)
+            elif self.current_game == 'air_drawing':
+                frame = self.run_air_drawing(frame, results)
+            elif self.current_game == 'snake_versus':
+                frame = self.run_snake_versus(frame, results)
+            
+            # Count each game over once
+            is_game_over = bool(getattr(self.game_instance, 'game_over', False))
+            if is_game_over and not self.was_game_over:
+                metrics.game_overs.labels(self.current_game).inc()
+            self.was_game_over = is_game_over
+        
+        now = time.perf_counter()
+        metrics.game_stage.observe(now - stage_start)
+        
+        # Record the composited frame, then mark it on screen only
+        self.recorder.capture(frame)
+        if self.spectator:
+            self.spectator.publish(frame)
+        self._indicator_patch = None
+        if self.recorder.recording:
+            # Keep the pixels under the dot so screenshots can leave it out
+            self._indicator_patch = frame[-41:-19, -41:-19].copy()
+            cv2.circle(frame, (self.width - 30, self.height - 30), 10, (0, 0, 255), -1)
+        done = time.perf_counter()
+        metrics.output_stage.observe(done - now)
+        self.latency += 0.1 * ((done - frame_time) - self.latency)
+        
+        return frame
+    
+    def save_screenshot(self, frame):
+        """
+        Save a screenshot of the displayed frame without the recording indicator
+        
+        Args:
+            frame: Frame returned by process_frame
+        
+        Returns:
+            str: Path the screenshot will be written to
+        """
+        if self._indicator_patch is not None and frame.shape[:2] == (self.height, self.width):
+            frame = frame.copy()
+            frame[-41:-19, -41:-19] = self._indicator_patch
+        return self.recorder.save_screenshot(frame)
+    
+    def handle_motion_gesture(self, gesture):
+        """
+        Navigate with motion gestures
+        
+        Args:
+            gesture: Motion gesture name from the gesture bus
+        """
+        if self.show_game_select:
+            game_keys = list(self.GAMES.keys())
+            if gesture == 'swipe_up':
+                self.selected_game_index = (self.selected_game_index - 1) % len(game_keys)
+            elif gesture == 'swipe_down':
+                self.selected_game_index = (self.selected_game_index + 1) % len(game_keys)
+            elif gesture == 'flick':
+                self.start_game(game_keys[self.selected_game_index])
+        elif self.in_menu:
+            if gesture == 'swipe_up':
+                self.menu.navigate_up()
+            elif gesture == 'swipe_down':
+                self.menu.navigate_down()
+            elif gesture == 'swipe_left':
+                self.in_menu = False
+        elif self.current_game in ('fruit_slicer', 'fruit_versus') and self.game_instance.game_over:
+            # Swipe in any direction to play again
+            if gesture.startswith('swipe'):
+                self.game_instance.reset()
+    
+    def handle_key(self, key, frame):
+        """
+        Handle one keyboard key
+        
+        Args:
+            key: Key code from cv2.waitKey (masked to 8 bits)
+            frame: Frame currently displayed (for screenshots)
+            
+        Returns:
+            bool: False if the launcher should quit
+        """
+        if key == ord('q') or key == ord('Q'):
+            return False
+        elif key == 27:  # ESC key
+            if self.in_menu:
+                self.in_menu = False
+            else:
+                self.show_game_select = True
+                self.in_menu = False
+                self.use_tracker_profile('menu')
+        elif key == ord('r') or key == ord('R'):
+            if self.game_instance:
+                self.game_instance.reset()
+        elif key == ord('m') or key == ord('M'):
+            if not self.show_game_select:
+                self.in_menu = not self.in_menu
+        elif key == ord('v') or key == ord('V'):
+            self.recorder.toggle_recording()
+        elif key == ord('s') or key == ord('S'):
+            self.save_screenshot(frame)
+        
+        # Game selection with number keys
+        if self.show_game_select:
+            game_keys = list(self.GAMES.keys())
+            if key == ord('1') and len(game_keys) > 0:
+                self.start_game(game_keys[0])
+            elif key == ord('2') and len(game_keys) > 1:
+                self.start_game(game_keys[1])
+            elif key == ord('3') and len(game_keys) > 2:
+                self.start_game(game_keys[2])
+            elif key == ord('4') and len(game_keys) > 3:
+                self.start_game(game_keys[3])
+            elif key == ord('5') and len(game_keys) > 4:
+                self.start_game(game_keys[4])
+            elif key == ord('6') and len(game_keys) > 5:
+                self.start_game(game_keys[5])
+            elif key == ord('7') and len(game_keys) > 6:
+                self.start_game(game_keys[6])
+            elif key == 13:  # Enter key
+                self.start_game(game_keys[self.selected_game_index])
+            elif key == 82 or key == 0:  # Up arrow
+                self.selected_game_index = (self.selected_game_index - 1) % len(game_keys)
+            elif key == 84 or key == 1:  # Down arrow
+                self.selected_game_index = (self.selected_game_index + 1) % len(game_keys)
+        
+        # Game-specific controls
+        if not self.show_game_select and self.current_game == 'air_drawing':
+            if key == ord('c') or key == ord('C'):
+                self.game_instance.next_color()
+            elif key == ord('t') or key == ord('T'):
+                self.game_instance.toggle_tool()
+            elif key == ord('=') or key == ord('+'):
+                self.game_instance.increase_brush_size()
+            elif key == ord('-') or key == ord('_'):
+                self.game_instance.decrease_brush_size()
+            elif key == ord('u') or key == ord('U'):
+                self.game_instance.undo()
+            elif key == ord('y') or key == ord('Y'):
+                self.game_instance.redo()
+            elif key == ord('x') or key == ord('X'):
+                self.game_instance.clear_canvas()
+            elif key == ord('h') or key == ord('H'):
+                self.game_instance.toggle_help()
+            elif key == ord('p') or key == ord('P'):
+                self.game_instance.toggle_palette()
+            elif key == ord('b') or key == ord('B'):
+                self.game_instance.toggle_composite_mode()
+            elif key == ord('['):
+                self.game_instance.zoom_at(1 / 1.25)
+            elif key == ord(']'):
+                self.game_instance.zoom_at(1.25)
+            elif key == ord('o') or key == ord('O'):
+                self.game_instance.reset_view()
+            elif key == ord('l') or key == ord('L'):
+                self.game_instance.next_layer()
+            elif key == ord('k') or key == ord('K'):
+                self.game_instance.toggle_layer_visibility()
+            elif key == ord(','):
+                self.game_instance.change_layer_opacity(-0.1)
+            elif key == ord('.'):
+                self.game_instance.change_layer_opacity(0.1)
+            elif key == ord('e') or key == ord('E'):
+                base = self.game_instance.export()
+                print(f"Exporting drawing to {base}.png")
+        
+        return True
+    
     def run(self):
         """Main game loop"""
         print("Starting Gesture Game Collection...")
         print("Use number keys to select a game, or press Q to quit")
         
+        metrics = self.metrics
         while True:
+            frame_start = time.perf_counter()
+            
             # Read frame from webcam
-            success, frame = self.cap.read()
-            if not success:
+            frame = self.read_frame()
+            if frame is None:
                 print("Failed to read from webcam")
                 break
+            metrics.capture_stage.observe(time.perf_counter() - frame_start)
             
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
-            
-            # Find hands in the frame
-            frame, results = self.hand_tracker.find_hands(frame, draw=True)
-            
-            # Show game selection menu
-            if self.show_game_select:
-                frame = self.show_game_selection(frame)
-            elif self.in_menu:
-                # Show game menu
-                frame = self.menu.show_main_menu(frame)
-            else:
-                # Run current game
-                if self.current_game == 'snake':
-                    frame = self.run_snake_game(frame, results)
-                elif self.current_game == 'fruit_slicer':
-                    frame = self.run_fruit_slicer(frame, results)
-                elif self.current_game == 'flappy_hand':
-                    frame = self.run_flappy_hand(frame, results)
-                elif self.current_game == 'rps':
-                    frame = self.run_rock_paper_scissors(frame, results)
-                elif self.current_game == 'air_drawing':
-                    frame = self.run_air_drawing(frame, results)
+            frame = self.process_frame(frame)
             
             # Display the frame
+            display_start = time.perf_counter()
             cv2.imshow("Gesture Game Collection", frame)
             
             # Handle keyboard input
             key = cv2.waitKey(1) & 0xFF
-            
-            if key == ord('q') or key == ord('Q'):
+            frame_end = time.perf_counter()
+            metrics.display_stage.observe(frame_end - display_start)
+            metrics.frame_seconds.observe(frame_end - frame_start)
+            if not self.handle_key(key, frame):
                 break
-            elif key == 27:  # ESC key
-                if self.in_menu:
-                    self.in_menu = False
-                else:
-                    self.show_game_select = True
-                    self.in_menu = False
-            elif key == ord('r') or key == ord('R'):
-                if self.game_instance:
-                    self.game_instance.reset()
-            elif key == ord('m') or key == ord('M'):
-                if not self.show_game_select:
-                    self.in_menu = not self.in_menu
-            
-            # Game selection with number keys
-            if self.show_game_select:
-                game_keys = list(self.GAMES.keys())
-                if key == ord('1') and len(game_keys) > 0:
-                    self.start_game(game_keys[0])
-                elif key == ord('2') and len(game_keys) > 1:
-                    self.start_game(game_keys[1])
-                elif key == ord('3') and len(game_keys) > 2:
-                    self.start_game(game_keys[2])
-                elif key == ord('4') and len(game_keys) > 3:
-                    self.start_game(game_keys[3])
-                elif key == ord('5') and len(game_keys) > 4:
-                    self.start_game(game_keys[4])
-                elif key == 13:  # Enter key
-                    self.start_game(game_keys[self.selected_game_index])
-                elif key == 82 or key == 0:  # Up arrow
-                    self.selected_game_index = (self.selected_game_index - 1) % len(game_keys)
-                elif key == 84 or key == 1:  # Down arrow
-                    self.selected_game_index = (self.selected_game_index + 1) % len(game_keys)
-            
-            # Game-specific controls
-            if not self.show_game_select and self.current_game == 'air_drawing':
-                if key == ord('c') or key == ord('C'):
-                    self.game_instance.next_color()
-                elif key == ord('t') or key == ord('T'):
-                    self.game_instance.toggle_tool()
-                elif key == ord('=') or key == ord('+'):
-                    self.game_instance.increase_brush_size()
-                elif key == ord('-') or key == ord('_'):
-                    self.game_instance.decrease_brush_size()
-                elif key == ord('u') or key == ord('U'):
-                    self.game_instance.undo()
-                elif key == ord('x') or key == ord('X'):
-                    self.game_instance.clear_canvas()
-                elif key == ord('h') or key == ord('H'):
-                    self.game_instance.toggle_help()
-                elif key == ord('p') or key == ord('P'):
-                    self.game_instance.toggle_palette()
         
         # Cleanup
         self.cleanup()
     
+    def close_game(self):
+        """Let the current game finish background work (Air Drawing autosave)"""
+        if isinstance(self.game_instance, AirDrawingGame):
+            self.game_instance.close()
+            self.game_instance = None
+    
     def cleanup(self):
         """Release resources"""
+        self.close_game()
         self.cap.release()
-        self.hand_tracker.close()
+        if self.trackers:
+            for tracker in {id(tracker): tracker for tracker in self.trackers.values()}.values():
+                tracker.close()
+        else:
+            self.hand_tracker.close()
+        self.recorder.close()
+        if self.spectator:
+            self.spectator.close()
+        self.metrics.close()
+        if self.event_log:
+            self.event_log.log('session_end')
+            self.event_log.close()
         cv2.destroyAllWindows()
         print("Game closed. Thanks for playing!")
 
 
 def main():
     """Entry point"""
+    parser = argparse.ArgumentParser(description="Gesture Game Collection")
+    parser.add_argument('--spectator-port', type=int, default=None,
+                        help="Serve an MJPEG spectator stream on this port")
+    parser.add_argument('--spectator-host', default='127.0.0.1',
+                        help="Interface for the spectator stream (0.0.0.0 for LAN)")
+    parser.add_argument('--remote-landmarks', default=None,
+                        help="Receive landmarks from remote_landmarks.py instead of tracking "
+                             "locally, e.g. udp:0.0.0.0:5005 or unix:/tmp/hands.sock")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Serve Prometheus metrics on this port at /metrics")
+    parser.add_argument('--metrics-host', default='127.0.0.1',
+                        help="Interface for the metrics endpoint")
+    parser.add_argument('--event-log', default='logs/events.jsonl',
+                        help="Gameplay event log file (summarize with event_log.py)")
+    parser.add_argument('--no-event-log', action='store_true',
+                        help="Disable gameplay event logging")
+    parser.add_argument('--drawing-session', default='drawings/session/autosave.jsonl',
+                        help="Air Drawing autosave journal (recovered on the next start)")
+    parser.add_argument('--no-autosave', action='store_true',
+                        help="Disable Air Drawing autosave")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Session seed for reproducible runs (random if omitted)")
+    parser.add_argument('--gesture-model', default=None,
+                        help="Trained gesture classifier (see gesture_classifier.py)")
+    parser.add_argument('--gesture-data', default=None,
+                        help="Gesture recordings to train from (cached in --gesture-model)")
+    args = parser.parse_args()
+    
     try:
-        launcher = GameLauncher()
+        launcher = GameLauncher(
+            spectator_host=args.spectator_host,
+            spectator_port=args.spectator_port,
+            remote_landmarks=args.remote_landmarks,
+            metrics_host=args.metrics_host,
+            metrics_port=args.metrics_port,
+            event_log_path=None if args.no_event_log else args.event_log,
+            seed=args.seed,
+            gesture_model=args.gesture_model,
+            gesture_data=args.gesture_data,
+            drawing_session_path=None if args.no_autosave else args.drawing_session
+        )
         launcher.run()
     except KeyboardInterrupt:
         print("\nGame interrupted by user")
@@ -4,6 +4,8 @@ Provides menu system for game settings and options
 """
 
 import cv2
+from compositing import blend_rect
+from text_sprites import put_text, get_text_size
 from game_config import Difficulty
 
 
@@ -33,19 +35,17 @@ class GameMenu:
         Returns:
             frame: Frame with menu drawn
         """
-        overlay = frame.copy()
         h, w = frame.shape[:2]
         
         # Semi-transparent background
-        cv2.rectangle(overlay, (w//4, h//4), (3*w//4, 3*h//4), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        blend_rect(frame, (w//4, h//4), (3*w//4, 3*h//4), (0, 0, 0), 0.7)
         
         # Menu title
         title = "GAME MENU"
-        title_size = cv2.getTextSize(title, cv2.FONT_HERSHEY_BOLD, 1.5, 3)[0]
+        title_size = get_text_size(title, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)[0]
         title_x = (w - title_size[0]) // 2
-        cv2.putText(frame, title, (title_x, h//4 + 50),
-                   cv2.FONT_HERSHEY_BOLD, 1.5, (255, 255, 255), 3)
+        put_text(frame, title, (title_x, h//4 + 50),
+               cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
         
         # Menu options
         self.menu_items = [
@@ -61,15 +61,15 @@ class GameMenu:
             color = (0, 255, 255) if i == self.selected_index else (200, 200, 200)
             prefix = "> " if i == self.selected_index else "  "
             text = prefix + item
-            cv2.putText(frame, text, (w//4 + 50, y_start + i * 50),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+            put_text(frame, text, (w//4 + 50, y_start + i * 50),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
         
         # Instructions
         instructions = "Use UP/DOWN arrows to navigate | ENTER to select | ESC to close"
-        inst_size = cv2.getTextSize(instructions, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
+        inst_size = get_text_size(instructions, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
         inst_x = (w - inst_size[0]) // 2
-        cv2.putText(frame, instructions, (inst_x, 3*h//4 - 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
+        put_text(frame, instructions, (inst_x, 3*h//4 - 30),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
         
         return frame
     
@@ -83,19 +83,17 @@ class GameMenu:
         Returns:
             frame: Frame with menu drawn
         """
-        overlay = frame.copy()
         h, w = frame.shape[:2]
         
         # Semi-transparent background
-        cv2.rectangle(overlay, (w//4, h//4), (3*w//4, 3*h//4), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        blend_rect(frame, (w//4, h//4), (3*w//4, 3*h//4), (0, 0, 0), 0.7)
         
         # Menu title
         title = "SELECT DIFFICULTY"
-        title_size = cv2.getTextSize(title, cv2.FONT_HERSHEY_BOLD, 1.2, 2)[0]
+        title_size = get_text_size(title, cv2.FONT_HERSHEY_DUPLEX, 1.2, 2)[0]
         title_x = (w - title_size[0]) // 2
-        cv2.putText(frame, title, (title_x, h//4 + 50),
-                   cv2.FONT_HERSHEY_BOLD, 1.2, (255, 255, 255), 2)
+        put_text(frame, title, (title_x, h//4 + 50),
+               cv2.FONT_HERSHEY_DUPLEX, 1.2, (255, 255, 255), 2)
         
         # Difficulty options
         difficulties = [Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD]
@@ -111,13 +109,13 @@ class GameMenu:
             suffix = " (Current)" if is_current else ""
             
             text = f"{prefix}{settings['name']}{suffix}"
-            cv2.putText(frame, text, (w//4 + 50, y_start + i * 80),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
+            put_text(frame, text, (w//4 + 50, y_start + i * 80),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
             
             # Description
             desc = settings['description']
-            cv2.putText(frame, desc, (w//4 + 70, y_start + i * 80 + 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
+            put_text(frame, desc, (w//4 + 70, y_start + i * 80 + 25),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
         
         return frame
     
@@ -131,19 +129,17 @@ class GameMenu:
         Returns:
             frame: Frame with high scores drawn
         """
-        overlay = frame.copy()
         h, w = frame.shape[:2]
         
         # Semi-transparent background
-        cv2.rectangle(overlay, (w//4, h//4), (3*w//4, 3*h//4), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        blend_rect(frame, (w//4, h//4), (3*w//4, 3*h//4), (0, 0, 0), 0.7)
         
         # Title
         title = "HIGH SCORES"
-        title_size = cv2.getTextSize(title, cv2.FONT_HERSHEY_BOLD, 1.5, 3)[0]
+        title_size = get_text_size(title, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)[0]
         title_x = (w - title_size[0]) // 2
-        cv2.putText(frame, title, (title_x, h//4 + 50),
-                   cv2.FONT_HERSHEY_BOLD, 1.5, (255, 255, 0), 3)
+        put_text(frame, title, (title_x, h//4 + 50),
+               cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 0), 3)
         
         # High scores
         y_start = h//4 + 120
@@ -154,15 +150,15 @@ class GameMenu:
             score = self.config.get_high_score(diff)
             
             text = f"{settings['name']}: {score}"
-            cv2.putText(frame, text, (w//4 + 80, y_start + i * 60),
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+            put_text(frame, text, (w//4 + 80, y_start + i * 60),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
         
         # Instructions
         instructions = "Press ESC or ENTER to return"
-        inst_size = cv2.getTextSize(instructions, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0]
+        inst_size = get_text_size(instructions, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0]
         inst_x = (w - inst_size[0]) // 2
-        cv2.putText(frame, instructions, (inst_x, 3*h//4 - 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (150, 150, 150), 1)
+        put_text(frame, instructions, (inst_x, 3*h//4 - 30),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (150, 150, 150), 1)
         
         return frame
     
@@ -0,0 +1,229 @@
+"""
+Game Recorder Module
+Records gameplay video and screenshots on a background thread
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+import cv2
+import numpy as np
+
+
+class GameRecorder:
+    """
+    Asynchronous gameplay recorder with a bounded frame pool
+    
+    Frames are copied into one of `pool_size` preallocated buffers and
+    handed to an encoder thread. Drop policy: when every buffer is still
+    waiting to be encoded, the newest frame is dropped (and counted in
+    `dropped_frames`). Frames already queued are never discarded, so the
+    video stays in order and the game loop never waits on the encoder.
+    
+    Each video gets a JSON sidecar (gameplay_*.json) holding `metadata`,
+    e.g. the session seed needed to reproduce the run.
+    """
+    
+    def __init__(self, output_dir='recordings', width=1280, height=720, fps=30,
+                 codec='mp4v', pool_size=8):
+        """
+        Initialize the recorder
+        
+        Args:
+            output_dir: Directory for videos and screenshots
+            width: Output video width
+            height: Output video height
+            fps: Output video frame rate (capture is paced to this rate)
+            codec: FourCC code for cv2.VideoWriter
+            pool_size: Number of pooled frame buffers (encoder queue bound)
+        """
+        self.output_dir = output_dir
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.codec = codec
+        self.metadata = {}
+        
+        # Frame buffers (allocated on first recording) and the indices currently free
+        self.pool_size = pool_size
+        self._pool = []
+        self._free = queue.Queue()
+        
+        # Work items for the encoder thread
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+        
+        # Recording state (owned by the game loop)
+        self.recording = False
+        self.current_file = None
+        self.frames_written = 0
+        self.dropped_frames = 0
+        self.total_dropped_frames = 0
+        self._frame_interval = 1.0 / fps
+        self._next_capture_time = 0.0
+    
+    def _timestamped_path(self, prefix, extension):
+        """Build an output path such as recordings/gameplay_20240101_120000.mp4"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        return os.path.join(self.output_dir, f"{prefix}_{stamp}.{extension}")
+    
+    def start_recording(self, path=None):
+        """
+        Start recording composited frames
+        
+        Args:
+            path: Output file (timestamped file in output_dir if None)
+        
+        Returns:
+            str: Path of the video file
+        """
+        if self.recording:
+            return self.current_file
+        
+        if not self._pool:
+            self._pool = [np.zeros((self.height, self.width, 3), dtype=np.uint8)
+                          for _ in range(self.pool_size)]
+            for index in range(self.pool_size):
+                self._free.put(index)
+        
+        self.current_file = path or self._timestamped_path('gameplay', 'mp4')
+        self.recording = True
+        self.frames_written = 0
+        self.dropped_frames = 0
+        self._next_capture_time = 0.0
+        metadata = dict(self.metadata, started=time.time(), fps=self.fps,
+                        width=self.width, height=self.height)
+        self._jobs.put(('start', (self.current_file, metadata)))
+        print(f"Recording started: {self.current_file}")
+        return self.current_file
+    
+    def stop_recording(self):
+        """Stop recording; the encoder finishes queued frames and closes the file"""
+        if not self.recording:
+            return
+        
+        self.recording = False
+        self._jobs.put(('stop', None))
+        print(f"Recording stopped: {self.current_file} "
+              f"({self.dropped_frames} frames dropped)")
+    
+    def toggle_recording(self):
+        """
+        Toggle video recording
+        
+        Returns:
+            bool: True if recording is now active
+        """
+        if self.recording:
+            self.stop_recording()
+        else:
+            self.start_recording()
+        return self.recording
+    
+    def capture(self, frame):
+        """
+        Offer a composited frame to the recorder (call once per frame)
+        
+        Args:
+            frame: Final frame shown to the player
+        
+        Returns:
+            bool: True if the frame was queued for encoding
+        """
+        if not self.recording:
+            return False
+        
+        # Pace capture to the output frame rate
+        now = time.perf_counter()
+        if now < self._next_capture_time:
+            return False
+        self._next_capture_time = max(self._next_capture_time + self._frame_interval,
+                                      now - self._frame_interval)
+        
+        try:
+            index = self._free.get_nowait()
+        except queue.Empty:
+            # Encoder is behind: drop this frame instead of blocking the game
+            self.dropped_frames += 1
+            self.total_dropped_frames += 1
+            return False
+        
+        buffer = self._pool[index]
+        if frame.shape[:2] == buffer.shape[:2]:
+            np.copyto(buffer, frame)
+        else:
+            cv2.resize(frame, (self.width, self.height), dst=buffer,
+                       interpolation=cv2.INTER_AREA)
+        
+        self._jobs.put(('frame', index))
+        return True
+    
+    def save_screenshot(self, frame, path=None):
+        """
+        Save a full-resolution screenshot asynchronously
+        
+        Args:
+            frame: Frame to save
+            path: Output file (timestamped PNG in output_dir if None)
+        
+        Returns:
+            str: Path the screenshot will be written to
+        """
+        path = path or self._timestamped_path('screenshot', 'png')
+        self._jobs.put(('screenshot', (frame.copy(), path)))
+        return path
+    
+    def _worker(self):
+        """Encoder thread: writes frames and screenshots in submission order"""
+        writer = None
+        
+        while True:
+            job, payload = self._jobs.get()
+            
+            if job == 'frame':
+                if writer is not None:
+                    writer.write(self._pool[payload])
+                    self.frames_written += 1
+                self._free.put(payload)
+            elif job == 'start':
+                path, metadata = payload
+                if writer is not None:
+                    writer.release()
+                fourcc = cv2.VideoWriter_fourcc(*self.codec)
+                writer = cv2.VideoWriter(path, fourcc, self.fps, (self.width, self.height))
+                if not writer.isOpened():
+                    print(f"Error opening video writer: {path}")
+                    writer = None
+                self._write_metadata(path, metadata)
+            elif job == 'stop':
+                if writer is not None:
+                    writer.release()
+                    writer = None
+            elif job == 'screenshot':
+                image, path = payload
+                if cv2.imwrite(path, image):
+                    print(f"Screenshot saved: {path}")
+                else:
+                    print(f"Error saving screenshot: {path}")
+            elif job == 'close':
+                if writer is not None:
+                    writer.release()
+                return
+    
+    def _write_metadata(self, video_path, metadata):
+        """Write the JSON sidecar for a video"""
+        try:
+            with open(os.path.splitext(video_path)[0] + '.json', 'w') as f:
+                json.dump(metadata, f, indent=2)
+        except (OSError, TypeError) as e:
+            print(f"Error saving recording metadata: {e}")
+    
+    def close(self):
+        """Stop recording and wait for pending frames to be written"""
+        self.stop_recording()
+        self._jobs.put(('close', None))
+        self._thread.join(timeout=5)
@@ -0,0 +1,516 @@
+"""
+Gesture Classifier Module
+Learned static gesture classifier trained from recorded landmark datasets
+
+Landmarks are turned into normalized feature vectors (wrist at the origin,
+left hands mirrored, rotated so the palm points up, scaled by palm length)
+and classified by a small NumPy MLP. New gestures only need new recordings:
+
+    python gesture_classifier.py record thumbs_up     # SPACE starts/stops capture
+    python gesture_classifier.py train                # writes models/gesture_classifier.npz
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import time
+import numpy as np
+
+
+NUM_LANDMARKS = 21
+WRIST = 0
+MIDDLE_MCP = 9
+
+# 20 normalized landmarks (x, y, z) plus the palm direction (cos, sin)
+FEATURE_SIZE = (NUM_LANDMARKS - 1) * 3 + 2
+
+# Label for recordings of "no gesture"; classify() reports it as None
+NONE_LABEL = 'none'
+
+
+def landmarks_to_points(hand_landmarks):
+    """
+    Convert hand landmarks to a (21, 3) float32 array
+    
+    Args:
+        hand_landmarks: MediaPipe hand landmarks (or a remote hand with `points`)
+    
+    Returns:
+        np.ndarray: Normalized (x, y, z) per landmark
+    """
+    points = getattr(hand_landmarks, 'points', None)
+    if points is not None:
+        return points
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+def extract_features(points, handedness=None):
+    """
+    Build rotation- and scale-invariant feature vectors
+    
+    The hand is translated so the wrist is at the origin, mirrored if it is a
+    left hand, rotated in the image plane so the wrist -> middle finger MCP
+    axis points up and divided by the length of that axis. The original
+    axis direction (cos, sin) is appended as the last two features; the
+    classifier weights them (GestureClassifier orientation_weight), so
+    gestures that differ only by direction (thumbs up/down) can opt in.
+    
+    Args:
+        points: (21, 3) or (N, 21, 3) landmark array
+        handedness: 'Left'/'Right' label, or a sequence of labels for N hands
+    
+    Returns:
+        np.ndarray: (FEATURE_SIZE,) or (N, FEATURE_SIZE) float32 features
+    """
+    single = points.ndim == 2
+    hands = np.array(points, dtype=np.float32, copy=True).reshape(-1, NUM_LANDMARKS, 3)
+    hands -= hands[:, WRIST:WRIST + 1]
+    
+    if handedness is not None:
+        labels = [handedness] if isinstance(handedness, str) else handedness
+        left = np.array([label == 'Left' for label in labels])
+        hands[left, :, 0] *= -1
+    
+    axis = hands[:, MIDDLE_MCP, :2]
+    length = np.linalg.norm(axis, axis=1)
+    length[length < 1e-6] = 1e-6
+    cos = axis[:, 0] / length
+    sin = axis[:, 1] / length
+    
+    # Rotation taking the unit axis (cos, sin) to (0, -1), i.e. pointing up
+    x = hands[:, 1:, 0]
+    y = hands[:, 1:, 1]
+    rotated = np.empty((len(hands), NUM_LANDMARKS - 1, 3), dtype=np.float32)
+    rotated[:, :, 0] = -sin[:, None] * x + cos[:, None] * y
+    rotated[:, :, 1] = -cos[:, None] * x - sin[:, None] * y
+    rotated[:, :, 2] = hands[:, 1:, 2]
+    rotated /= length[:, None, None]
+    
+    features = np.empty((len(hands), FEATURE_SIZE), dtype=np.float32)
+    features[:, :-2] = rotated.reshape(len(hands), -1)
+    features[:, -2] = cos
+    features[:, -1] = sin
+    return features[0] if single else features
+
+
+def save_samples(data_dir, label, points, handedness):
+    """
+    Append labeled landmark samples to data_dir/<label>.npz
+    
+    Args:
+        data_dir: Dataset directory
+        label: Gesture name
+        points: (N, 21, 3) landmark array
+        handedness: N 'Left'/'Right' labels
+    
+    Returns:
+        int: Total samples stored for the label
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"{label}.npz")
+    points = np.asarray(points, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    handedness = np.asarray(handedness, dtype='<U5')
+    
+    if os.path.exists(path):
+        with np.load(path) as existing:
+            points = np.concatenate([existing['points'], points])
+            handedness = np.concatenate([existing['handedness'], handedness])
+    
+    np.savez_compressed(path, points=points, handedness=handedness)
+    return len(points)
+
+
+def load_dataset(data_dir):
+    """
+    Load every <label>.npz recording in a directory
+    
+    Args:
+        data_dir: Dataset directory
+    
+    Returns:
+        tuple: (points (N, 21, 3), handedness (N,), labels (N,))
+    """
+    all_points, all_handedness, all_labels = [], [], []
+    for path in sorted(glob.glob(os.path.join(data_dir, '*.npz'))):
+        label = os.path.splitext(os.path.basename(path))[0]
+        with np.load(path) as data:
+            all_points.append(data['points'])
+            all_handedness.append(data['handedness'])
+            all_labels.append(np.full(len(data['points']), label, dtype=object))
+    
+    if not all_points:
+        raise ValueError(f"No gesture recordings (*.npz) in {data_dir}")
+    return (np.concatenate(all_points), np.concatenate(all_handedness),
+            np.concatenate(all_labels))
+
+
+def dataset_fingerprint(data_dir, options=None):
+    """
+    Hash of the recording files' names, sizes and modification times
+    
+    Args:
+        data_dir: Dataset directory
+        options: Model and training options to include (a model trained
+            with other options then has another fingerprint)
+    
+    Returns:
+        str: Hex digest that changes whenever a recording or option changes
+    """
+    digest = hashlib.sha1()
+    for path in sorted(glob.glob(os.path.join(data_dir, '*.npz'))):
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    if options:
+        digest.update(repr(sorted(options.items())).encode())
+    return digest.hexdigest()
+
+
+class GestureClassifier:
+    """
+    Small MLP (features -> hidden ReLU layer -> softmax) in pure NumPy
+    
+    Inference on one hand is a feature extraction plus two small matrix
+    products, a few tens of microseconds in total.
+    """
+    
+    def __init__(self, classes, hidden_size=32, orientation_weight=0.0, seed=0):
+        """
+        Initialize an untrained classifier
+        
+        Args:
+            classes: Gesture names, one per output
+            hidden_size: Hidden layer width
+            orientation_weight: Weight of the standardized palm direction
+                features (0 is fully rotation invariant; 1 weighs the palm
+                direction like any other feature, telling thumbs up from down)
+            seed: Seed for weight initialization and training batches
+        """
+        self.classes = list(classes)
+        self.hidden_size = hidden_size
+        self.orientation_weight = orientation_weight
+        self.seed = seed
+        self.fingerprint = ''
+        
+        rng = np.random.default_rng(seed)
+        self.mean = np.zeros(FEATURE_SIZE, dtype=np.float32)
+        self.scale = np.ones(FEATURE_SIZE, dtype=np.float32)
+        self.w1 = (rng.standard_normal((FEATURE_SIZE, hidden_size)) *
+                   np.sqrt(2.0 / FEATURE_SIZE)).astype(np.float32)
+        self.b1 = np.zeros(hidden_size, dtype=np.float32)
+        self.w2 = (rng.standard_normal((hidden_size, len(self.classes))) *
+                   np.sqrt(1.0 / hidden_size)).astype(np.float32)
+        self.b2 = np.zeros(len(self.classes), dtype=np.float32)
+    
+    def _standardize(self, features):
+        """Standardize features and apply the palm direction weight"""
+        x = (features - self.mean) / self.scale
+        x[..., -2:] *= self.orientation_weight
+        return x
+    
+    def _forward(self, features):
+        """Return (hidden activations, class probabilities)"""
+        hidden = np.maximum(self._standardize(features) @ self.w1 + self.b1, 0)
+        logits = hidden @ self.w2 + self.b2
+        logits -= logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return hidden, exp / exp.sum(axis=-1, keepdims=True)
+    
+    def fit(self, features, labels, epochs=400, learning_rate=0.01, weight_decay=1e-4,
+            batch_size=256, validation_split=0.2):
+        """
+        Train with mini-batch Adam on softmax cross-entropy
+        
+        Args:
+            features: (N, FEATURE_SIZE) features
+            labels: N gesture names (all in self.classes)
+            epochs: Passes over the training set
+            learning_rate: Adam step size
+            weight_decay: L2 penalty on the weights
+            batch_size: Samples per update
+            validation_split: Fraction held out for the reported accuracy
+        
+        Returns:
+            dict: 'train_accuracy', 'validation_accuracy' and per-class 'class_accuracy'
+        """
+        rng = np.random.default_rng(self.seed)
+        index = {name: i for i, name in enumerate(self.classes)}
+        targets = np.array([index[label] for label in labels])
+        features = np.asarray(features, dtype=np.float32)
+        
+        order = rng.permutation(len(features))
+        n_val = int(len(features) * validation_split)
+        val_idx, train_idx = order[:n_val], order[n_val:]
+        
+        self.mean = features[train_idx].mean(axis=0)
+        self.scale = features[train_idx].std(axis=0) + 1e-6
+        
+        params = [self.w1, self.b1, self.w2, self.b2]
+        moments = [np.zeros_like(p) for p in params]
+        velocities = [np.zeros_like(p) for p in params]
+        beta1, beta2, step = 0.9, 0.999, 0
+        
+        for _ in range(epochs):
+            rng.shuffle(train_idx)
+            for start in range(0, len(train_idx), batch_size):
+                batch = train_idx[start:start + batch_size]
+                x = self._standardize(features[batch])
+                hidden = np.maximum(x @ self.w1 + self.b1, 0)
+                logits = hidden @ self.w2 + self.b2
+                logits -= logits.max(axis=1, keepdims=True)
+                probs = np.exp(logits)
+                probs /= probs.sum(axis=1, keepdims=True)
+                
+                grad_logits = probs
+                grad_logits[np.arange(len(batch)), targets[batch]] -= 1
+                grad_logits /= len(batch)
+                grad_hidden = (grad_logits @ self.w2.T) * (hidden > 0)
+                grads = [x.T @ grad_hidden + weight_decay * self.w1, grad_hidden.sum(axis=0),
+                         hidden.T @ grad_logits + weight_decay * self.w2, grad_logits.sum(axis=0)]
+                
+                step += 1
+                correction = np.sqrt(1 - beta2 ** step) / (1 - beta1 ** step)
+                for param, grad, m, v in zip(params, grads, moments, velocities):
+                    m *= beta1
+                    m += (1 - beta1) * grad
+                    v *= beta2
+                    v += (1 - beta2) * grad * grad
+                    param -= learning_rate * correction * m / (np.sqrt(v) + 1e-8)
+        
+        def accuracy(idx):
+            if len(idx) == 0:
+                return float('nan')
+            return float((self._forward(features[idx])[1].argmax(axis=1) == targets[idx]).mean())
+        
+        check_idx = val_idx if len(val_idx) else train_idx
+        predicted = self._forward(features[check_idx])[1].argmax(axis=1)
+        class_accuracy = {}
+        for i, name in enumerate(self.classes):
+            mask = targets[check_idx] == i
+            if mask.any():
+                class_accuracy[name] = float((predicted[mask] == i).mean())
+        
+        return {
+            'train_accuracy': accuracy(train_idx),
+            'validation_accuracy': accuracy(val_idx),
+            'class_accuracy': class_accuracy,
+        }
+    
+    def predict_proba(self, features):
+        """
+        Class probabilities for feature vectors
+        
+        Args:
+            features: (FEATURE_SIZE,) or (N, FEATURE_SIZE) features
+        
+        Returns:
+            np.ndarray: Probabilities in self.classes order
+        """
+        return self._forward(features)[1]
+    
+    def classify(self, points, handedness=None):
+        """
+        Classify one hand
+        
+        Args:
+            points: (21, 3) landmark array
+            handedness: 'Left'/'Right' label (None treats the hand as right)
+        
+        Returns:
+            tuple: (gesture name or None, confidence, {gesture: confidence})
+        """
+        features = extract_features(points, handedness)
+        probabilities = self._forward(features)[1]
+        best = int(probabilities.argmax())
+        confidences = dict(zip(self.classes, probabilities.tolist()))
+        label = self.classes[best]
+        return (None if label == NONE_LABEL else label), float(probabilities[best]), confidences
+    
+    def save(self, path):
+        """
+        Save the model to a .npz file
+        
+        Args:
+            path: Output path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez(path, classes=np.array(self.classes), w1=self.w1, b1=self.b1,
+                 w2=self.w2, b2=self.b2, mean=self.mean, scale=self.scale,
+                 orientation_weight=self.orientation_weight, seed=self.seed,
+                 fingerprint=self.fingerprint)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Load a model saved with save()
+        
+        Args:
+            path: Model file
+        
+        Returns:
+            GestureClassifier: Loaded model
+        """
+        with np.load(path) as data:
+            model = cls(data['classes'].tolist(), hidden_size=data['w1'].shape[1],
+                        orientation_weight=float(data['orientation_weight']),
+                        seed=int(data['seed']))
+            for name in ('w1', 'b1', 'w2', 'b2', 'mean', 'scale'):
+                setattr(model, name, data[name].astype(np.float32))
+            model.fingerprint = str(data['fingerprint'])
+        return model
+    
+    @classmethod
+    def from_dataset(cls, data_dir, model_path='models/gesture_classifier.npz', verbose=True,
+                     **train_options):
+        """
+        Load the cached model for a dataset, retraining if the recordings or options changed
+        
+        Args:
+            data_dir: Dataset directory
+            model_path: Cache file
+            verbose: Print training results
+            **train_options: hidden_size, orientation_weight, seed or fit() options
+        
+        Returns:
+            GestureClassifier: Trained model
+        """
+        model_options = {key: train_options.pop(key) for key in
+                         ('hidden_size', 'orientation_weight', 'seed') if key in train_options}
+        # Option defaults for the cache key, without loading the recordings
+        defaults = cls([], **model_options)
+        fingerprint = dataset_fingerprint(data_dir, dict(
+            train_options, hidden_size=defaults.hidden_size,
+            orientation_weight=defaults.orientation_weight, seed=defaults.seed))
+        if os.path.exists(model_path):
+            try:
+                model = cls.load(model_path)
+                if model.fingerprint == fingerprint:
+                    return model
+            except (OSError, KeyError, ValueError) as e:
+                print(f"Error loading gesture model: {e}")
+        
+        points, handedness, labels = load_dataset(data_dir)
+        model = cls(sorted(set(labels)), **model_options)
+        features = extract_features(points, handedness)
+        
+        start = time.perf_counter()
+        report = model.fit(features, labels, **train_options)
+        model.fingerprint = fingerprint
+        model.save(model_path)
+        
+        if verbose:
+            print(f"Trained gesture classifier on {len(labels)} samples in "
+                  f"{time.perf_counter() - start:.1f}s: train {report['train_accuracy']:.3f}, "
+                  f"validation {report['validation_accuracy']:.3f}")
+            for name, value in sorted(report['class_accuracy'].items()):
+                print(f"  {name:<14} {value:.3f}")
+        return model
+
+
+def record(label, data_dir, camera_index=0):
+    """
+    Record labeled samples from the webcam
+    
+    SPACE starts/stops capturing, Q saves and quits.
+    
+    Args:
+        label: Gesture name
+        data_dir: Dataset directory
+        camera_index: Webcam index
+    """
+    import cv2
+    from hand_tracker import HandTracker
+    
+    tracker = HandTracker(max_num_hands=1)
+    cap = cv2.VideoCapture(camera_index)
+    points, handedness = [], []
+    capturing = False
+    
+    try:
+        while True:
+            success, frame = cap.read()
+            if not success:
+                break
+            frame = cv2.flip(frame, 1)
+            frame, results = tracker.find_hands(frame)
+            
+            if capturing and results.multi_hand_landmarks:
+                points.append(tracker.landmarks_to_array(results.multi_hand_landmarks[0]))
+                handedness.append(results.multi_handedness[0].classification[0].label)
+            
+            status = "CAPTURING" if capturing else "SPACE to capture"
+            cv2.putText(frame, f"{label}: {len(points)} samples | {status} | Q: save and quit",
+                        (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7,
+                        (0, 0, 255) if capturing else (255, 255, 255), 2)
+            cv2.imshow("Gesture Recorder", frame)
+            
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord(' '):
+                capturing = not capturing
+            elif key == ord('q'):
+                break
+    finally:
+        cap.release()
+        tracker.close()
+        cv2.destroyAllWindows()
+    
+    if points:
+        total = save_samples(data_dir, label, np.array(points), handedness)
+        print(f"Saved {len(points)} samples ({total} total) to {data_dir}/{label}.npz")
+
+
+def benchmark(model, iterations=10000):
+    """
+    Measure per-hand inference time
+    
+    Args:
+        model: Trained GestureClassifier
+        iterations: Classifications to time
+    
+    Returns:
+        float: Microseconds per classification
+    """
+    rng = np.random.default_rng(0)
+    points = rng.random((NUM_LANDMARKS, 3), dtype=np.float32)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        model.classify(points, 'Right')
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Entry point"""
+    parser = argparse.ArgumentParser(description="Record gestures and train the gesture classifier")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    record_parser = subparsers.add_parser('record', help="Record samples for one gesture")
+    record_parser.add_argument('label', help=f"Gesture name ('{NONE_LABEL}' for no gesture)")
+    record_parser.add_argument('--data', default='gesture_data', help="Dataset directory")
+    record_parser.add_argument('--camera', type=int, default=0, help="Webcam index")
+    
+    train_parser = subparsers.add_parser('train', help="Train and cache the classifier")
+    train_parser.add_argument('--data', default='gesture_data', help="Dataset directory")
+    train_parser.add_argument('--model', default='models/gesture_classifier.npz', help="Model file")
+    train_parser.add_argument('--hidden', type=int, default=32, help="Hidden layer width")
+    train_parser.add_argument('--epochs', type=int, default=400, help="Training epochs")
+    train_parser.add_argument('--orientation-weight', type=float, default=0.0,
+                              help="Weight of palm direction (0 = fully rotation invariant, "
+                                   "1 = tell gestures apart by direction)")
+    args = parser.parse_args()
+    
+    if args.command == 'record':
+        record(args.label, args.data, args.camera)
+    else:
+        if os.path.exists(args.model):
+            os.remove(args.model)
+        model = GestureClassifier.from_dataset(args.data, args.model, hidden_size=args.hidden,
+                                               orientation_weight=args.orientation_weight,
+                                               epochs=args.epochs)
+        print(f"Inference: {benchmark(model, 2000):.1f} us per hand")
+        print(f"Model saved to {args.model}")
+
+
+if __name__ == "__main__":
+    main()
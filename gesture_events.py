@@ -0,0 +1,252 @@
+"""
+Gesture Events Module
+Per-frame gesture stage that publishes press/hold/release events to subscribers
+"""
+
+import time
+from collections import deque
+
+
+class GestureEvent:
+    """One timestamped gesture event"""
+    
+    __slots__ = ('kind', 'gesture', 'timestamp', 'duration', 'confidence')
+    
+    PRESS = 'press'
+    HOLD = 'hold'
+    RELEASE = 'release'
+    
+    def __init__(self, kind, gesture, timestamp, duration=0.0, confidence=None):
+        """
+        Args:
+            kind: 'press', 'hold' or 'release'
+            gesture: Gesture name
+            timestamp: Time of the event in seconds (perf_counter clock)
+            duration: Seconds the gesture had been held
+            confidence: Classifier confidence when the gesture was seen (None if unknown)
+        """
+        self.kind = kind
+        self.gesture = gesture
+        self.timestamp = timestamp
+        self.duration = duration
+        self.confidence = confidence
+    
+    def __repr__(self):
+        return f"GestureEvent({self.kind!r}, {self.gesture!r}, t={self.timestamp:.3f}, held={self.duration:.3f})"
+
+
+class GestureSubscription:
+    """
+    One consumer of the gesture bus with its own debounce policy
+    
+    A pose gesture must be seen for `press_delay` seconds before 'press' is
+    delivered and be gone for `release_delay` seconds before 'release', so a
+    few misclassified frames neither end a hold nor cause a second press.
+    While a gesture is held, 'hold' is delivered every `hold_interval`
+    seconds. Motion gestures are instantaneous and arrive as a 'press'
+    immediately followed by a 'release'.
+    
+    Events go to `callback` if one is given, otherwise they are queued until
+    `poll()` is called.
+    """
+    
+    def __init__(self, gestures=None, callback=None, press_delay=0.0, release_delay=0.0,
+                 hold_interval=None, max_events=64):
+        """
+        Initialize the subscription
+        
+        Args:
+            gestures: Gesture names of interest (all gestures if None)
+            callback: Function called with each GestureEvent (queued for poll() if None)
+            press_delay: Seconds a gesture must be stable before 'press'
+            release_delay: Seconds a gesture must be gone before 'release'
+            hold_interval: Seconds between 'hold' events (no hold events if None)
+            max_events: Queued events kept when nobody polls (oldest are dropped)
+        """
+        self.gestures = frozenset(gestures) if gestures else None
+        self.callback = callback
+        self.press_delay = press_delay
+        self.release_delay = release_delay
+        self.hold_interval = hold_interval
+        self.events = deque(maxlen=max_events)
+        self.reset()
+    
+    def reset(self):
+        """Forget the held gesture and queued events without emitting a release"""
+        self.held = None
+        self.held_since = 0.0
+        self._candidate = None
+        self._candidate_since = 0.0
+        self._missing_since = None
+        self._next_hold = 0.0
+        self.events.clear()
+    
+    def _emit(self, kind, gesture, timestamp, duration=0.0, confidence=None):
+        """Deliver one event"""
+        event = GestureEvent(kind, gesture, timestamp, duration, confidence)
+        if self.callback is not None:
+            self.callback(event)
+        else:
+            self.events.append(event)
+    
+    def update(self, gesture, timestamp, confidence=None):
+        """
+        Apply the pose gesture recognized in the current frame
+        
+        Args:
+            gesture: Gesture name or None (no gesture or no hand)
+            timestamp: Frame time in seconds
+            confidence: Classifier confidence (None if unknown)
+        """
+        if gesture is not None and self.gestures is not None and gesture not in self.gestures:
+            gesture = None
+        if gesture != self._candidate:
+            self._candidate = gesture
+            self._candidate_since = timestamp
+        
+        held = self.held
+        if held is not None:
+            if gesture == held:
+                self._missing_since = None
+                if self.hold_interval is not None and timestamp >= self._next_hold:
+                    self._emit(GestureEvent.HOLD, held, timestamp, timestamp - self.held_since, confidence)
+                    self._next_hold = timestamp + self.hold_interval
+                return
+            
+            if self._missing_since is None:
+                self._missing_since = timestamp
+            if timestamp - self._missing_since < self.release_delay:
+                return
+            # Stamp the release with the first frame the gesture was gone
+            released = self._missing_since
+            self.held = None
+            self._missing_since = None
+            self._emit(GestureEvent.RELEASE, held, released, released - self.held_since)
+        
+        if gesture is not None and timestamp - self._candidate_since >= self.press_delay:
+            # Stamp the press with the first frame the gesture was seen
+            self.held = gesture
+            self.held_since = self._candidate_since
+            self._next_hold = timestamp + (self.hold_interval or 0.0)
+            self._emit(GestureEvent.PRESS, gesture, self.held_since, 0.0, confidence)
+    
+    def motion(self, gesture, timestamp):
+        """
+        Deliver a motion gesture (press and release at the same time)
+        
+        Args:
+            gesture: Motion gesture name
+            timestamp: Frame time in seconds
+        """
+        if self.gestures is None or gesture in self.gestures:
+            self._emit(GestureEvent.PRESS, gesture, timestamp)
+            self._emit(GestureEvent.RELEASE, gesture, timestamp)
+    
+    def poll(self):
+        """
+        Take the queued events
+        
+        Returns:
+            list: GestureEvents in the order they happened
+        """
+        events = list(self.events)
+        self.events.clear()
+        return events
+    
+    def is_held(self, gesture=None):
+        """
+        Check whether a gesture is currently pressed for this subscriber
+        
+        Args:
+            gesture: Gesture name (any gesture if None)
+        
+        Returns:
+            bool: True while held
+        """
+        return self.held is not None and (gesture is None or self.held == gesture)
+
+
+class GestureEventBus:
+    """
+    Per-frame gesture stage shared by all consumers
+    
+    `process()` runs once per frame: it classifies the hand once (learned
+    classifier or finger-state rules), feeds the motion history and passes
+    the result to every subscription. Consumers subscribe with their own
+    debounce policy instead of calling the recognizer themselves, so there is
+    no repeated classification and no cooldown shared between consumers.
+    """
+    
+    def __init__(self, recognizer):
+        """
+        Initialize the bus
+        
+        Args:
+            recognizer: GestureRecognizer used for classification and motion gestures
+        """
+        self.recognizer = recognizer
+        self.subscriptions = []
+        
+        # Result of the last processed frame
+        self.timestamp = 0.0
+        self.gesture = None
+        self.confidence = None
+        self.motion_gesture = None
+    
+    def subscribe(self, gestures=None, callback=None, **policy):
+        """
+        Add a subscriber
+        
+        Args:
+            gestures: Gesture names of interest (all gestures if None)
+            callback: Function called with each GestureEvent (queued for poll() if None)
+            **policy: press_delay, release_delay, hold_interval, max_events
+        
+        Returns:
+            GestureSubscription: The new subscription
+        """
+        subscription = GestureSubscription(gestures, callback, **policy)
+        self.subscriptions.append(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription):
+        """Remove a subscriber"""
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+    
+    def process(self, hand_landmarks, handedness=None, timestamp=None):
+        """
+        Classify the current frame and publish events
+        
+        Call exactly once per frame, with None when no hand is visible.
+        
+        Args:
+            hand_landmarks: MediaPipe hand landmarks or None
+            handedness: 'Left' or 'Right' as reported by the tracker
+            timestamp: Capture time in seconds (now if None)
+        
+        Returns:
+            str: Pose gesture recognized in this frame or None
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        recognizer = self.recognizer
+        
+        gesture = None
+        confidence = None
+        if hand_landmarks:
+            gesture = recognizer.classify(hand_landmarks, handedness)
+            confidence = recognizer.confidence
+        motion_gesture = recognizer.update_motion(hand_landmarks, timestamp)
+        
+        self.timestamp = timestamp
+        self.gesture = gesture
+        self.confidence = confidence
+        self.motion_gesture = motion_gesture
+        
+        for subscription in list(self.subscriptions):
+            subscription.update(gesture, timestamp, confidence)
+            if motion_gesture:
+                subscription.motion(motion_gesture, timestamp)
+        
+        return gesture
@@ -4,22 +4,272 @@ Recognizes various hand gestures for game control
 """
 
 import math
+import time
+import numpy as np
+from gesture_classifier import landmarks_to_points
+
+
+# Landmarks used for motion gestures
+WRIST = 0
+INDEX_TIP = 8
+PALM_CENTER = 9  # middle finger MCP
+
+
+class LandmarkHistory:
+    """
+    Fixed-size ring buffer of recent hand landmarks with timestamps
+    
+    Each push computes velocities and accelerations of all 21 landmarks in
+    one vectorized step and updates running sums (path length and turning
+    angle of the palm) by adding the newest step and removing the step that
+    leaves the window. Motion statistics therefore cost the same per frame
+    whatever the capacity.
+    """
+    
+    def __init__(self, capacity=30, recent=8):
+        """
+        Initialize the history
+        
+        Args:
+            capacity: Number of frames kept (window for circles)
+            recent: Number of newest frames in the short window (for swipes)
+        """
+        self.capacity = capacity
+        self.recent = min(recent, capacity)
+        self.points = np.zeros((capacity, 21, 3), dtype=np.float32)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.velocity = np.zeros((21, 3), dtype=np.float32)
+        self.acceleration = np.zeros((21, 3), dtype=np.float32)
+        
+        # Per-sample palm step length, turning angle and fingertip speed
+        self._step = np.zeros(capacity)
+        self._recent_step = np.zeros(capacity)
+        self._turn = np.zeros(capacity)
+        self.tip_speed = np.zeros(capacity)
+        
+        self.index = -1
+        self.count = 0
+        self.path_length = 0.0
+        self.recent_path_length = 0.0
+        self.total_turn = 0.0
+        self._last_direction = None
+    
+    def clear(self):
+        """Forget all samples (O(1): slots are overwritten before being read again)"""
+        self.index = -1
+        self.count = 0
+        self.path_length = 0.0
+        self.recent_path_length = 0.0
+        self.total_turn = 0.0
+        self._last_direction = None
+        self.velocity[:] = 0
+        self.acceleration[:] = 0
+    
+    @property
+    def oldest(self):
+        """Slot of the oldest sample"""
+        return (self.index + 1) % self.capacity if self.count == self.capacity else 0
+    
+    def push(self, points, timestamp, min_step=0.01):
+        """
+        Add one frame of landmarks
+        
+        Args:
+            points: (21, 3) normalized landmarks
+            timestamp: Capture time in seconds
+            min_step: Palm steps shorter than this do not change the direction
+        """
+        capacity = self.capacity
+        previous = self.index
+        self.index = (self.index + 1) % capacity
+        slot = self.index
+        self.points[slot] = points
+        self.timestamps[slot] = timestamp
+        
+        step = turn = speed = 0.0
+        if self.count > 0:
+            dt = max(timestamp - self.timestamps[previous], 1e-3)
+            velocity = (self.points[slot] - self.points[previous]) / dt
+            self.acceleration = (velocity - self.velocity) / dt
+            self.velocity = velocity
+            
+            dx, dy = self.points[slot, PALM_CENTER, :2] - self.points[previous, PALM_CENTER, :2]
+            step = math.hypot(dx, dy)
+            if step >= min_step:
+                if self._last_direction is not None:
+                    px, py = self._last_direction
+                    # Signed angle between steps; positive is clockwise on screen (y down)
+                    turn = math.atan2(px * dy - py * dx, px * dx + py * dy)
+                self._last_direction = (dx, dy)
+            
+            # Fingertip speed relative to the wrist (a flick moves the finger, not the hand)
+            relative = velocity[INDEX_TIP, :2] - velocity[WRIST, :2]
+            speed = math.hypot(relative[0], relative[1])
+        
+        if self.count < capacity:
+            self.count += 1
+        self._step[slot] = self._recent_step[slot] = step
+        self._turn[slot] = turn
+        self.tip_speed[slot] = speed
+        self.path_length += step
+        self.recent_path_length += step
+        self.total_turn += turn
+        
+        # Same for the short window: drop the step into its oldest sample
+        if self.count >= self.recent:
+            self.recent_path_length -= self._recent_step[(slot - self.recent + 1) % capacity]
+        
+        # The oldest sample's incoming step (and the turn that used it) is
+        # outside the window now
+        if self.count == capacity:
+            oldest = self.oldest
+            following = (oldest + 1) % capacity
+            self.path_length -= self._step[oldest]
+            self.total_turn -= self._turn[oldest] + self._turn[following]
+            self._step[oldest] = self._turn[oldest] = self._turn[following] = 0.0
+    
+    def displacement(self, landmark=PALM_CENTER, recent=False):
+        """
+        Net (dx, dy) movement of a landmark and the time it took
+        
+        Args:
+            landmark: Landmark index
+            recent: Measure over the short window instead of the whole history
+        
+        Returns:
+            tuple: (dx, dy, seconds)
+        """
+        if recent:
+            oldest = (self.index - min(self.count, self.recent) + 1) % self.capacity
+        else:
+            oldest = self.oldest
+        dx, dy = self.points[self.index, landmark, :2] - self.points[oldest, landmark, :2]
+        return float(dx), float(dy), float(self.timestamps[self.index] - self.timestamps[oldest])
+
+
+class MotionGestureDetector:
+    """Detects swipes, flicks and circles from a LandmarkHistory"""
+    
+    MOTION_GESTURES = ('swipe_left', 'swipe_right', 'swipe_up', 'swipe_down',
+                       'flick', 'circle_cw', 'circle_ccw')
+    
+    def __init__(self, history_size=30, swipe_frames=8, swipe_distance=0.22, swipe_time=0.5,
+                 swipe_straightness=0.9, flick_speed=2.0, circle_turn=1.7 * math.pi,
+                 circle_length=0.35, max_gap=0.25, cooldown=0.5):
+        """
+        Initialize the detector
+        
+        Args:
+            history_size: Frames of history (window for circles)
+            swipe_frames: Newest frames considered for swipes
+            swipe_distance: Palm travel along one axis (fraction of the frame)
+            swipe_time: Longest swipe duration in seconds
+            swipe_straightness: Net displacement / path length needed for a swipe
+            flick_speed: Fingertip speed relative to the wrist (frames per second)
+            circle_turn: Accumulated turning angle for a circle (radians)
+            circle_length: Palm path length needed for a circle
+            max_gap: Seconds without a hand after which the history restarts
+            cooldown: Seconds after a motion gesture during which none is reported
+        """
+        self.history = LandmarkHistory(history_size, swipe_frames)
+        self.swipe_distance = swipe_distance
+        self.swipe_time = swipe_time
+        self.swipe_straightness = swipe_straightness
+        self.flick_speed = flick_speed
+        self.circle_turn = circle_turn
+        self.circle_length = circle_length
+        self.max_gap = max_gap
+        self.cooldown = cooldown
+        self._blocked_until = 0.0
+    
+    def update(self, points, timestamp):
+        """
+        Add a frame and detect a motion gesture
+        
+        Args:
+            points: (21, 3) landmarks, or None when no hand is visible
+            timestamp: Capture time in seconds
+        
+        Returns:
+            str: Motion gesture name or None
+        """
+        history = self.history
+        if points is None:
+            history.clear()
+            return None
+        if history.count and timestamp - history.timestamps[history.index] > self.max_gap:
+            history.clear()
+        history.push(points, timestamp)
+        
+        if history.count < 3 or timestamp < self._blocked_until:
+            return None
+        
+        gesture = self._detect(history)
+        if gesture:
+            history.clear()
+            self._blocked_until = timestamp + self.cooldown
+        return gesture
+    
+    def _detect(self, history):
+        """Check the current window for each motion gesture"""
+        # Circle: the palm path turned through most of a revolution and came back
+        dx, dy, _ = history.displacement()
+        if (abs(history.total_turn) >= self.circle_turn and
+                history.path_length >= self.circle_length and
+                math.hypot(dx, dy) < 0.5 * history.path_length):
+            return 'circle_cw' if history.total_turn > 0 else 'circle_ccw'
+        
+        # Swipe: fast, straight palm movement mostly along one axis
+        dx, dy, duration = history.displacement(recent=True)
+        major, minor = max(abs(dx), abs(dy)), min(abs(dx), abs(dy))
+        if (major >= self.swipe_distance and major >= 2 * minor and duration <= self.swipe_time and
+                math.hypot(dx, dy) >= self.swipe_straightness * history.recent_path_length):
+            if abs(dx) >= abs(dy):
+                return 'swipe_right' if dx > 0 else 'swipe_left'
+            return 'swipe_down' if dy > 0 else 'swipe_up'
+        
+        # Flick: fingertip burst that is already slowing down (decelerating)
+        previous = (history.index - 1) % history.capacity
+        peak = history.tip_speed[previous]
+        if peak >= self.flick_speed and history.tip_speed[history.index] < 0.6 * peak:
+            return 'flick'
+        
+        return None
 
 
 class GestureRecognizer:
     """Recognizes hand gestures from MediaPipe landmarks"""
     
-    def __init__(self):
-        """Initialize gesture recognizer"""
+    def __init__(self, classifier=None, min_confidence=0.6):
+        """
+        Initialize gesture recognizer
+        
+        Args:
+            classifier: Trained GestureClassifier (finger-state rules if None)
+            min_confidence: Classifier confidence needed to report a gesture
+        """
         self.last_gesture = None
         self.gesture_cooldown = 0
+        self.classifier = classifier
+        self.min_confidence = min_confidence
+        
+        # Per-class confidences of the last classification (classifier only)
+        self.confidences = {}
+        self.confidence = None
         
-    def recognize_gesture(self, hand_landmarks):
+        # Motion gestures from a ring buffer of recent landmarks
+        self.motion = MotionGestureDetector()
+        
+    def recognize_gesture(self, hand_landmarks, handedness=None):
         """
-        Recognize gesture from hand landmarks
+        Recognize gesture from hand landmarks with a 10 frame cooldown
+        
+        The cooldown state is shared by every caller; consumers in the same
+        frame loop should subscribe to a GestureEventBus instead.
         
         Args:
             hand_landmarks: MediaPipe hand landmarks
+            handedness: 'Left' or 'Right' as reported by the tracker
             
         Returns:
             str: Recognized gesture name or None
@@ -32,7 +282,7 @@ class GestureRecognizer:
             self.gesture_cooldown -= 1
             return self.last_gesture
         
-        gesture = self._detect_gesture(hand_landmarks)
+        gesture = self.classify(hand_landmarks, handedness)
         
         if gesture and gesture != self.last_gesture:
             self.last_gesture = gesture
@@ -41,18 +291,56 @@ class GestureRecognizer:
         
         return None
     
-    def _detect_gesture(self, hand_landmarks):
+    def classify(self, hand_landmarks, handedness=None):
+        """
+        Classify the hand pose of one frame (no cooldown)
+        
+        Args:
+            hand_landmarks: MediaPipe hand landmarks
+            handedness: 'Left' or 'Right' as reported by the tracker
+            
+        Returns:
+            str: Gesture name or None
+        """
+        return self._detect_gesture(hand_landmarks, handedness)
+    
+    def update_motion(self, hand_landmarks, timestamp=None):
+        """
+        Add the current frame to the landmark history and detect motion gestures
+        
+        Call once per frame, with None when no hand is visible.
+        
+        Args:
+            hand_landmarks: MediaPipe hand landmarks or None
+            timestamp: Capture time in seconds (now if None)
+            
+        Returns:
+            str: 'swipe_left', 'swipe_right', 'swipe_up', 'swipe_down', 'flick',
+                'circle_cw', 'circle_ccw' or None
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        points = landmarks_to_points(hand_landmarks) if hand_landmarks else None
+        return self.motion.update(points, timestamp)
+    
+    def _detect_gesture(self, hand_landmarks, handedness=None):
         """
         Internal method to detect specific gestures
         
         Args:
             hand_landmarks: MediaPipe hand landmarks
+            handedness: 'Left' or 'Right' (None assumes a right hand)
             
         Returns:
             str: Gesture name or None
         """
+        if self.classifier is not None:
+            gesture, self.confidence, self.confidences = self.classifier.classify(
+                landmarks_to_points(hand_landmarks), handedness)
+            return gesture if self.confidence >= self.min_confidence else None
+        
         # Get finger states (extended or not)
-        fingers_up = self._count_fingers_up(hand_landmarks)
+        fingers_up = self._count_fingers_up(hand_landmarks, handedness)
         
         # Recognize gestures based on finger count and positions
         if fingers_up == [0, 1, 0, 0, 0]:  # Only index finger up
@@ -74,12 +362,13 @@ class GestureRecognizer:
         
         return None
     
-    def _count_fingers_up(self, hand_landmarks):
+    def _count_fingers_up(self, hand_landmarks, handedness=None):
         """
         Count which fingers are extended
         
         Args:
             hand_landmarks: MediaPipe hand landmarks
+            handedness: 'Left' or 'Right' (None assumes a right hand)
             
         Returns:
             list: [thumb, index, middle, ring, pinky] - 1 if up, 0 if down
@@ -87,10 +376,14 @@ class GestureRecognizer:
         fingers = []
         landmarks = hand_landmarks.landmark
         
-        # Thumb (special case - check horizontal distance)
+        # Thumb (special case - check horizontal distance; the thumb
+        # points the other way on a left hand)
         thumb_tip = landmarks[4]
         thumb_ip = landmarks[3]
-        fingers.append(1 if thumb_tip.x < thumb_ip.x - 0.05 else 0)
+        if handedness == 'Left':
+            fingers.append(1 if thumb_tip.x > thumb_ip.x + 0.05 else 0)
+        else:
+            fingers.append(1 if thumb_tip.x < thumb_ip.x - 0.05 else 0)
         
         # Other fingers (check vertical position)
         finger_tips = [8, 12, 16, 20]
@@ -6,12 +6,64 @@ Uses MediaPipe to detect hands and extract finger positions
 import cv2
 import mediapipe as mp
 import numpy as np
+from landmark_renderer import LandmarkRenderer
 
 
 class HandTracker:
     """Tracks hand landmarks and provides finger positions"""
     
-    def __init__(self, max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.5):
+    # Named tracker settings; games choose one (see GameLauncher.TRACKER_PROFILES)
+    PROFILES = {
+        # Full landmark model at camera resolution: gestures and menus
+        'full': {
+            'model_complexity': 1,
+            'min_detection_confidence': 0.7,
+            'min_tracking_confidence': 0.5,
+            'max_num_hands': 1,
+            'inference_scale': 1.0,
+            'landmark_style': 'default',
+        },
+        # Only the index fingertip matters: lite model on a half-size frame
+        'fingertip': {
+            'model_complexity': 0,
+            'min_detection_confidence': 0.6,
+            'min_tracking_confidence': 0.5,
+            'max_num_hands': 1,
+            'inference_scale': 0.5,
+            'landmark_style': 'fingertip',
+        },
+        # Fingertip games that draw their own cursor
+        'fast': {
+            'model_complexity': 0,
+            'min_detection_confidence': 0.6,
+            'min_tracking_confidence': 0.5,
+            'max_num_hands': 1,
+            'inference_scale': 0.5,
+            'landmark_style': None,
+        },
+        # Pointing gesture and a precise fingertip for drawing
+        'pointer': {
+            'model_complexity': 1,
+            'min_detection_confidence': 0.7,
+            'min_tracking_confidence': 0.5,
+            'max_num_hands': 1,
+            'inference_scale': 1.0,
+            'landmark_style': 'fingertip',
+        },
+        # Versus games: one fingertip per player
+        'two_hands': {
+            'model_complexity': 0,
+            'min_detection_confidence': 0.6,
+            'min_tracking_confidence': 0.5,
+            'max_num_hands': 2,
+            'inference_scale': 1.0,
+            'landmark_style': None,
+        },
+    }
+    
+    def __init__(self, max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.5,
+                 landmark_style='default', static_image_mode=False, model_complexity=1,
+                 inference_scale=1.0):
         """
         Initialize the hand tracker
         
@@ -19,15 +71,59 @@ class HandTracker:
             max_num_hands: Maximum number of hands to detect
             min_detection_confidence: Minimum confidence for hand detection
             min_tracking_confidence: Minimum confidence for hand tracking
+            landmark_style: LandmarkRenderer style used when drawing (None to skip)
+            static_image_mode: Detect on every frame instead of tracking between
+                frames (needed when one tracker serves several video streams)
+            model_complexity: Landmark model, 0 (lite, faster) or 1 (full)
+            inference_scale: Resize factor applied to frames before inference
+                (landmarks are normalized, so results need no rescaling)
         """
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
+            static_image_mode=static_image_mode,
             max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
         )
-        self.mp_draw = mp.solutions.drawing_utils
+        self.inference_scale = inference_scale
+        self.renderer = LandmarkRenderer(landmark_style)
+        
+    @classmethod
+    def from_profile(cls, name, **overrides):
+        """
+        Create a tracker from a named profile
+        
+        Args:
+            name: Profile name from PROFILES
+            **overrides: Settings replacing the profile's values
+            
+        Returns:
+            HandTracker: New tracker
+        """
+        settings = dict(cls.PROFILES[name], **overrides)
+        return cls(**settings)
+    
+    @classmethod
+    def graph_key(cls, name, **overrides):
+        """
+        Get what distinguishes a profile's tracker apart from its drawing style
+        
+        Profiles with equal keys can share one tracker (and MediaPipe graph),
+        switching only set_landmark_style.
         
+        Args:
+            name: Profile name from PROFILES
+            **overrides: Settings replacing the profile's values
+            
+        Returns:
+            tuple: Sorted (setting, value) pairs without landmark_style
+        """
+        settings = dict(cls.PROFILES[name], **overrides)
+        settings.pop('landmark_style', None)
+        return tuple(sorted(settings.items()))
+    
+    
     def find_hands(self, frame, draw=True):
         """
         Find hands in the frame
@@ -40,39 +136,97 @@ class HandTracker:
             frame: Frame with drawn landmarks (if draw=True)
             results: MediaPipe hand detection results
         """
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Shrink for inference if the profile allows it, then convert BGR to RGB
+        small = frame
+        if self.inference_scale != 1.0:
+            small = cv2.resize(frame, None, fx=self.inference_scale, fy=self.inference_scale,
+                               interpolation=cv2.INTER_AREA)
+        frame_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
         
         # Process the frame
         results = self.hands.process(frame_rgb)
         
         # Draw hand landmarks
-        if draw and results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.mp_draw.draw_landmarks(
-                    frame, 
-                    hand_landmarks, 
-                    self.mp_hands.HAND_CONNECTIONS
-                )
+        if draw:
+            self.draw_landmarks(frame, results)
         
         return frame, results
     
-    def get_index_finger_position(self, frame, results):
+    def draw_landmarks(self, frame, results):
+        """
+        Draw detected hands with the current landmark style
+        
+        Args:
+            frame: Frame to draw on (BGR format)
+            results: MediaPipe hand detection results
+        """
+        if not self.renderer.enabled or not results.multi_hand_landmarks:
+            return
+        
+        h, w = frame.shape[:2]
+        scale = np.array([w, h], dtype=np.float32)
+        for hand_landmarks in results.multi_hand_landmarks:
+            points = self.landmarks_to_array(hand_landmarks)[:, :2] * scale
+            self.renderer.draw(frame, points)
+    
+    def set_landmark_style(self, style):
+        """
+        Change how landmarks are drawn by find_hands
+        
+        Args:
+            style: LandmarkRenderer style name or dictionary, None to skip drawing
+        """
+        self.renderer.set_style(style)
+    
+    @staticmethod
+    def landmarks_to_array(hand_landmarks):
+        """
+        Convert MediaPipe hand landmarks to a NumPy array
+        
+        Args:
+            hand_landmarks: MediaPipe hand landmarks
+            
+        Returns:
+            np.ndarray: (21, 3) float32 array of normalized (x, y, z)
+        """
+        return np.array(
+            [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark],
+            dtype=np.float32
+        )
+    
+    @staticmethod
+    def get_handedness(results, hand_index=0):
+        """
+        Get the handedness label of a detected hand
+        
+        Args:
+            results: MediaPipe hand detection results
+            hand_index: Index into the detected hands
+            
+        Returns:
+            str: 'Left' or 'Right', or None if unavailable
+        """
+        if not results.multi_handedness or hand_index >= len(results.multi_handedness):
+            return None
+        return results.multi_handedness[hand_index].classification[0].label
+    
+    def get_index_finger_position(self, frame, results, hand_index=0):
         """
         Get the position of the index finger tip
         
         Args:
             frame: Input frame
             results: MediaPipe hand detection results
+            hand_index: Index into the detected hands (order is not stable
+                across frames; see PlayerHands for per-player hands)
             
         Returns:
             tuple: (x, y) position of index finger tip, or None if not found
         """
-        if not results.multi_hand_landmarks:
+        if not results.multi_hand_landmarks or hand_index >= len(results.multi_hand_landmarks):
             return None
         
-        # Get the first hand detected
-        hand_landmarks = results.multi_hand_landmarks[0]
+        hand_landmarks = results.multi_hand_landmarks[hand_index]
         
         # Index finger tip is landmark 8
         index_finger_tip = hand_landmarks.landmark[8]
@@ -84,22 +238,22 @@ class HandTracker:
         
         return (x, y)
     
-    def get_all_finger_positions(self, frame, results):
+    def get_all_finger_positions(self, frame, results, hand_index=0):
         """
         Get positions of all finger tips
         
         Args:
             frame: Input frame
             results: MediaPipe hand detection results
+            hand_index: Index into the detected hands
             
         Returns:
             dict: Dictionary with finger names as keys and (x, y) positions as values
         """
-        if not results.multi_hand_landmarks:
+        if not results.multi_hand_landmarks or hand_index >= len(results.multi_hand_landmarks):
             return None
         
-        # Get the first hand detected
-        hand_landmarks = results.multi_hand_landmarks[0]
+        hand_landmarks = results.multi_hand_landmarks[hand_index]
         
         # Finger tip landmark indices
         finger_tips = {
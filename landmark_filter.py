@@ -0,0 +1,181 @@
+"""
+Landmark Filter Module
+One-Euro filtering of hand landmarks with latency-compensating prediction
+
+The One-Euro filter is a low-pass filter whose cutoff rises with speed:
+a still hand is smoothed heavily (no jitter) while a fast hand is followed
+closely (little lag). All 21 landmarks are filtered in one vectorized step.
+Optionally the filtered landmarks are extrapolated along their smoothed
+velocity by the measured pipeline latency, so the game reacts to where the
+hand is now rather than where it was when the frame was captured.
+"""
+
+import math
+import numpy as np
+
+
+class OneEuroFilter:
+    """Vectorized One-Euro filter over an array of values (e.g. (21, 3) landmarks)"""
+    
+    def __init__(self, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
+        """
+        Initialize the filter
+        
+        Args:
+            min_cutoff: Cutoff frequency (Hz) when still; lower = smoother
+            beta: Cutoff increase per unit of speed; higher = less lag when moving
+            d_cutoff: Cutoff frequency (Hz) for the velocity estimate
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+    
+    def reset(self):
+        """Forget the filter state"""
+        self.value = None
+        self.velocity = None
+        self.timestamp = None
+    
+    @staticmethod
+    def _alpha(cutoff, dt):
+        """Smoothing factor of a first-order low-pass filter"""
+        return 1.0 / (1.0 + 1.0 / (2 * math.pi * cutoff * dt))
+    
+    def filter(self, values, timestamp):
+        """
+        Filter one sample
+        
+        Args:
+            values: Array of measurements (same shape every call)
+            timestamp: Sample time in seconds
+        
+        Returns:
+            np.ndarray: Filtered values (a copy)
+        """
+        values = np.asarray(values, dtype=np.float32)
+        if self.value is None:
+            self.value = values.copy()
+            self.velocity = np.zeros_like(values)
+            self.timestamp = timestamp
+            return self.value.copy()
+        
+        dt = timestamp - self.timestamp
+        if dt <= 0:
+            return self.value.copy()
+        self.timestamp = timestamp
+        
+        # Smoothed velocity of every element
+        velocity = (values - self.value) / dt
+        self.velocity += self._alpha(self.d_cutoff, dt) * (velocity - self.velocity)
+        
+        # Cutoff from the speed of each landmark (all of its coordinates share it)
+        if values.ndim > 1:
+            speed = np.linalg.norm(self.velocity, axis=-1, keepdims=True)
+        else:
+            speed = np.abs(self.velocity)
+        cutoff = self.min_cutoff + self.beta * speed
+        self.value += self._alpha(cutoff, dt) * (values - self.value)
+        return self.value.copy()
+    
+    def predict(self, horizon):
+        """
+        Extrapolate the filtered values along their smoothed velocity
+        
+        Args:
+            horizon: Seconds ahead
+        
+        Returns:
+            np.ndarray: Predicted values (None before the first sample)
+        """
+        if self.value is None:
+            return None
+        return self.value + self.velocity * horizon
+
+
+class LandmarkFilter:
+    """One-Euro filter for a hand's landmarks with optional prediction"""
+    
+    # Named settings (normalized image units); games choose one in GameLauncher.LANDMARK_FILTERS
+    PRESETS = {
+        # Strong smoothing at rest, still follows deliberate moves
+        'steady': {'min_cutoff': 1.0, 'beta': 5.0, 'prediction': 0.0},
+        # Fast swipes: light smoothing, full latency compensation
+        'responsive': {'min_cutoff': 3.0, 'beta': 20.0, 'prediction': 1.0},
+        # Soft following, close to the old Flappy Hand smoothing when slow
+        'smooth': {'min_cutoff': 2.0, 'beta': 2.0, 'prediction': 0.5},
+    }
+    
+    def __init__(self, min_cutoff=1.0, beta=5.0, d_cutoff=1.0, prediction=0.0,
+                 max_prediction=0.05, max_gap=0.25):
+        """
+        Initialize the filter
+        
+        Args:
+            min_cutoff: Cutoff frequency (Hz) of a still hand
+            beta: Cutoff increase per unit of landmark speed (frame widths per second)
+            d_cutoff: Cutoff frequency (Hz) for landmark velocities
+            prediction: Fraction of the measured latency to predict ahead (0 disables)
+            max_prediction: Longest prediction horizon in seconds
+            max_gap: Seconds without a hand after which the filter restarts
+        """
+        self.filter = OneEuroFilter(min_cutoff, beta, d_cutoff)
+        self.prediction = prediction
+        self.max_prediction = max_prediction
+        self.max_gap = max_gap
+        self.points = None
+    
+    @classmethod
+    def from_preset(cls, name, **overrides):
+        """
+        Create a filter from a named preset
+        
+        Args:
+            name: Preset name from PRESETS
+            **overrides: Settings replacing the preset's values
+        
+        Returns:
+            LandmarkFilter: New filter
+        """
+        return cls(**dict(cls.PRESETS[name], **overrides))
+    
+    def update(self, points, timestamp, latency=0.0):
+        """
+        Filter the landmarks of one frame
+        
+        Args:
+            points: (21, 3) normalized landmarks, or None when no hand is visible
+            timestamp: Capture time in seconds
+            latency: Measured capture-to-display latency in seconds
+        
+        Returns:
+            np.ndarray: Filtered (and predicted) landmarks, or None without a hand
+        """
+        one_euro = self.filter
+        if one_euro.timestamp is not None and timestamp - one_euro.timestamp > self.max_gap:
+            one_euro.reset()
+        if points is None:
+            self.points = None
+            return None
+        
+        filtered = one_euro.filter(points, timestamp)
+        if self.prediction > 0 and latency > 0:
+            filtered = one_euro.predict(min(self.prediction * latency, self.max_prediction))
+        self.points = filtered
+        return filtered
+    
+    def get_index_finger_position(self, width, height):
+        """
+        Get the filtered index finger tip in pixels
+        
+        Args:
+            width: Frame width
+            height: Frame height
+        
+        Returns:
+            tuple: (x, y), or None without a hand
+        """
+        if self.points is None:
+            return None
+        tip = self.points[8]
+        return (int(tip[0] * width), int(tip[1] * height))
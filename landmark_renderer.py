@@ -0,0 +1,127 @@
+"""
+Landmark Renderer Module
+Draws hand skeletons with batched OpenCV calls instead of per-landmark drawing
+"""
+
+import cv2
+import numpy as np
+
+
+# MediaPipe hand topology (same pairs as mp.solutions.hands.HAND_CONNECTIONS)
+HAND_CONNECTIONS = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),          # Thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),          # Index finger
+    (5, 9), (9, 10), (10, 11), (11, 12),     # Middle finger
+    (9, 13), (13, 14), (14, 15), (15, 16),   # Ring finger
+    (13, 17), (0, 17),                       # Palm
+    (17, 18), (18, 19), (19, 20),            # Pinky
+], dtype=np.intp)
+
+FINGER_TIPS = np.array([4, 8, 12, 16, 20], dtype=np.intp)
+
+
+class LandmarkRenderer:
+    """Renders hand landmarks using one polylines call per layer"""
+    
+    # Named styles (BGR colors); None disables drawing entirely
+    STYLES = {
+        'default': {
+            'connection_color': (224, 224, 224),
+            'connection_thickness': 2,
+            'point_color': (0, 0, 255),
+            'point_radius': 3,
+            'points': 'all',
+        },
+        'minimal': {
+            'connection_color': (200, 200, 200),
+            'connection_thickness': 1,
+            'point_color': (0, 255, 255),
+            'point_radius': 2,
+            'points': 'tips',
+        },
+        'fingertip': {
+            'connection_color': None,
+            'connection_thickness': 0,
+            'point_color': (255, 0, 255),
+            'point_radius': 6,
+            'points': 'index',
+        },
+        'none': None,
+    }
+    
+    def __init__(self, style='default'):
+        """
+        Initialize the renderer
+        
+        Args:
+            style: Style name from STYLES or a style dictionary
+        """
+        self.style = None
+        self.style_name = None
+        self._point_ids = None
+        self.set_style(style)
+    
+    def set_style(self, style):
+        """
+        Switch the drawing style
+        
+        Args:
+            style: Style name from STYLES, a style dictionary, or None to disable drawing
+        """
+        if isinstance(style, str):
+            self.style_name = style
+            style = self.STYLES[style]
+        else:
+            self.style_name = 'custom' if style else 'none'
+        
+        self.style = style
+        if not style:
+            self._point_ids = None
+            return
+        
+        points = style.get('points', 'all')
+        if points == 'all':
+            self._point_ids = np.arange(21, dtype=np.intp)
+        elif points == 'tips':
+            self._point_ids = FINGER_TIPS
+        elif points == 'index':
+            self._point_ids = np.array([8], dtype=np.intp)
+        else:
+            self._point_ids = None
+    
+    @property
+    def enabled(self):
+        """Whether anything is drawn with the current style"""
+        return bool(self.style)
+    
+    def draw(self, frame, points):
+        """
+        Draw one hand skeleton on the frame in place
+        
+        Args:
+            frame: Frame to draw on (BGR format)
+            points: (21, 2) array of landmark pixel coordinates
+        
+        Returns:
+            frame: The same frame
+        """
+        if not self.style:
+            return frame
+        
+        points = np.asarray(points, dtype=np.int32)
+        
+        # All connections as independent 2-point polylines in one call
+        color = self.style.get('connection_color')
+        thickness = self.style.get('connection_thickness', 0)
+        if color is not None and thickness > 0:
+            segments = points[HAND_CONNECTIONS]
+            cv2.polylines(frame, segments, False, color, thickness, cv2.LINE_AA)
+        
+        # Points as zero-length segments: thick lines have round caps
+        if self._point_ids is not None:
+            radius = self.style.get('point_radius', 2)
+            dots = points[self._point_ids][:, None, :].repeat(2, axis=1)
+            cv2.polylines(frame, dots, False, self.style['point_color'],
+                          2 * radius + 1, cv2.LINE_AA)
+        
+        return frame
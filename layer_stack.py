@@ -0,0 +1,79 @@
+"""
+Layer Stack Module
+Per-layer world tile maps of a drawing and their cached flattened composite
+
+Every layer is rasterized into its own sparse TileMap. What is shown is a
+separate flattened TileMap: the visible layers' inked pixels blended
+bottom to top with their opacity. It is recomputed only in the box a
+layer just changed (a new stroke segment, an eraser dab, an undo), or
+everywhere there is ink when a layer is shown, hidden or made more or
+less opaque. Displaying the drawing reads the flattened map alone, so the
+per-frame cost does not depend on the number of layers.
+"""
+
+import numpy as np
+from compositing import blend_layer
+from tile_map import TileMap
+
+
+class LayerStack:
+    """Sparse raster per layer plus the flattened composite of the visible ones"""
+    
+    def __init__(self, layers, background=(255, 255, 255), tile_size=128, max_resident=256):
+        """
+        Initialize empty layers
+        
+        Args:
+            layers: Layer objects bottom to top (shared with the StrokeDocument,
+                so visibility and opacity changes are seen here)
+            background: BGR background color
+            tile_size: Tile edge in pixels
+            max_resident: In-memory tiles per map before spilling to disk
+        """
+        self.layers = layers
+        self.background = tuple(background)
+        self.maps = [TileMap(tile_size, background, max_resident) for _ in layers]
+        self.flat = TileMap(tile_size, background, max_resident)
+    
+    def flatten(self, x0, y0, x1, y1):
+        """
+        Recompute the flattened composite in a box
+        
+        Args:
+            x0, y0: Top-left world corner (inclusive)
+            x1, y1: Bottom-right world corner (exclusive)
+        """
+        if x1 <= x0 or y1 <= y0:
+            return
+        out = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        out[:] = self.background
+        mask = np.empty((y1 - y0, x1 - x0), dtype=np.uint8)
+        for layer, tile_map in zip(self.layers, self.maps):
+            if not layer.visible or layer.opacity <= 0.0 or not tile_map:
+                continue
+            blend_layer(out, tile_map.read(x0, y0, x1, y1), self.background, layer.opacity, mask)
+        self.flat.write(x0, y0, out)
+    
+    def flatten_keys(self, keys):
+        """Recompute the flattened composite in some tiles"""
+        for box in self.flat.runs(keys):
+            self.flatten(*box)
+    
+    def refresh(self):
+        """Recompute the flattened composite wherever any layer or the composite has tiles"""
+        keys = self.flat.keys()
+        for tile_map in self.maps:
+            keys |= tile_map.keys()
+        self.flatten_keys(keys)
+    
+    def clear(self):
+        """Empty every layer and the composite"""
+        for tile_map in self.maps:
+            tile_map.clear()
+        self.flat.clear()
+    
+    def close(self):
+        """Release the spill files"""
+        for tile_map in self.maps:
+            tile_map.close()
+        self.flat.close()
@@ -10,7 +10,9 @@ from snake_game import SnakeGame
 from game_config import GameConfig, Difficulty
 from sound_manager import SoundManager
 from gesture_recognizer import GestureRecognizer
+from gesture_events import GestureEventBus
 from game_menu import GameMenu
+from text_sprites import put_text, get_text_size
 
 
 class SnakeVideoGame:
@@ -35,6 +37,8 @@ class SnakeVideoGame:
         
         # Initialize gesture recognizer
         self.gesture_recognizer = GestureRecognizer()
+        self.gesture_bus = GestureEventBus(self.gesture_recognizer)
+        self.menu_gestures = self.gesture_bus.subscribe(('peace',), press_delay=0.2)
         
         # Initialize snake game with difficulty settings
         speed_delay = self.config.get_difficulty_setting('snake_speed_delay')
@@ -159,7 +163,7 @@ class SnakeVideoGame:
         """Draw UI elements (score, instructions)"""
         # Draw score
         score_text = f"Score: {self.game.get_score()}"
-        cv2.putText(
+        put_text(
             frame,
             score_text,
             (10, 30),
@@ -172,7 +176,7 @@ class SnakeVideoGame:
         # Draw high score
         high_score = self.config.get_high_score()
         high_score_text = f"High Score: {high_score}"
-        cv2.putText(
+        put_text(
             frame,
             high_score_text,
             (10, 70),
@@ -185,7 +189,7 @@ class SnakeVideoGame:
         # Draw difficulty
         difficulty_name = self.config.DIFFICULTY_SETTINGS[self.config.difficulty]['name']
         difficulty_text = f"Difficulty: {difficulty_name}"
-        cv2.putText(
+        put_text(
             frame,
             difficulty_text,
             (10, 110),
@@ -198,14 +202,14 @@ class SnakeVideoGame:
         # Draw pause indicator
         if self.game.paused:
             pause_text = "PAUSED"
-            text_size = cv2.getTextSize(pause_text, cv2.FONT_HERSHEY_BOLD, 2, 3)[0]
+            text_size = get_text_size(pause_text, cv2.FONT_HERSHEY_DUPLEX, 2, 3)[0]
             text_x = (frame.shape[1] - text_size[0]) // 2
             text_y = 50
-            cv2.putText(
+            put_text(
                 frame,
                 pause_text,
                 (text_x, text_y),
-                cv2.FONT_HERSHEY_BOLD,
+                cv2.FONT_HERSHEY_DUPLEX,
                 2,
                 (0, 255, 255),
                 3
@@ -220,7 +224,7 @@ class SnakeVideoGame:
         
         y_pos = frame.shape[0] - 80
         for instruction in instructions:
-            cv2.putText(
+            put_text(
                 frame,
                 instruction,
                 (10, y_pos),
@@ -234,7 +238,7 @@ class SnakeVideoGame:
         # Draw game over message
         if self.game.is_game_over():
             game_over_text = "GAME OVER!"
-            text_size = cv2.getTextSize(
+            text_size = get_text_size(
                 game_over_text,
                 cv2.FONT_HERSHEY_SIMPLEX,
                 2,
@@ -252,7 +256,7 @@ class SnakeVideoGame:
                 -1
             )
             
-            cv2.putText(
+            put_text(
                 frame,
                 game_over_text,
                 (text_x, text_y),
@@ -266,7 +270,7 @@ class SnakeVideoGame:
             score = self.game.get_score()
             if score > 0 and score == self.config.get_high_score():
                 new_high_text = "NEW HIGH SCORE!"
-                cv2.putText(
+                put_text(
                     frame,
                     new_high_text,
                     (text_x - 50, text_y + 50),
@@ -295,15 +299,15 @@ class SnakeVideoGame:
             # Find hands in the frame
             frame, results = self.hand_tracker.find_hands(frame, draw=True)
             
-            # Check for gestures
-            if results.multi_hand_landmarks:
-                gesture = self.gesture_recognizer.recognize_gesture(results.multi_hand_landmarks[0])
-                if gesture == "peace":
-                    # Peace sign toggles menu
-                    if not self.menu_active:
-                        self.menu_active = True
-                        self.menu_type = 'main'
-                        self.sound_manager.play_menu_sound()
+            # Check for gestures (classified once per frame)
+            hand = results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None
+            self.gesture_bus.process(hand, self.hand_tracker.get_handedness(results))
+            for event in self.menu_gestures.poll():
+                if event.kind == 'press' and not self.menu_active:
+                    # Peace sign opens the menu
+                    self.menu_active = True
+                    self.menu_type = 'main'
+                    self.sound_manager.play_menu_sound()
             
             # Handle menu
             if self.menu_active:
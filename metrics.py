@@ -0,0 +1,308 @@
+"""
+Metrics Module
+Counters and histograms exposed in Prometheus text format over HTTP
+
+The game loop is the only writer. Updates are plain integer/float
+increments on objects created up front (no locks, no per-frame
+allocation of metric objects); the HTTP thread only reads them.
+"""
+
+import os
+import sys
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _format_labels(names, values, extra=None):
+    """Format a Prometheus label set"""
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    """Format a sample value"""
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+    """One labelled counter series"""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0
+    
+    def inc(self, amount=1):
+        """Increase the counter"""
+        self.value += amount
+
+
+class _HistogramChild:
+    """One labelled histogram series"""
+    
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+    
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value):
+        """Record one observation"""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Counter:
+    """Monotonic counter, optionally with a fixed set of label values"""
+    
+    TYPE = 'counter'
+    
+    def __init__(self, name, documentation, label_names=(), label_values=(), callback=None):
+        """
+        Args:
+            name: Metric name
+            documentation: HELP text
+            label_names: Label names (e.g. ('game',))
+            label_values: All label value tuples, created up front
+            callback: Function returning the value at scrape time (unlabelled only)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.callback = callback
+        self._children = {}
+        if self.label_names:
+            for values in label_values:
+                values = values if isinstance(values, tuple) else (values,)
+                self._children[values] = self._new_child()
+        else:
+            self._children[()] = self._new_child()
+        self._default = self._children.get(())
+    
+    def _new_child(self):
+        return _CounterChild()
+    
+    def labels(self, *values):
+        """Get the series for the given label values"""
+        return self._children[values]
+    
+    def inc(self, amount=1):
+        """Increase an unlabelled counter"""
+        self._default.value += amount
+    
+    def samples(self):
+        """Yield (suffix, labels, value) samples"""
+        if self.callback is not None:
+            yield '', '', self.callback()
+            return
+        for values, child in self._children.items():
+            yield '', _format_labels(self.label_names, values), child.value
+
+
+class Gauge(Counter):
+    """Value that can go up and down, usually read from a callback"""
+    
+    TYPE = 'gauge'
+    
+    def set(self, value):
+        """Set an unlabelled gauge"""
+        self._default.value = value
+
+
+class Histogram(Counter):
+    """Cumulative histogram with fixed bucket bounds"""
+    
+    TYPE = 'histogram'
+    
+    # Seconds; suits frame times and stage latencies around 30 FPS
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.02, 0.033, 0.05, 0.1, 0.25, 0.5, 1.0)
+    
+    def __init__(self, name, documentation, buckets=DEFAULT_BUCKETS, label_names=(), label_values=()):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, label_names, label_values)
+    
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+    
+    def observe(self, value):
+        """Record an observation on an unlabelled histogram"""
+        self._default.observe(value)
+    
+    def samples(self):
+        """Yield bucket, sum and count samples"""
+        for values, child in self._children.items():
+            cumulative = 0
+            counts = list(child.counts)
+            for bound, count in zip(self.bounds + (float('inf'),), counts):
+                cumulative += count
+                labels = _format_labels(self.label_names, values, ('le', _format_value(bound)))
+                yield '_bucket', labels, cumulative
+            labels = _format_labels(self.label_names, values)
+            yield '_sum', labels, child.sum
+            yield '_count', labels, child.count
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together"""
+    
+    def __init__(self):
+        self.metrics = []
+    
+    def register(self, metric):
+        """Add a metric and return it"""
+        self.metrics.append(metric)
+        return metric
+    
+    def render(self):
+        """
+        Render all metrics in the Prometheus text exposition format
+        
+        Returns:
+            str: Exposition text
+        """
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{labels} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves /metrics"""
+    
+    def do_GET(self):
+        if self.path != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+        pass
+
+
+class MetricsServer:
+    """Background HTTP server for a MetricsRegistry"""
+    
+    def __init__(self, registry, host='127.0.0.1', port=9100):
+        """
+        Start serving metrics
+        
+        Args:
+            registry: MetricsRegistry to expose
+            host: Interface to bind
+            port: TCP port (0 picks a free port)
+        """
+        self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.registry = registry
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"Metrics at http://{self.host}:{self.port}/metrics")
+    
+    def close(self):
+        """Stop the server"""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def get_rss_bytes():
+    """
+    Get the resident set size of this process
+    
+    Returns:
+        int: RSS in bytes (peak RSS where current RSS is unavailable)
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        if resource is None:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class GameMetrics:
+    """Metrics recorded by the game launcher"""
+    
+    STAGES = ('capture', 'tracking', 'game', 'output', 'display')
+    
+    def __init__(self, games, dropped_frames_callback=None):
+        """
+        Create all metric series up front
+        
+        Args:
+            games: Game keys used as label values
+            dropped_frames_callback: Function returning total dropped frames
+        """
+        self.registry = MetricsRegistry()
+        register = self.registry.register
+        
+        self.frame_seconds = register(Histogram(
+            'game_frame_seconds', 'Time to produce one frame'))
+        self.stage_seconds = register(Histogram(
+            'game_stage_seconds', 'Time spent per pipeline stage',
+            label_names=('stage',), label_values=self.STAGES))
+        self.tracker_frames = register(Counter(
+            'tracker_frames_total', 'Frames processed by the hand tracker'))
+        self.tracker_detections = register(Counter(
+            'tracker_detections_total', 'Frames with at least one hand detected'))
+        self.gesture_attempts = register(Counter(
+            'gesture_attempts_total', 'Frames passed to the gesture recognizer'))
+        self.gesture_recognitions = register(Counter(
+            'gesture_recognitions_total', 'Frames where a gesture was recognized'))
+        self.dropped_frames = register(Counter(
+            'dropped_frames_total', 'Frames dropped by the recorder',
+            callback=dropped_frames_callback or (lambda: 0)))
+        self.game_starts = register(Counter(
+            'game_starts_total', 'Games started', label_names=('game',), label_values=games))
+        self.game_overs = register(Counter(
+            'game_overs_total', 'Games ended', label_names=('game',), label_values=games))
+        self.config_save_seconds = register(Histogram(
+            'config_save_seconds', 'GameConfig save latency',
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)))
+        self.memory_rss = register(Gauge(
+            'process_resident_memory_bytes', 'Resident memory size', callback=get_rss_bytes))
+        
+        # Stage series looked up once so the frame loop only does attribute access
+        self.capture_stage = self.stage_seconds.labels('capture')
+        self.tracking_stage = self.stage_seconds.labels('tracking')
+        self.game_stage = self.stage_seconds.labels('game')
+        self.output_stage = self.stage_seconds.labels('output')
+        self.display_stage = self.stage_seconds.labels('display')
+        
+        self.server = None
+    
+    def start_server(self, host='127.0.0.1', port=9100):
+        """Expose the metrics on http://host:port/metrics"""
+        self.server = MetricsServer(self.registry, host, port)
+    
+    def close(self):
+        """Stop the metrics server"""
+        if self.server:
+            self.server.close()
@@ -0,0 +1,243 @@
+"""
+Player Hands Module
+Keeps a stable player identity for each detected hand across frames
+
+MediaPipe reports hands in no particular order, so `multi_hand_landmarks[0]`
+can be either player from one frame to the next. PlayerHands matches each
+detection to the player slot whose palm was nearest last frame (with a
+penalty when the handedness label disagrees). A new hand takes the free
+slot whose home half of the screen it appears in, so in a two-player game
+the player on the left is always player 1.
+
+    python player_hands.py            # per-frame cost for 1 to 4 hands
+"""
+
+import argparse
+import time
+import numpy as np
+from gesture_classifier import landmarks_to_points
+
+
+PALM_CENTER = 9
+INDEX_TIP = 8
+
+
+class PlayerHand:
+    """Tracking state of one player's hand"""
+    
+    def __init__(self, player):
+        """
+        Args:
+            player: Player index (0 = player 1)
+        """
+        self.player = player
+        self.present = False
+        self.landmarks = None
+        self.points = None
+        self.handedness = None
+        self.last_seen = None
+        self.gesture = None
+        self.confidence = None
+    
+    def get_index_finger_position(self, width, height):
+        """
+        Get the index finger tip in pixels
+        
+        Args:
+            width: Frame width
+            height: Frame height
+        
+        Returns:
+            tuple: (x, y), or None if the hand is not visible this frame
+        """
+        if not self.present:
+            return None
+        tip = self.points[INDEX_TIP]
+        return (int(tip[0] * width), int(tip[1] * height))
+
+
+class PlayerHands:
+    """Assigns detected hands to player slots that stay stable across frames"""
+    
+    def __init__(self, num_players=2, max_distance=0.3, handedness_penalty=0.1, max_missing=0.5):
+        """
+        Initialize the slots
+        
+        Args:
+            num_players: Number of player slots
+            max_distance: Largest palm movement between frames (fraction of the
+                frame) that still counts as the same hand
+            handedness_penalty: Cost added when the handedness label changed
+            max_missing: Seconds a slot keeps its hand after it disappears
+        """
+        self.num_players = num_players
+        self.max_distance = max_distance
+        self.handedness_penalty = handedness_penalty
+        self.max_missing = max_missing
+        self.hands = [PlayerHand(i) for i in range(num_players)]
+        
+        # Last palm position per slot and each slot's home x (its screen share)
+        self._palms = np.zeros((num_players, 2), dtype=np.float32)
+        self._homes = (np.arange(num_players, dtype=np.float32) + 0.5) / num_players
+    
+    def reset(self):
+        """Forget all hands"""
+        self.hands = [PlayerHand(i) for i in range(self.num_players)]
+    
+    def update(self, results, timestamp=None, recognizer=None):
+        """
+        Assign this frame's hands to players
+        
+        Args:
+            results: MediaPipe (or remote) hand results
+            timestamp: Capture time in seconds (now if None)
+            recognizer: GestureRecognizer to classify each visible hand (optional)
+        
+        Returns:
+            list: PlayerHand per player (check `present`)
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        
+        detections = results.multi_hand_landmarks or []
+        labels = [None] * len(detections)
+        if results.multi_handedness:
+            for i, handedness in enumerate(results.multi_handedness[:len(detections)]):
+                labels[i] = handedness.classification[0].label
+        
+        hands = self.hands
+        for hand in hands:
+            hand.present = False
+            if hand.last_seen is not None and timestamp - hand.last_seen > self.max_missing:
+                hand.last_seen = None
+        
+        if detections:
+            points = np.stack([landmarks_to_points(landmarks) for landmarks in detections])
+            palms = points[:, PALM_CENTER, :2]
+            assignment = self._assign(palms, labels)
+            
+            for detection, player in enumerate(assignment):
+                if player is None:
+                    continue
+                hand = hands[player]
+                hand.present = True
+                hand.landmarks = detections[detection]
+                hand.points = points[detection]
+                hand.handedness = labels[detection]
+                hand.last_seen = timestamp
+                self._palms[player] = palms[detection]
+        
+        for hand in hands:
+            if not hand.present:
+                hand.gesture = None
+                hand.confidence = None
+            elif recognizer is not None:
+                hand.gesture = recognizer.classify(hand.landmarks, hand.handedness)
+                hand.confidence = recognizer.confidence
+        
+        return hands
+    
+    def _assign(self, palms, labels):
+        """
+        Match detections to slots
+        
+        Args:
+            palms: (N, 2) palm positions of the detections
+            labels: Handedness label per detection
+        
+        Returns:
+            list: Player index per detection (None if no slot is left)
+        """
+        hands = self.hands
+        known = np.array([hand.last_seen is not None for hand in hands])
+        assignment = [None] * len(palms)
+        taken = np.zeros(self.num_players, dtype=bool)
+        
+        # Known slots: nearest palms first, within max_distance
+        if known.any():
+            cost = np.linalg.norm(palms[:, None, :] - self._palms[None, :, :], axis=2)
+            slot_labels = [hand.handedness for hand in hands]
+            for d, label in enumerate(labels):
+                for p, slot_label in enumerate(slot_labels):
+                    if label and slot_label and label != slot_label:
+                        cost[d, p] += self.handedness_penalty
+            cost[:, ~known] = np.inf
+            cost[cost > self.max_distance] = np.inf
+            
+            for flat in np.argsort(cost, axis=None):
+                d, p = divmod(int(flat), self.num_players)
+                if not np.isfinite(cost[d, p]):
+                    break
+                if assignment[d] is None and not taken[p]:
+                    assignment[d] = p
+                    taken[p] = True
+        
+        # New hands: the free slot whose home is closest to the palm
+        for d in range(len(palms)):
+            if assignment[d] is not None:
+                continue
+            free = ~taken & ~known
+            if not free.any():
+                free = ~taken
+            if not free.any():
+                break
+            distance = np.where(free, np.abs(self._homes - palms[d, 0]), np.inf)
+            p = int(np.argmin(distance))
+            assignment[d] = p
+            taken[p] = True
+        
+        return assignment
+
+
+def benchmark(max_hands=4, frames=2000, recognizer=None):
+    """
+    Measure the per-frame cost of player assignment (and gestures) by hand count
+    
+    Args:
+        max_hands: Largest number of hands to time
+        frames: Frames per measurement
+        recognizer: GestureRecognizer for per-hand gestures (rules if None)
+    
+    Returns:
+        list: (hands, microseconds per frame) tuples
+    """
+    from gesture_recognizer import GestureRecognizer
+    from remote_landmarks import RemoteResults
+    
+    recognizer = recognizer or GestureRecognizer()
+    rng = np.random.default_rng(0)
+    base = rng.random((max_hands, 21, 3), dtype=np.float32) * 0.2
+    base[:, :, 0] += np.linspace(0.05, 0.75, max_hands)[:, None]
+    
+    timings = []
+    for count in range(1, max_hands + 1):
+        tracker = PlayerHands(count)
+        # Hands drift a little each frame, like real tracking jitter
+        drift = rng.normal(0, 0.002, (frames, count, 1, 3)).astype(np.float32)
+        frame_results = [
+            RemoteResults(list(base[:count] + drift[i]), ['Right'] * count, [1.0] * count)
+            for i in range(frames)
+        ]
+        start = time.perf_counter()
+        for i, results in enumerate(frame_results):
+            tracker.update(results, i / 30.0, recognizer)
+        timings.append((count, (time.perf_counter() - start) / frames * 1e6))
+    return timings
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark per-hand player tracking")
+    parser.add_argument('--hands', type=int, default=4, help="Largest number of hands")
+    parser.add_argument('--frames', type=int, default=2000, help="Frames per measurement")
+    args = parser.parse_args()
+    
+    timings = benchmark(args.hands, args.frames)
+    single = timings[0][1]
+    for count, micros in timings:
+        print(f"{count} hand(s): {micros:7.1f} us/frame  {micros / count:6.1f} us/hand  "
+              f"{micros / single:4.2f}x one hand")
+
+
+if __name__ == "__main__":
+    main()
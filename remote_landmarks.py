@@ -0,0 +1,515 @@
+"""
+Remote Landmarks Module
+Sends hand landmarks between processes or hosts with a compact binary protocol
+
+Packet layout (little endian):
+    header: magic 'HL' (2s), version (B), hand count (B), frame id (I), timestamp (d)
+    per hand: handedness (B: 0 left, 1 right, 255 unknown), score (B, 0-255),
+              21 x (x, y, z) quantized to uint16
+"""
+
+import argparse
+import os
+import socket
+import struct
+import threading
+import time
+import cv2
+import numpy as np
+from landmark_renderer import LandmarkRenderer
+
+
+MAGIC = b'HL'
+VERSION = 1
+HEADER = struct.Struct('<2sBBId')
+HAND_HEADER = struct.Struct('<BB')
+NUM_LANDMARKS = 21
+HAND_SIZE = HAND_HEADER.size + NUM_LANDMARKS * 3 * 2
+
+# Quantization ranges for normalized coordinates (x, y may leave [0, 1] slightly)
+QUANT_LOW = np.array([-0.25, -0.25, -0.5], dtype=np.float32)
+QUANT_HIGH = np.array([1.25, 1.25, 0.5], dtype=np.float32)
+QUANT_SCALE = 65535.0 / (QUANT_HIGH - QUANT_LOW)
+
+HANDEDNESS_CODES = {'Left': 0, 'Right': 1}
+HANDEDNESS_LABELS = {0: 'Left', 1: 'Right'}
+
+
+def parse_address(address):
+    """
+    Parse a transport address
+    
+    Args:
+        address: 'udp:host:port' or 'unix:/path/to/socket'
+    
+    Returns:
+        tuple: (socket family, socket address)
+    """
+    kind, _, rest = address.partition(':')
+    if kind == 'udp':
+        host, _, port = rest.rpartition(':')
+        return socket.AF_INET, (host or '127.0.0.1', int(port))
+    if kind == 'unix':
+        return socket.AF_UNIX, rest
+    raise ValueError(f"Unsupported landmark address: {address}")
+
+
+def encode_packet(frame_id, timestamp, hands, handedness=None, scores=None):
+    """
+    Encode one frame of landmarks
+    
+    Args:
+        frame_id: Sender frame counter
+        timestamp: Sender capture time in seconds
+        hands: List of (21, 3) normalized landmark arrays
+        handedness: Optional list of 'Left'/'Right' labels
+        scores: Optional list of handedness scores (0-1)
+    
+    Returns:
+        bytes: Encoded packet
+    """
+    parts = [HEADER.pack(MAGIC, VERSION, len(hands), frame_id & 0xFFFFFFFF, timestamp)]
+    for i, points in enumerate(hands):
+        label = handedness[i] if handedness else None
+        score = scores[i] if scores else 1.0
+        parts.append(HAND_HEADER.pack(HANDEDNESS_CODES.get(label, 255),
+                                      int(max(0.0, min(1.0, score)) * 255)))
+        quantized = (np.clip(points[:, :3], QUANT_LOW, QUANT_HIGH) - QUANT_LOW) * QUANT_SCALE
+        parts.append(np.rint(quantized).astype('<u2').tobytes())
+    return b''.join(parts)
+
+
+def decode_packet(data):
+    """
+    Decode a packet produced by encode_packet
+    
+    Args:
+        data: Packet bytes
+    
+    Returns:
+        tuple: (frame_id, timestamp, hands, handedness, scores), or None if invalid
+    """
+    if len(data) < HEADER.size:
+        return None
+    magic, version, count, frame_id, timestamp = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or len(data) != HEADER.size + count * HAND_SIZE:
+        return None
+    
+    hands, handedness, scores = [], [], []
+    offset = HEADER.size
+    for _ in range(count):
+        code, score = HAND_HEADER.unpack_from(data, offset)
+        offset += HAND_HEADER.size
+        quantized = np.frombuffer(data, dtype='<u2', count=NUM_LANDMARKS * 3, offset=offset)
+        offset += NUM_LANDMARKS * 3 * 2
+        points = quantized.reshape(NUM_LANDMARKS, 3).astype(np.float32) / QUANT_SCALE + QUANT_LOW
+        hands.append(points)
+        handedness.append(HANDEDNESS_LABELS.get(code))
+        scores.append(score / 255.0)
+    return frame_id, timestamp, hands, handedness, scores
+
+
+class _Landmark:
+    """Landmark with MediaPipe-style x, y, z attributes"""
+    
+    __slots__ = ('x', 'y', 'z')
+    
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class _HandLandmarks:
+    """Hand with a MediaPipe-style `landmark` list"""
+    
+    def __init__(self, points):
+        self.points = points
+        self.landmark = [_Landmark(float(x), float(y), float(z)) for x, y, z in points]
+
+
+class _Category:
+    """MediaPipe-style classification entry"""
+    
+    def __init__(self, label, score):
+        self.label = label
+        self.score = score
+
+
+class _Handedness:
+    """MediaPipe-style handedness with a `classification` list"""
+    
+    def __init__(self, label, score):
+        self.classification = [_Category(label, score)]
+
+
+class RemoteResults:
+    """Stand-in for MediaPipe hand results built from a received packet"""
+    
+    def __init__(self, hands=(), handedness=(), scores=(), frame_id=None, timestamp=None):
+        """
+        Args:
+            hands: List of (21, 3) normalized landmark arrays
+            handedness: List of 'Left'/'Right' labels (None if unknown)
+            scores: List of handedness scores
+            frame_id: Sender frame id
+            timestamp: Sender timestamp
+        """
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self.multi_hand_landmarks = [_HandLandmarks(p) for p in hands] or None
+        self.multi_handedness = [
+            _Handedness(label, score) for label, score in zip(handedness, scores)
+        ] or None
+
+
+class LandmarkSender:
+    """Runs a HandTracker on a camera and streams landmarks to a receiver"""
+    
+    def __init__(self, address, hand_tracker=None, camera_index=0, mirror=True,
+                 profile='two_hands'):
+        """
+        Initialize the sender
+        
+        Args:
+            address: Receiver address ('udp:host:port' or 'unix:/path')
+            hand_tracker: HandTracker instance (created from profile if None)
+            camera_index: Camera to capture from
+            mirror: Flip frames horizontally like the game does
+            profile: HandTracker profile for the created tracker (the default
+                tracks two hands so versus games work remotely)
+        """
+        if hand_tracker is None:
+            from hand_tracker import HandTracker
+            hand_tracker = HandTracker.from_profile(profile, landmark_style=None)
+        
+        self.hand_tracker = hand_tracker
+        self.camera_index = camera_index
+        self.mirror = mirror
+        self.family, self.address = parse_address(address)
+        self.sock = socket.socket(self.family, socket.SOCK_DGRAM)
+        self.frame_id = 0
+    
+    def send_results(self, results, timestamp=None):
+        """
+        Send one frame of MediaPipe results
+        
+        Args:
+            results: MediaPipe hand detection results
+            timestamp: Capture time (time.time() if None)
+        """
+        hands, handedness, scores = [], [], []
+        if results.multi_hand_landmarks:
+            for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
+                hands.append(self.hand_tracker.landmarks_to_array(hand_landmarks))
+                if results.multi_handedness:
+                    category = results.multi_handedness[i].classification[0]
+                    handedness.append(category.label)
+                    scores.append(category.score)
+        
+        packet = encode_packet(self.frame_id, timestamp or time.time(), hands,
+                               handedness or None, scores or None)
+        try:
+            self.sock.sendto(packet, self.address)
+        except OSError:
+            # Receiver not listening yet: datagrams are fire-and-forget
+            pass
+        self.frame_id += 1
+    
+    def run(self, show_preview=False):
+        """
+        Capture, track and send until interrupted
+        
+        Args:
+            show_preview: Show the camera with landmarks in a window
+        """
+        cap = cv2.VideoCapture(self.camera_index)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        if show_preview:
+            self.hand_tracker.set_landmark_style('default')
+        
+        print(f"Sending landmarks to {self.address}")
+        try:
+            while True:
+                success, frame = cap.read()
+                if not success:
+                    print("Failed to read from webcam")
+                    break
+                timestamp = time.time()
+                if self.mirror:
+                    frame = cv2.flip(frame, 1)
+                
+                frame, results = self.hand_tracker.find_hands(frame, draw=show_preview)
+                self.send_results(results, timestamp)
+                
+                if show_preview:
+                    cv2.imshow("Landmark Sender", frame)
+                    if cv2.waitKey(1) & 0xFF in (ord('q'), ord('Q')):
+                        break
+        finally:
+            cap.release()
+            self.close()
+            if show_preview:
+                cv2.destroyAllWindows()
+    
+    def close(self):
+        """Release resources"""
+        self.sock.close()
+        self.hand_tracker.close()
+
+
+class LandmarkReceiver:
+    """
+    Receives landmark packets on a background thread with a jitter buffer
+    
+    Packets are held for `playout_delay` seconds (in sender time, after
+    estimating the clock offset) so that uneven network delivery becomes
+    evenly spaced playout. Late or duplicate packets are discarded, gaps in
+    frame ids are counted as lost, and the last hand is held for `hold_time`
+    seconds before it is reported as gone. A frame id far behind the newest
+    one, or a sender clock that jumps, means the sender restarted: the
+    stream state is reset and playout continues from the new packets.
+    """
+    
+    def __init__(self, address, playout_delay=0.03, hold_time=0.2, buffer_size=16,
+                 restart_gap=64, resync_time=2.0):
+        """
+        Initialize the receiver
+        
+        Args:
+            address: Address to listen on ('udp:host:port' or 'unix:/path')
+            playout_delay: Jitter buffer delay in seconds (0 for newest-wins)
+            hold_time: Seconds to keep the last hand when packets stop arriving
+            buffer_size: Maximum packets held in the jitter buffer
+            restart_gap: Frame ids this far behind the newest mean a sender restart
+            resync_time: Seconds the sender clock may jump before the stream is reset
+        """
+        self.playout_delay = playout_delay
+        self.hold_time = hold_time
+        self.buffer_size = buffer_size
+        self.restart_gap = restart_gap
+        self.resync_time = resync_time
+        
+        self.family, self.address = parse_address(address)
+        if self.family == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)
+        self.sock = socket.socket(self.family, socket.SOCK_DGRAM)
+        self.sock.bind(self.address)
+        self.sock.settimeout(0.5)
+        
+        self._lock = threading.Lock()
+        self._buffer = []          # (frame_id, timestamp, hands, handedness, scores)
+        self._clock_offset = None  # local receive time - sender timestamp (minimum seen)
+        self._last_delivered = None
+        self._last_delivered_time = 0.0
+        self._current = RemoteResults()
+        
+        # Statistics
+        self.packets_received = 0
+        self.packets_late = 0
+        self.packets_lost = 0
+        self.stream_restarts = 0
+        self._highest_id = None
+        self._missing = set()      # Ids skipped by a gap that may still arrive late
+        
+        self.running = True
+        self._thread = threading.Thread(target=self._receive_loop, daemon=True)
+        self._thread.start()
+    
+    def _receive_loop(self):
+        """Receive and buffer packets"""
+        while self.running:
+            try:
+                data = self.sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            
+            packet = decode_packet(data)
+            if packet is None:
+                continue
+            frame_id, timestamp = packet[0], packet[1]
+            now = time.time()
+            
+            with self._lock:
+                self.packets_received += 1
+                offset = now - timestamp
+                if self._is_restart(frame_id, offset):
+                    self._reset_stream()
+                if self._clock_offset is None or offset < self._clock_offset:
+                    self._clock_offset = offset
+                
+                if self._highest_id is not None:
+                    if frame_id <= self._highest_id:
+                        # Anything not inside a gap was already received: a duplicate
+                        if frame_id not in self._missing:
+                            continue
+                        # Reordered: it was counted as lost when the gap appeared
+                        self._missing.discard(frame_id)
+                        self.packets_late += 1
+                        self.packets_lost -= 1
+                        if self._last_delivered is not None and frame_id <= self._last_delivered:
+                            continue
+                    else:
+                        self.packets_lost += frame_id - self._highest_id - 1
+                        oldest = frame_id - self.restart_gap
+                        self._missing.update(range(max(self._highest_id + 1, oldest), frame_id))
+                        self._missing = {i for i in self._missing if i >= oldest}
+                        self._highest_id = frame_id
+                else:
+                    self._highest_id = frame_id
+                
+                self._buffer.append(packet)
+                self._buffer.sort(key=lambda p: p[0])
+                del self._buffer[:-self.buffer_size]
+    
+    def _is_restart(self, frame_id, offset):
+        """Check whether a packet comes from a restarted sender (frame ids or clock jumped)"""
+        if self._highest_id is None:
+            return False
+        if frame_id < self._highest_id - self.restart_gap:
+            return True
+        return abs(offset - self._clock_offset) > self.resync_time
+    
+    def _reset_stream(self):
+        """Forget the old sender's frame ids, clock offset and buffered packets"""
+        self.stream_restarts += 1
+        self._highest_id = None
+        self._missing = set()
+        self._last_delivered = None
+        self._clock_offset = None
+        self._buffer = []
+    
+    def get_results(self):
+        """
+        Get the landmarks due for playout now
+        
+        Returns:
+            RemoteResults: Results in MediaPipe shape (no hands if none/expired)
+        """
+        now = time.time()
+        with self._lock:
+            if self._buffer and self._clock_offset is not None:
+                playout_time = now - self._clock_offset - self.playout_delay
+                due = [p for p in self._buffer if p[1] <= playout_time]
+                if due:
+                    frame_id, timestamp, hands, handedness, scores = due[-1]
+                    self._buffer = [p for p in self._buffer if p[0] > frame_id]
+                    self._last_delivered = frame_id
+                    self._last_delivered_time = now
+                    self._current = RemoteResults(hands, handedness, scores, frame_id, timestamp)
+            
+            if (self._current.multi_hand_landmarks
+                    and now - self._last_delivered_time > self.hold_time):
+                self._current = RemoteResults()
+            
+            return self._current
+    
+    def close(self):
+        """Stop receiving and release the socket"""
+        self.running = False
+        self.sock.close()
+        self._thread.join(timeout=1)
+        if self.family == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)
+
+
+class RemoteHandTracker:
+    """Drop-in replacement for HandTracker that reads landmarks from a LandmarkReceiver"""
+    
+    def __init__(self, address, landmark_style='default', **receiver_options):
+        """
+        Initialize the remote tracker
+        
+        Args:
+            address: Address to listen on ('udp:host:port' or 'unix:/path')
+            landmark_style: LandmarkRenderer style used when drawing
+            **receiver_options: Passed to LandmarkReceiver
+        """
+        self.receiver = LandmarkReceiver(address, **receiver_options)
+        self.renderer = LandmarkRenderer(landmark_style)
+    
+    def find_hands(self, frame, draw=True):
+        """
+        Get the latest remote hands (same signature as HandTracker.find_hands)
+        
+        Args:
+            frame: Current frame (used for drawing only)
+            draw: Whether to draw hand landmarks on the frame
+        
+        Returns:
+            frame: Frame with drawn landmarks (if draw=True)
+            results: RemoteResults
+        """
+        results = self.receiver.get_results()
+        if draw and self.renderer.enabled and results.multi_hand_landmarks:
+            h, w = frame.shape[:2]
+            scale = np.array([w, h], dtype=np.float32)
+            for hand_landmarks in results.multi_hand_landmarks:
+                self.renderer.draw(frame, hand_landmarks.points[:, :2] * scale)
+        return frame, results
+    
+    def set_landmark_style(self, style):
+        """Change how landmarks are drawn by find_hands"""
+        self.renderer.set_style(style)
+    
+    @staticmethod
+    def landmarks_to_array(hand_landmarks):
+        """Return the (21, 3) normalized landmark array of a remote hand"""
+        return hand_landmarks.points
+    
+    @staticmethod
+    def get_handedness(results, hand_index=0):
+        """Get the 'Left'/'Right' label of a remote hand (None if unavailable)"""
+        if not results.multi_handedness or hand_index >= len(results.multi_handedness):
+            return None
+        return results.multi_handedness[hand_index].classification[0].label
+    
+    def get_index_finger_position(self, frame, results, hand_index=0):
+        """Get the index finger tip of a remote hand in pixels"""
+        if not results.multi_hand_landmarks or hand_index >= len(results.multi_hand_landmarks):
+            return None
+        h, w = frame.shape[:2]
+        tip = results.multi_hand_landmarks[hand_index].points[8]
+        return (int(tip[0] * w), int(tip[1] * h))
+    
+    def get_all_finger_positions(self, frame, results, hand_index=0):
+        """Get all finger tips of a remote hand in pixels"""
+        if not results.multi_hand_landmarks or hand_index >= len(results.multi_hand_landmarks):
+            return None
+        h, w = frame.shape[:2]
+        points = results.multi_hand_landmarks[hand_index].points
+        finger_tips = {'thumb': 4, 'index': 8, 'middle': 12, 'ring': 16, 'pinky': 20}
+        return {
+            name: (int(points[i][0] * w), int(points[i][1] * h))
+            for name, i in finger_tips.items()
+        }
+    
+    def close(self):
+        """Release resources"""
+        self.receiver.close()
+
+
+def main():
+    """Run a landmark sender: python remote_landmarks.py udp:192.168.1.20:5005"""
+    from hand_tracker import HandTracker
+    
+    parser = argparse.ArgumentParser(description="Stream hand landmarks to a game host")
+    parser.add_argument('address', help="Receiver address, e.g. udp:127.0.0.1:5005 or unix:/tmp/hands.sock")
+    parser.add_argument('--camera', type=int, default=0, help="Camera index")
+    parser.add_argument('--preview', action='store_true', help="Show a preview window")
+    parser.add_argument('--profile', default='two_hands', choices=list(HandTracker.PROFILES),
+                        help="Tracker profile (model, confidences, max hands, inference scale)")
+    args = parser.parse_args()
+    
+    try:
+        sender = LandmarkSender(args.address, camera_index=args.camera, profile=args.profile)
+        sender.run(show_preview=args.preview)
+    except KeyboardInterrupt:
+        print("\nSender stopped")
+
+
+if __name__ == "__main__":
+    main()
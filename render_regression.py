@@ -0,0 +1,437 @@
+"""
+Render Regression Module
+Golden-frame regression harness and draw timings for game rendering
+
+Each scene builds a fixed game state (seeded RNG, scripted input), draws it
+onto a fixed synthetic background and compares the result with a stored PNG
+in golden/. The same run times every draw call, so a render optimization can
+be checked for correctness and measured at once.
+
+Usage:
+    python render_regression.py              # compare against golden frames and time draws
+    python render_regression.py --update     # rewrite golden frames
+    python render_regression.py --scenes snake_playing menu_main
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+import cv2
+import numpy as np
+from arcade_host import PooledHandTracker
+from game_launcher import GameLauncher
+from game_menu import GameMenu
+from game_config import Difficulty
+
+
+def make_background(width=1280, height=720):
+    """
+    Build the fixed background frame all scenes are drawn on
+    
+    A smooth gradient with a few solid shapes stands in for a camera image:
+    it exercises blending without making golden PNGs large.
+    
+    Args:
+        width: Frame width
+        height: Frame height
+    
+    Returns:
+        numpy.ndarray: BGR frame
+    """
+    x = np.linspace(0, 1, width, dtype=np.float32)[None, :]
+    y = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:, :, 0] = (60 + 120 * x * (1 - y)).astype(np.uint8)
+    frame[:, :, 1] = (80 + 90 * y).astype(np.uint8)
+    frame[:, :, 2] = (100 + 100 * (1 - x) * y).astype(np.uint8)
+    
+    cv2.rectangle(frame, (width // 10, height // 2), (width // 4, height - 40), (40, 70, 110), -1)
+    cv2.circle(frame, (3 * width // 4, height // 3), height // 6, (170, 160, 150), -1)
+    cv2.ellipse(frame, (width // 2, height), (width // 6, height // 4), 0, 180, 360,
+                (90, 120, 170), -1)
+    return frame
+
+
+def compare_frames(actual, expected, tolerance=0):
+    """
+    Compare a rendered frame with its golden frame
+    
+    Args:
+        actual: Rendered frame
+        expected: Golden frame
+        tolerance: Largest per-channel difference still counted as equal
+    
+    Returns:
+        tuple: (mismatch fraction, max channel difference, diff image)
+    """
+    if actual.shape != expected.shape:
+        return 1.0, 255, None
+    
+    difference = cv2.absdiff(actual, expected).max(axis=2)
+    mismatched = difference > tolerance
+    
+    # Diff image: dimmed golden frame with mismatched pixels in red
+    diff_image = (expected // 3).astype(np.uint8)
+    diff_image[mismatched] = (0, 0, 255)
+    return float(mismatched.mean()), int(difference.max()), diff_image
+
+
+class _StillFrameSource:
+    """Frame source for GameLauncher that always returns the same frame"""
+    
+    def __init__(self, frame):
+        self.frame = frame
+    
+    def read(self):
+        return True, self.frame.copy()
+    
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.frame.shape[1]
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.frame.shape[0]
+        return 0
+    
+    def release(self):
+        pass
+
+
+class RenderRegression:
+    """Renders fixed scenes, checks them against golden PNGs and times the draw calls"""
+    
+    SEED = 1234
+    
+    def __init__(self, golden_dir='golden', diff_dir='render_diffs', tolerance=1,
+                 max_mismatch=0.0, repeat=30):
+        """
+        Initialize the harness
+        
+        Args:
+            golden_dir: Directory of golden PNGs (one per scene)
+            diff_dir: Directory for rendered and diff images of failing scenes
+            tolerance: Per-channel difference still counted as equal; 1 because text
+                sprites blend to within one level of cv2.putText (see text_sprites.py)
+            max_mismatch: Fraction of mismatched pixels allowed per scene
+            repeat: Timed draw calls per scene
+        """
+        self.golden_dir = golden_dir
+        self.diff_dir = diff_dir
+        self.tolerance = tolerance
+        self.max_mismatch = max_mismatch
+        self.repeat = repeat
+        
+        self.background = make_background()
+        self.height, self.width = self.background.shape[:2]
+        
+        # One launcher with defaults; its settings file is never written
+        self._config_dir = tempfile.TemporaryDirectory()
+        self.launcher = GameLauncher(
+            capture=_StillFrameSource(self.background),
+            hand_tracker=PooledHandTracker(landmark_style=None),
+            config_file=os.path.join(self._config_dir.name, 'render_regression.json'),
+            event_log_path=None,
+            seed=self.SEED,
+            drawing_session_path=None
+        )
+        self.launcher.config.reset_to_defaults()
+        self.launcher.config.sound_enabled = False
+        self.launcher.sound_manager.enabled = False
+        
+        self.scenes = {
+            'game_selection': self._scene_game_selection,
+            'snake_playing': self._scene_snake_playing,
+            'snake_game_over': self._scene_snake_game_over,
+            'fruit_slicer_playing': self._scene_fruit_slicer_playing,
+            'fruit_slicer_game_over': self._scene_fruit_slicer_game_over,
+            'flappy_hand_playing': self._scene_flappy_hand_playing,
+            'flappy_hand_game_over': self._scene_flappy_hand_game_over,
+            'rps_waiting': self._scene_rps_waiting,
+            'rps_countdown': self._scene_rps_countdown,
+            'rps_result': self._scene_rps_result,
+            'air_drawing_ui': self._scene_air_drawing_ui,
+            'air_drawing_palette': self._scene_air_drawing_palette,
+            'menu_main': self._scene_menu_main,
+            'menu_difficulty': self._scene_menu_difficulty,
+            'menu_high_scores': self._scene_menu_high_scores,
+            'snake_versus_playing': self._scene_snake_versus_playing,
+            'fruit_versus_game_over': self._scene_fruit_versus_game_over,
+        }
+    
+    # Scenes: each sets up a fixed state and returns draw(frame) -> frame
+    
+    def _start(self, game_key):
+        """Start a game with a fresh, deterministic RNG stream"""
+        self.launcher.games_started = 0
+        self.launcher.start_game(game_key)
+        return self.launcher.game_instance
+    
+    def _scene_game_selection(self):
+        self.launcher.selected_game_index = 1
+        return self.launcher.show_game_selection
+    
+    def _snake_state(self):
+        game = self._start('snake')
+        cell = game.cell_size
+        # Finger path: right along row 5, then down, then left; food is placed
+        # on every cell of the path so the snake grows along it
+        path = ([(x, 5) for x in range(10, 17)] + [(16, y) for y in range(6, 11)] +
+                [(x, 10) for x in range(15, 8, -1)])
+        for grid_x, grid_y in path:
+            game.food = (grid_x, grid_y)
+            for _ in range(game.speed_delay):
+                game.update_snake_position((grid_x * cell + cell // 2, grid_y * cell + cell // 2))
+        finger = (50 + path[-1][0] * cell, 50 + path[-1][1] * cell)
+        return game, finger
+    
+    def _snake_draw(self, finger):
+        """Wrap the launcher's in-place snake renderer as draw(frame) -> frame"""
+        def draw(frame):
+            self.launcher._draw_snake_game(frame, finger)
+            return frame
+        return draw
+    
+    def _scene_snake_playing(self):
+        game, finger = self._snake_state()
+        return self._snake_draw(finger)
+    
+    def _scene_snake_game_over(self):
+        game, finger = self._snake_state()
+        game.game_over = True
+        return self._snake_draw(finger)
+    
+    def _scene_fruit_slicer_playing(self):
+        game = self._start('fruit_slicer')
+        game.spawn_interval = 8
+        for step in range(40):
+            game.update(None)
+        # Short swipe along the top edge, away from the fruits
+        for step in range(game.max_trail_length):
+            game.update((200 + step * 40, 90 + int(20 * math.sin(step * 0.5))))
+        return game.draw
+    
+    def _scene_fruit_slicer_game_over(self):
+        game = self._start('fruit_slicer')
+        while not game.game_over:
+            game.update(None)
+        return game.draw
+    
+    def _scene_flappy_hand_playing(self):
+        game = self._start('flappy_hand')
+        for step in range(200):
+            game.update(int(self.height / 2 + 120 * math.sin(step * 0.05)))
+        return game.draw
+    
+    def _scene_flappy_hand_game_over(self):
+        game = self._start('flappy_hand')
+        while not game.game_over:
+            game.update(0)
+        return game.draw
+    
+    def _scene_rps_waiting(self):
+        return self._start('rps').draw
+    
+    def _scene_rps_countdown(self):
+        game = self._start('rps')
+        game.detect_gesture('fist')
+        for _ in range(40):
+            game.update()
+        return game.draw
+    
+    def _scene_rps_result(self):
+        game = self._start('rps')
+        game.detect_gesture('peace')
+        while game.game_state == 'countdown':
+            game.update()
+        return game.draw
+    
+    def _air_drawing_state(self):
+        game = self._start('air_drawing')
+        for color_index, (cx, cy) in enumerate([(400, 360), (700, 300), (950, 420)]):
+            game.set_color(color_index)
+            for step in range(60):
+                angle = step * 2 * math.pi / 59
+                game.update((int(cx + 120 * math.cos(angle)), int(cy + 80 * math.sin(angle))), True)
+            game.update(None, False)
+        game.update((500, 500), True)
+        return game
+    
+    def _scene_air_drawing_ui(self):
+        return self._air_drawing_state().draw_ui
+    
+    def _scene_air_drawing_palette(self):
+        game = self._air_drawing_state()
+        game.toggle_palette()
+        game.toggle_help()
+        return game.draw_ui
+    
+    def _scene_snake_versus_playing(self):
+        game = self._start('snake_versus')
+        cell = game.cell_size
+        # Player 1 grows along row 4, player 2 along column 12 and then crashes
+        paths = [[(x, 4) for x in range(10, 17)], [(12, y) for y in range(7, 13)]]
+        for player, path in enumerate(paths):
+            board = game.boards[player]
+            for grid_x, grid_y in path:
+                board.food = (grid_x, grid_y)
+                for _ in range(board.speed_delay):
+                    game.update_player(player, (grid_x * cell + cell // 2, grid_y * cell + cell // 2))
+        game.boards[1].game_over = True
+        offsets = self.launcher._snake_board_offsets()
+        fingers = [(offsets[0][0] + 16 * cell, offsets[0][1] + 4 * cell), None]
+        
+        def draw(frame):
+            self.launcher._draw_snake_versus(frame, fingers)
+            return frame
+        return draw
+    
+    def _scene_fruit_versus_game_over(self):
+        game = self._start('fruit_versus')
+        game.spawn_interval = 8
+        for step in range(40):
+            game.update_players([None, None])
+        # Player 2 sweeps across the lowest fruit
+        fruits = game.fruits
+        slots = fruits.active()
+        lowest = fruits.position[slots[np.argmax(fruits.position[slots, 1])]]
+        game.update_players([None, (int(lowest[0]) - 80, int(lowest[1]))])
+        game.update_players([None, (int(lowest[0]) + 80, int(lowest[1]))])
+        while not game.game_over:
+            game.update_players([None, None])
+        return game.draw
+    
+    def _scene_menu_main(self):
+        menu = GameMenu(self.launcher.config)
+        menu.selected_index = 1
+        return menu.show_main_menu
+    
+    def _scene_menu_difficulty(self):
+        menu = GameMenu(self.launcher.config)
+        menu.selected_index = 2
+        return menu.show_difficulty_menu
+    
+    def _scene_menu_high_scores(self):
+        config = self.launcher.config
+        config.high_scores = {Difficulty.EASY.value: 120, Difficulty.MEDIUM.value: 340,
+                              Difficulty.HARD.value: 75}
+        menu = GameMenu(config)
+        return menu.show_high_scores
+    
+    # Running
+    
+    def render_scene(self, name):
+        """
+        Render one scene and time its draw call
+        
+        Args:
+            name: Scene name
+        
+        Returns:
+            tuple: (rendered frame, list of draw times in seconds)
+        """
+        draw = self.scenes[name]()
+        frame = draw(self.background.copy())
+        
+        times = []
+        for _ in range(self.repeat):
+            target = self.background.copy()
+            start = time.perf_counter()
+            draw(target)
+            times.append(time.perf_counter() - start)
+        return frame, times
+    
+    def golden_path(self, name):
+        """Path of a scene's golden PNG"""
+        return os.path.join(self.golden_dir, f"{name}.png")
+    
+    def run(self, names=None, update=False):
+        """
+        Render scenes, compare or update golden frames and print a report
+        
+        Args:
+            names: Scene names (all if None)
+            update: Write golden frames instead of comparing
+        
+        Returns:
+            bool: True if every compared scene matched
+        """
+        names = names or list(self.scenes)
+        passed = True
+        
+        print(f"{'scene':<24} {'result':<8} {'mismatch':>9} {'max diff':>9} "
+              f"{'median ms':>10} {'p95 ms':>8}")
+        for name in names:
+            frame, times = self.render_scene(name)
+            median_ms = float(np.median(times)) * 1000
+            p95_ms = float(np.percentile(times, 95)) * 1000
+            
+            if update:
+                os.makedirs(self.golden_dir, exist_ok=True)
+                cv2.imwrite(self.golden_path(name), frame)
+                result, mismatch, max_diff = 'updated', 0.0, 0
+            else:
+                path = self.golden_path(name)
+                expected = cv2.imread(path) if os.path.exists(path) else None
+                if expected is None:
+                    result, mismatch, max_diff = 'missing', 1.0, 255
+                    diff_image = None
+                else:
+                    mismatch, max_diff, diff_image = compare_frames(frame, expected, self.tolerance)
+                    result = 'ok' if mismatch <= self.max_mismatch else 'FAIL'
+                
+                if result != 'ok':
+                    passed = False
+                    os.makedirs(self.diff_dir, exist_ok=True)
+                    cv2.imwrite(os.path.join(self.diff_dir, f"{name}_actual.png"), frame)
+                    if diff_image is not None:
+                        cv2.imwrite(os.path.join(self.diff_dir, f"{name}_diff.png"), diff_image)
+            
+            print(f"{name:<24} {result:<8} {mismatch * 100:8.3f}% {max_diff:>9} "
+                  f"{median_ms:>10.3f} {p95_ms:>8.3f}")
+        
+        if not update and not passed:
+            print(f"Rendered and diff images written to {self.diff_dir}/")
+        return passed
+    
+    def close(self):
+        """Release the launcher and temporary settings directory"""
+        self.launcher.recorder.close()
+        self.launcher.metrics.close()
+        self._config_dir.cleanup()
+
+
+def main():
+    """Entry point"""
+    parser = argparse.ArgumentParser(description="Golden-frame render regression and draw timing")
+    parser.add_argument('--update', action='store_true', help="Rewrite golden frames")
+    parser.add_argument('--scenes', nargs='+', default=None, help="Scenes to run (default: all)")
+    parser.add_argument('--list', action='store_true', help="List scene names")
+    parser.add_argument('--golden-dir', default='golden', help="Golden PNG directory")
+    parser.add_argument('--diff-dir', default='render_diffs', help="Output for failing scenes")
+    parser.add_argument('--tolerance', type=int, default=1,
+                        help="Per-channel difference still counted as equal (1: text sprite rounding)")
+    parser.add_argument('--max-mismatch', type=float, default=0.0,
+                        help="Allowed fraction of mismatched pixels per scene")
+    parser.add_argument('--repeat', type=int, default=30, help="Timed draw calls per scene")
+    args = parser.parse_args()
+    
+    harness = RenderRegression(args.golden_dir, args.diff_dir, args.tolerance,
+                               args.max_mismatch, args.repeat)
+    try:
+        if args.list:
+            print('\n'.join(harness.scenes))
+            return
+        unknown = [name for name in args.scenes or [] if name not in harness.scenes]
+        if unknown:
+            print(f"Unknown scenes: {', '.join(unknown)}")
+            sys.exit(2)
+        passed = harness.run(args.scenes, update=args.update)
+    finally:
+        harness.close()
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
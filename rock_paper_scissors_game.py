@@ -7,6 +7,8 @@ import random
 import time
 import cv2
 import numpy as np
+from compositing import blend_rect
+from text_sprites import put_text, get_text_size
 
 
 class RockPaperScissorsGame:
@@ -18,14 +20,18 @@ class RockPaperScissorsGame:
         'scissors': '✌️ Scissors'
     }
     
-    def __init__(self, width=1280, height=720):
+    def __init__(self, width=1280, height=720, event_log=None, rng=None):
         """
         Initialize the game
         
         Args:
             width: Screen width
             height: Screen height
+            event_log: Optional EventLog for gameplay events
+            rng: random.Random stream for this game (unseeded if None)
         """
+        self.event_log = event_log
+        self.rng = rng or random.Random()
         self.width = width
         self.height = height
         self.player_score = 0
@@ -39,15 +45,18 @@ class RockPaperScissorsGame:
         self.countdown_timer = 0
         self.result_timer = 0
         self.result_display_time = 90  # frames
+        self.player_confidence = None
         
-    def detect_gesture(self, gesture_name):
+    def detect_gesture(self, gesture_name, confidence=None):
         """
         Set player's gesture choice
         
         Args:
             gesture_name: Name of detected gesture
+            confidence: Classifier confidence for the gesture (None if unknown)
         """
         if self.game_state == 'waiting':
+            self.player_confidence = confidence
             if gesture_name == 'fist':
                 self.start_round('rock')
             elif gesture_name == 'open_palm':
@@ -77,7 +86,7 @@ class RockPaperScissorsGame:
                 
                 if self.countdown == 0:
                     # Make computer choice
-                    self.computer_choice = random.choice(['rock', 'paper', 'scissors'])
+                    self.computer_choice = self.rng.choice(['rock', 'paper', 'scissors'])
                     self.result = self._determine_winner()
                     self.game_state = 'show_result'
                     self.result_timer = 0
@@ -88,6 +97,14 @@ class RockPaperScissorsGame:
                         self.player_score += 1
                     elif self.result == 'lose':
                         self.computer_score += 1
+                    
+                    if self.event_log:
+                        self.event_log.log('rps_result', game='rps',
+                                           player=self.player_choice,
+                                           computer=self.computer_choice,
+                                           result=self.result,
+                                           player_score=self.player_score,
+                                           computer_score=self.computer_score)
         
         elif self.game_state == 'show_result':
             self.result_timer += 1
@@ -121,23 +138,21 @@ class RockPaperScissorsGame:
     def draw(self, frame):
         """Draw game elements on frame"""
         # Draw background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (self.width, self.height), (50, 50, 50), -1)
-        cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+        blend_rect(frame, (0, 0), (self.width, self.height), (50, 50, 50), 0.3)
         
         # Draw title
         title = "ROCK PAPER SCISSORS"
-        title_size = cv2.getTextSize(title, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)[0]
+        title_size = get_text_size(title, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)[0]
         title_x = (self.width - title_size[0]) // 2
-        cv2.putText(frame, title, (title_x, 60),
-                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
+        put_text(frame, title, (title_x, 60),
+               cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
         
         # Draw scores
         score_text = f"You: {self.player_score}  |  Computer: {self.computer_score}"
-        score_size = cv2.getTextSize(score_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
+        score_size = get_text_size(score_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
         score_x = (self.width - score_size[0]) // 2
-        cv2.putText(frame, score_text, (score_x, 110),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+        put_text(frame, score_text, (score_x, 110),
+               cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
         
         # Draw game state
         if self.game_state == 'waiting':
@@ -155,10 +170,10 @@ class RockPaperScissorsGame:
         ]
         y = self.height - 100
         for instruction in instructions:
-            inst_size = cv2.getTextSize(instruction, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0]
+            inst_size = get_text_size(instruction, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0]
             inst_x = (self.width - inst_size[0]) // 2
-            cv2.putText(frame, instruction, (inst_x, y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
+            put_text(frame, instruction, (inst_x, y),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
             y += 30
         
         return frame
@@ -166,46 +181,49 @@ class RockPaperScissorsGame:
     def _draw_waiting_state(self, frame):
         """Draw waiting for player gesture"""
         text = "Show your gesture!"
-        text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)[0]
+        text_size = get_text_size(text, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)[0]
         text_x = (self.width - text_size[0]) // 2
-        cv2.putText(frame, text, (text_x, self.height // 2),
-                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 255, 0), 3)
+        put_text(frame, text, (text_x, self.height // 2),
+               cv2.FONT_HERSHEY_DUPLEX, 1.5, (0, 255, 0), 3)
         
         # Draw gesture icons
         gestures_text = "✊ Rock    ✋ Paper    ✌️ Scissors"
-        gestures_size = cv2.getTextSize(gestures_text, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 2)[0]
+        gestures_size = get_text_size(gestures_text, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 2)[0]
         gestures_x = (self.width - gestures_size[0]) // 2
-        cv2.putText(frame, gestures_text, (gestures_x, self.height // 2 + 60),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+        put_text(frame, gestures_text, (gestures_x, self.height // 2 + 60),
+               cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
     
     def _draw_countdown(self, frame):
         """Draw countdown"""
         if self.countdown > 0:
             countdown_text = str(self.countdown)
-            text_size = cv2.getTextSize(countdown_text, cv2.FONT_HERSHEY_DUPLEX, 5, 10)[0]
+            text_size = get_text_size(countdown_text, cv2.FONT_HERSHEY_DUPLEX, 5, 10)[0]
             text_x = (self.width - text_size[0]) // 2
             text_y = (self.height + text_size[1]) // 2
-            cv2.putText(frame, countdown_text, (text_x, text_y),
-                       cv2.FONT_HERSHEY_DUPLEX, 5, (255, 255, 0), 10)
+            put_text(frame, countdown_text, (text_x, text_y),
+                   cv2.FONT_HERSHEY_DUPLEX, 5, (255, 255, 0), 10)
         else:
             shoot_text = "SHOOT!"
-            text_size = cv2.getTextSize(shoot_text, cv2.FONT_HERSHEY_DUPLEX, 3, 6)[0]
+            text_size = get_text_size(shoot_text, cv2.FONT_HERSHEY_DUPLEX, 3, 6)[0]
             text_x = (self.width - text_size[0]) // 2
             text_y = (self.height + text_size[1]) // 2
-            cv2.putText(frame, shoot_text, (text_x, text_y),
-                       cv2.FONT_HERSHEY_DUPLEX, 3, (0, 255, 255), 6)
+            put_text(frame, shoot_text, (text_x, text_y),
+                   cv2.FONT_HERSHEY_DUPLEX, 3, (0, 255, 255), 6)
     
     def _draw_result(self, frame):
         """Draw round result"""
         # Draw player choice
         player_text = f"You: {self.GESTURES[self.player_choice]}"
-        cv2.putText(frame, player_text, (100, self.height // 2 - 50),
-                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
+        put_text(frame, player_text, (100, self.height // 2 - 50),
+               cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
+        if self.player_confidence is not None:
+            put_text(frame, f"({self.player_confidence:.0%} sure)", (100, self.height // 2 - 15),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
         
         # Draw computer choice
         computer_text = f"Computer: {self.GESTURES[self.computer_choice]}"
-        cv2.putText(frame, computer_text, (self.width - 500, self.height // 2 - 50),
-                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
+        put_text(frame, computer_text, (self.width - 500, self.height // 2 - 50),
+               cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3)
         
         # Draw result
         if self.result == 'win':
@@ -218,10 +236,10 @@ class RockPaperScissorsGame:
             result_text = "TIE!"
             color = (255, 255, 0)
         
-        result_size = cv2.getTextSize(result_text, cv2.FONT_HERSHEY_DUPLEX, 2.5, 5)[0]
+        result_size = get_text_size(result_text, cv2.FONT_HERSHEY_DUPLEX, 2.5, 5)[0]
         result_x = (self.width - result_size[0]) // 2
-        cv2.putText(frame, result_text, (result_x, self.height // 2 + 50),
-                   cv2.FONT_HERSHEY_DUPLEX, 2.5, color, 5)
+        put_text(frame, result_text, (result_x, self.height // 2 + 50),
+               cv2.FONT_HERSHEY_DUPLEX, 2.5, color, 5)
     
     def reset(self):
         """Reset scores and game state"""
@@ -8,10 +8,36 @@ import numpy as np
 import time
 
 
+class FoodSequence:
+    """Food cells shared by several boards, drawn from one stream as needed"""
+    
+    def __init__(self, grid_width, grid_height, rng):
+        """
+        Initialize the sequence
+        
+        Args:
+            grid_width: Number of cells in width
+            grid_height: Number of cells in height
+            rng: random.Random stream the cells are drawn from
+        """
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.rng = rng
+        self.cells = []
+    
+    def cell(self, index):
+        """Get the index-th food cell, drawing new cells up to it"""
+        while len(self.cells) <= index:
+            self.cells.append((self.rng.randint(0, self.grid_width - 1),
+                               self.rng.randint(0, self.grid_height - 1)))
+        return self.cells[index]
+
+
 class SnakeGame:
     """Classic Snake game with gesture control"""
     
-    def __init__(self, grid_width=20, grid_height=15, cell_size=30, speed_delay=8):
+    def __init__(self, grid_width=20, grid_height=15, cell_size=30, speed_delay=8, event_log=None,
+                 rng=None, food_sequence=None):
         """
         Initialize the Snake game
         
@@ -20,7 +46,15 @@ class SnakeGame:
             grid_height: Number of cells in height
             cell_size: Size of each cell in pixels
             speed_delay: Delay between movements (lower = faster)
+            event_log: Optional EventLog for gameplay events
+            rng: random.Random stream for this game (unseeded if None)
+            food_sequence: FoodSequence to take food from instead of rng; the
+                board takes the next cell its snake does not cover
         """
+        self.event_log = event_log
+        self.rng = rng or random.Random()
+        self.food_sequence = food_sequence
+        self.food_index = 0
         self.grid_width = grid_width
         self.grid_height = grid_height
         self.cell_size = cell_size
@@ -44,9 +78,16 @@ class SnakeGame:
         
     def generate_food(self):
         """Generate food at a random position not occupied by snake"""
+        if self.food_sequence is not None:
+            while True:
+                food = self.food_sequence.cell(self.food_index)
+                self.food_index += 1
+                if food not in self.snake:
+                    return food
+        
         while True:
-            food_x = random.randint(0, self.grid_width - 1)
-            food_y = random.randint(0, self.grid_height - 1)
+            food_x = self.rng.randint(0, self.grid_width - 1)
+            food_y = self.rng.randint(0, self.grid_height - 1)
             
             if (food_x, food_y) not in self.snake:
                 return (food_x, food_y)
@@ -108,6 +149,9 @@ class SnakeGame:
             self.score += 10
             self.food = self.generate_food()
             ate_food = True
+            if self.event_log:
+                self.event_log.log('food_eaten', game='snake', score=self.score,
+                                   length=len(self.snake))
         else:
             # Remove tail if no food eaten
             self.snake.pop()
@@ -115,6 +159,9 @@ class SnakeGame:
         # Check for collision with self (if snake length > 4 to avoid early game issues)
         if len(self.snake) > 4 and new_head in self.snake[1:]:
             self.game_over = True
+            if self.event_log:
+                self.event_log.log('game_over', game='snake', score=self.score,
+                                   length=len(self.snake))
             return (False, False)
         
         return (True, ate_food)
@@ -124,6 +171,7 @@ class SnakeGame:
         center_x = self.grid_width // 2
         center_y = self.grid_height // 2
         self.snake = [(center_x, center_y)]
+        self.food_index = 0
         self.food = self.generate_food()
         self.score = 0
         self.game_over = False
@@ -155,3 +203,95 @@ class SnakeGame:
         """Get grid dimensions in pixels"""
         return (self.grid_width * self.cell_size, 
                 self.grid_height * self.cell_size)
+
+
+class SnakeVersusGame:
+    """Two-player Snake: one board per player, all taking food from one sequence"""
+    
+    def __init__(self, num_players=2, grid_width=20, grid_height=15, cell_size=30, speed_delay=8,
+                 event_log=None, rng=None):
+        """
+        Initialize the boards
+        
+        Args:
+            num_players: Number of players (one board each)
+            grid_width: Number of cells in width
+            grid_height: Number of cells in height
+            cell_size: Size of each cell in pixels
+            speed_delay: Delay between movements (lower = faster)
+            event_log: Optional EventLog for gameplay events
+            rng: random.Random stream for this game (unseeded if None)
+        """
+        self.event_log = event_log
+        self.rng = rng or random.Random()
+        self.num_players = num_players
+        self.cell_size = cell_size
+        
+        # Every board takes the next cell its own snake leaves free from one
+        # shared sequence, so no player gets an easier run of food
+        self.food_sequence = self._new_food_sequence(grid_width, grid_height)
+        self.boards = [
+            SnakeGame(grid_width, grid_height, cell_size, speed_delay,
+                      food_sequence=self.food_sequence)
+            for _ in range(num_players)
+        ]
+        self._over_logged = False
+    
+    def _new_food_sequence(self, grid_width, grid_height):
+        """Start a food sequence from a fresh seed drawn from the game's stream"""
+        board_seed = self.rng.getrandbits(64)
+        return FoodSequence(grid_width, grid_height, random.Random(board_seed))
+    
+    @property
+    def game_over(self):
+        """True once every player's snake has crashed"""
+        return all(board.game_over for board in self.boards)
+    
+    def update_player(self, player, finger_pos):
+        """
+        Move one player's snake
+        
+        Args:
+            player: Player index
+            finger_pos: (x, y) finger position relative to that player's board
+            
+        Returns:
+            tuple: (continues, ate_food) for that player
+        """
+        board = self.boards[player]
+        continues, ate_food = board.update_snake_position(finger_pos)
+        
+        if self.event_log:
+            if ate_food:
+                self.event_log.log('food_eaten', game='snake_versus', player=player,
+                                   score=board.score, length=len(board.snake))
+            if self.game_over and not self._over_logged:
+                self._over_logged = True
+                self.event_log.log('game_over', game='snake_versus', scores=self.get_scores(),
+                                   winner=self.get_winner())
+        return continues, ate_food
+    
+    def get_scores(self):
+        """Get every player's score"""
+        return [board.score for board in self.boards]
+    
+    def get_winner(self):
+        """
+        Get the leading player
+        
+        Returns:
+            int: Player index with the highest score, or None on a tie
+        """
+        scores = self.get_scores()
+        best = max(scores)
+        leaders = [player for player, score in enumerate(scores) if score == best]
+        return leaders[0] if len(leaders) == 1 else None
+    
+    def reset(self):
+        """Reset every board onto a new shared food sequence"""
+        self.food_sequence = self._new_food_sequence(self.food_sequence.grid_width,
+                                                     self.food_sequence.grid_height)
+        for board in self.boards:
+            board.food_sequence = self.food_sequence
+            board.reset()
+        self._over_logged = False
@@ -0,0 +1,228 @@
+"""
+Spectator Stream Module
+Serves the composited game view as an MJPEG stream over HTTP
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import cv2
+import numpy as np
+
+
+class _SpectatorHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the index page, MJPEG stream and snapshots"""
+    
+    BOUNDARY = 'frame'
+    
+    def do_GET(self):
+        """Route GET requests"""
+        stream = self.server.stream
+        
+        if self.path in ('/', '/index.html'):
+            body = (b'<html><head><title>Gesture Game Collection</title></head>'
+                    b'<body style="margin:0;background:#000">'
+                    b'<img src="/stream.mjpg" style="width:100%"></body></html>')
+            self._send_body(body, 'text/html')
+        elif self.path == '/snapshot.jpg':
+            stream.client_connected()
+            try:
+                _, jpeg = stream.wait_for_frame(-1, timeout=5)
+            finally:
+                stream.client_disconnected()
+            if jpeg is None:
+                self.send_error(503, 'No frame available')
+            else:
+                self._send_body(jpeg, 'image/jpeg')
+        elif self.path == '/stream.mjpg':
+            self._stream_mjpeg(stream)
+        else:
+            self.send_error(404)
+    
+    def _send_body(self, body, content_type):
+        """Send a complete response"""
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _stream_mjpeg(self, stream):
+        """
+        Send frames until the client disconnects
+        
+        Each client waits for a frame newer than the last one it sent, so a
+        slow client simply skips the frames published while it was writing.
+        """
+        self.send_response(200)
+        self.send_header('Cache-Control', 'no-cache, private')
+        self.send_header('Pragma', 'no-cache')
+        self.send_header('Content-Type',
+                         f'multipart/x-mixed-replace; boundary={self.BOUNDARY}')
+        self.end_headers()
+        
+        stream.client_connected()
+        last_seq = -1
+        try:
+            while stream.running:
+                seq, jpeg = stream.wait_for_frame(last_seq, timeout=1.0)
+                if jpeg is None:
+                    continue
+                last_seq = seq
+                self.wfile.write(
+                    f'--{self.BOUNDARY}\r\n'
+                    f'Content-Type: image/jpeg\r\n'
+                    f'Content-Length: {len(jpeg)}\r\n\r\n'.encode('ascii')
+                )
+                self.wfile.write(jpeg)
+                self.wfile.write(b'\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            stream.client_disconnected()
+    
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+        pass
+
+
+class SpectatorStream:
+    """
+    Multi-client MJPEG server for spectators
+    
+    The game loop calls `publish()` with each composited frame. The frame is
+    copied into a staging buffer only when the encoder thread is idle, JPEG
+    encoded once, and the same bytes are shared by every connected client.
+    Neither encoding nor slow clients can stall the game loop.
+    """
+    
+    def __init__(self, host='127.0.0.1', port=8080, quality=80, max_fps=30):
+        """
+        Initialize and start the spectator server
+        
+        Args:
+            host: Interface to bind ('127.0.0.1' for local only, '0.0.0.0' for LAN)
+            port: TCP port (0 picks a free port)
+            quality: JPEG quality (0-100)
+            max_fps: Maximum encoded frames per second
+        """
+        self.quality = quality
+        self.min_interval = 1.0 / max_fps
+        self.running = True
+        
+        # Latest encoded frame shared by all clients
+        self._condition = threading.Condition()
+        self._jpeg = None
+        self._seq = -1
+        
+        # Staging buffer handed from the game loop to the encoder
+        self._staging = None
+        self._staging_ready = threading.Event()
+        self._last_publish = 0.0
+        
+        # Statistics
+        self.clients = 0
+        self.frames_encoded = 0
+        self.frames_skipped = 0
+        
+        self._server = ThreadingHTTPServer((host, port), _SpectatorHandler)
+        self._server.daemon_threads = True
+        self._server.stream = self
+        self.host, self.port = self._server.server_address[:2]
+        
+        self._encoder = threading.Thread(target=self._encode_loop, daemon=True)
+        self._encoder.start()
+        self._server_thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._server_thread.start()
+        print(f"Spectator stream at http://{self.host}:{self.port}/")
+    
+    @property
+    def url(self):
+        """URL of the viewer page"""
+        return f"http://{self.host}:{self.port}/"
+    
+    def client_connected(self):
+        """Called by handler threads when a stream starts"""
+        with self._condition:
+            self.clients += 1
+    
+    def client_disconnected(self):
+        """Called by handler threads when a stream ends"""
+        with self._condition:
+            self.clients -= 1
+    
+    def publish(self, frame):
+        """
+        Offer a composited frame to spectators (never blocks)
+        
+        Args:
+            frame: Final frame shown to the player
+        
+        Returns:
+            bool: True if the frame was handed to the encoder
+        """
+        if self.clients == 0 or self._staging_ready.is_set():
+            return False
+        
+        now = time.perf_counter()
+        if now - self._last_publish < self.min_interval:
+            return False
+        self._last_publish = now
+        
+        if self._staging is None or self._staging.shape != frame.shape:
+            self._staging = np.empty_like(frame)
+        np.copyto(self._staging, frame)
+        self._staging_ready.set()
+        return True
+    
+    def wait_for_frame(self, last_seq, timeout=1.0):
+        """
+        Wait for an encoded frame newer than last_seq
+        
+        Frames published between last_seq and the returned one are added to
+        frames_skipped here, under the lock shared by all handler threads.
+        
+        Args:
+            last_seq: Sequence number of the last frame the caller has
+            timeout: Seconds to wait
+        
+        Returns:
+            tuple: (seq, jpeg_bytes), or (last_seq, None) on timeout
+        """
+        with self._condition:
+            if self._seq <= last_seq:
+                self._condition.wait_for(
+                    lambda: self._seq > last_seq or not self.running, timeout)
+            if self._seq <= last_seq or self._jpeg is None:
+                return last_seq, None
+            if last_seq >= 0:
+                self.frames_skipped += self._seq - last_seq - 1
+            return self._seq, self._jpeg
+    
+    def _encode_loop(self):
+        """Encoder thread: encode the staged frame once for all clients"""
+        params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+        while self.running:
+            if not self._staging_ready.wait(timeout=0.5):
+                continue
+            if not self.running:
+                break
+            ok, encoded = cv2.imencode('.jpg', self._staging, params)
+            self._staging_ready.clear()
+            if not ok:
+                continue
+            
+            with self._condition:
+                self._jpeg = encoded.tobytes()
+                self._seq += 1
+                self.frames_encoded += 1
+                self._condition.notify_all()
+    
+    def close(self):
+        """Stop the server and encoder"""
+        self.running = False
+        with self._condition:
+            self._condition.notify_all()
+        self._staging_ready.set()
+        self._server.shutdown()
+        self._server.server_close()
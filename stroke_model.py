@@ -0,0 +1,639 @@
+"""
+Stroke Model Module
+Vector strokes for Air Drawing: the drawing as data, the raster as a cache
+
+Every stroke is kept as a compact NumPy array of points (with capture
+times) plus its tool, color and size. The on-screen canvas is only a cache
+of these strokes: undo drops a stroke and re-renders the tiles it covered
+from the remaining strokes, and the same stroke log can be exported as SVG,
+rendered as a PNG at any scale, or replayed as a time-lapse.
+
+Each stroke belongs to a layer (sketch, ink, highlights by default). A
+layer is rendered on its own and its inked pixels are blended over the
+layers below with the layer's opacity; hidden layers are skipped.
+
+    python stroke_model.py drawing.npz --svg drawing.svg
+    python stroke_model.py drawing.npz --png drawing.png --scale 4
+    python stroke_model.py drawing.npz --timelapse drawing.mp4 --duration 10
+"""
+
+import argparse
+import cv2
+import numpy as np
+from compositing import blend_layer
+
+
+PEN = 'pen'
+ERASER = 'eraser'
+
+# Extra pixels around a re-rendered region (beyond the strokes' own reach)
+RENDER_MARGIN = 32
+
+# Layers of a new drawing, bottom to top: (name, opacity)
+DEFAULT_LAYERS = (('sketch', 0.5), ('ink', 1.0), ('highlights', 0.6))
+
+
+class Layer:
+    """Display settings of one drawing layer"""
+    
+    __slots__ = ('name', 'visible', 'opacity')
+    
+    def __init__(self, name, visible=True, opacity=1.0):
+        """
+        Args:
+            name: Layer name
+            visible: Whether the layer is shown and exported
+            opacity: Opacity of the layer's ink over the layers below (0-1)
+        """
+        self.name = name
+        self.visible = bool(visible)
+        self.opacity = float(opacity)
+    
+    def copy(self):
+        """Get an independent copy (for handing to another thread)"""
+        return Layer(self.name, self.visible, self.opacity)
+
+
+def default_layers():
+    """Create the layers of a new drawing"""
+    return [Layer(name, opacity=opacity) for name, opacity in DEFAULT_LAYERS]
+
+
+class Stroke:
+    """One pen or eraser stroke"""
+    
+    __slots__ = ('tool', 'color', 'size', 'layer', '_points', '_times', 'count', 'bbox')
+    
+    def __init__(self, tool, color, size, points=None, times=None, layer=0):
+        """
+        Initialize the stroke
+        
+        Args:
+            tool: PEN (line through the points) or ERASER (disc at each point after
+                the first); a stroke of one point (a tap) is a dot of either
+            color: BGR color (the background color for the eraser)
+            size: Line thickness for the pen, disc radius for the eraser
+            points: Optional (N, 2) points to start with
+            times: Optional (N,) capture times in seconds
+            layer: Index of the layer the stroke is drawn on
+        """
+        self.tool = tool
+        self.color = tuple(int(c) for c in color)
+        self.size = int(size)
+        self.layer = int(layer)
+        self._points = np.empty((64, 2), dtype=np.int32)
+        self._times = np.empty(64, dtype=np.float64)
+        self.count = 0
+        self.bbox = None
+        if points is not None:
+            points = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+            if times is None:
+                times = np.zeros(len(points))
+            for point, timestamp in zip(points, times):
+                self.append(point, timestamp)
+    
+    @property
+    def points(self):
+        """(N, 2) int32 points"""
+        return self._points[:self.count]
+    
+    @property
+    def times(self):
+        """(N,) capture times"""
+        return self._times[:self.count]
+    
+    @property
+    def dabs(self):
+        """Points that get an eraser disc (all but the first, or the only one of a tap)"""
+        return self._points[1:self.count] if self.count > 1 else self.points
+    
+    @property
+    def reach(self):
+        """Pixels the stroke can cover beyond its points"""
+        if self.tool == ERASER:
+            return self.size + 2
+        return self.size // 2 + 2
+    
+    def append(self, point, timestamp):
+        """
+        Add a point (arrays grow by doubling)
+        
+        Args:
+            point: (x, y)
+            timestamp: Capture time in seconds
+        """
+        if self.count == len(self._points):
+            self._points = np.concatenate([self._points, np.empty_like(self._points)])
+            self._times = np.concatenate([self._times, np.empty_like(self._times)])
+        x, y = int(point[0]), int(point[1])
+        self._points[self.count] = (x, y)
+        self._times[self.count] = timestamp
+        self.count += 1
+        
+        reach = self.reach
+        box = (x - reach, y - reach, x + reach, y + reach)
+        if self.bbox is None:
+            self.bbox = box
+        else:
+            x0, y0, x1, y1 = self.bbox
+            self.bbox = (min(x0, box[0]), min(y0, box[1]), max(x1, box[2]), max(y1, box[3]))
+    
+    def segment_box(self, index):
+        """
+        Get the box drawn for one point (its segment from the previous point)
+        
+        Args:
+            index: Point index (>= 1, or 0 for the dot of a tap)
+        
+        Returns:
+            tuple: (x0, y0, x1, y1) inclusive
+        """
+        reach = self.reach
+        x, y = self._points[index]
+        if self.tool == ERASER or index == 0:
+            return (x - reach, y - reach, x + reach, y + reach)
+        px, py = self._points[index - 1]
+        return (min(x, px) - reach, min(y, py) - reach, max(x, px) + reach, max(y, py) + reach)
+    
+    def segment_boxes(self):
+        """
+        Get the boxes of all segments at once
+        
+        Returns:
+            np.ndarray: (N - 1, 4) rows of (x0, y0, x1, y1), inclusive
+        """
+        points = self.points
+        if self.tool == ERASER or self.count == 1:
+            low = high = self.dabs
+        else:
+            low = np.minimum(points[:-1], points[1:])
+            high = np.maximum(points[:-1], points[1:])
+        return np.hstack([low - self.reach, high + self.reach])
+    
+    def draw(self, image, start=1, end=None, offset=(0, 0), scale=1.0, line_type=cv2.LINE_8):
+        """
+        Rasterize the stroke (or part of it)
+        
+        Args:
+            image: BGR image to draw on
+            start: First point index whose segment is drawn (>= 1)
+            end: Index after the last point drawn (all points if None)
+            offset: (x, y) subtracted from the points (for drawing into a region view)
+            scale: Scale applied after the offset (for high-resolution output)
+            line_type: OpenCV line type
+        """
+        end = self.count if end is None else end
+        if self.count == 1:
+            # A tap: one dot, the size of the pen's line or the eraser's disc
+            if end >= 1:
+                x, y = self._points[0]
+                if offset != (0, 0) or scale != 1.0:
+                    x, y = np.round((self._points[0] - np.array(offset)) * scale).astype(np.int32)
+                radius = self.size if self.tool == ERASER else self.size // 2
+                radius = max(int(round(radius * scale)), 1)
+                cv2.circle(image, (int(x), int(y)), radius, self.color, -1, line_type)
+            return
+        start = max(start, 1)
+        if end <= start:
+            return
+        
+        points = self._points[start - 1:end]
+        if offset != (0, 0) or scale != 1.0:
+            points = np.round((points - np.array(offset)) * scale).astype(np.int32)
+        size = max(int(round(self.size * scale)), 1)
+        
+        if self.tool == ERASER:
+            for x, y in points[1:]:
+                cv2.circle(image, (int(x), int(y)), size, self.color, -1, line_type)
+        else:
+            cv2.polylines(image, [points], False, self.color, size, line_type)
+
+
+class StrokeDocument:
+    """Ordered strokes of a drawing with stroke-level undo/redo"""
+    
+    def __init__(self, width, height, background=(255, 255, 255), layers=None):
+        """
+        Initialize an empty drawing
+        
+        Args:
+            width: Drawing width in pixels
+            height: Drawing height in pixels
+            background: BGR background color
+            layers: Layers bottom to top (default_layers() if None)
+        """
+        self.width = width
+        self.height = height
+        self.background = tuple(background)
+        self.layers = default_layers() if layers is None else list(layers)
+        self.strokes = []
+        self.current = None
+        
+        # Actions: ('stroke', stroke) or ('clear', removed strokes)
+        self.undo_stack = []
+        self.redo_stack = []
+    
+    def begin_stroke(self, tool, color, size, layer=0):
+        """
+        Start a new stroke (ends any open one)
+        
+        Returns:
+            Stroke: The new stroke
+        """
+        self.end_stroke()
+        if tool == ERASER:
+            color = self.background
+        self.current = Stroke(tool, color, size, layer=layer)
+        return self.current
+    
+    def end_stroke(self):
+        """
+        Finish the open stroke and make it undoable
+        
+        Returns:
+            Stroke: The finished stroke, or None if nothing was drawn
+        """
+        stroke = self.current
+        self.current = None
+        if stroke is None or stroke.count < 1:
+            return None
+        self.strokes.append(stroke)
+        self.undo_stack.append(('stroke', stroke))
+        self.redo_stack = []
+        return stroke
+    
+    def clear(self):
+        """
+        Remove all strokes (undoable)
+        
+        Returns:
+            bool: True if there was anything to clear
+        """
+        self.end_stroke()
+        if not self.strokes:
+            return False
+        self.undo_stack.append(('clear', self.strokes))
+        self.strokes = []
+        self.redo_stack = []
+        return True
+    
+    def undo(self):
+        """
+        Undo the last action
+        
+        Returns:
+            list: Strokes whose area must be re-rendered (None if nothing was undone)
+        """
+        self.end_stroke()
+        if not self.undo_stack:
+            return None
+        action, payload = self.undo_stack.pop()
+        self.redo_stack.append((action, payload))
+        if action == 'stroke':
+            self.strokes.remove(payload)
+            return [payload]
+        self.strokes = payload
+        return list(payload)
+    
+    def redo(self):
+        """
+        Redo the last undone action
+        
+        Returns:
+            list: Strokes whose area must be re-rendered (None if nothing was redone)
+        """
+        if not self.redo_stack:
+            return None
+        action, payload = self.redo_stack.pop()
+        self.undo_stack.append((action, payload))
+        if action == 'stroke':
+            self.strokes.append(payload)
+            return [payload]
+        removed = self.strokes
+        self.strokes = []
+        return removed
+    
+    def render_box(self, x0, y0, x1, y1, out=None, layer=None):
+        """
+        Render a box of the drawing's coordinate space from the strokes
+        
+        Args:
+            x0, y0: Top-left corner (inclusive)
+            x1, y1: Bottom-right corner (exclusive)
+            out: Optional (y1 - y0, x1 - x0, 3) array to render into
+            layer: Render only this layer's strokes (all strokes in order if None)
+        
+        Returns:
+            np.ndarray: The rendered box
+        """
+        if out is None:
+            out = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        strokes = []
+        for stroke in self.strokes:
+            if layer is not None and stroke.layer != layer:
+                continue
+            sx0, sy0, sx1, sy1 = stroke.bbox
+            if sx1 >= x0 and sx0 < x1 and sy1 >= y0 and sy0 < y1:
+                strokes.append(stroke)
+        if not strokes:
+            out[:] = self.background
+            return out
+        
+        # OpenCV clips shapes at the image border slightly differently than
+        # it rasterizes them inside, so draw with a margin and keep the middle
+        margin = RENDER_MARGIN + max(stroke.reach for stroke in strokes)
+        scratch = np.empty((y1 - y0 + 2 * margin, x1 - x0 + 2 * margin, 3), dtype=np.uint8)
+        scratch[:] = self.background
+        for stroke in strokes:
+            stroke.draw(scratch, offset=(x0 - margin, y0 - margin))
+        out[:] = scratch[margin:margin + y1 - y0, margin:margin + x1 - x0]
+        return out
+    
+    def render_region(self, image, x0, y0, x1, y1):
+        """
+        Re-render a box of the raster from the strokes
+        
+        Args:
+            image: Full-size BGR canvas
+            x0, y0: Top-left corner (inclusive)
+            x1, y1: Bottom-right corner (exclusive)
+        """
+        self.render_box(x0, y0, x1, y1, out=image[y0:y1, x0:x1])
+    
+    def bounds(self):
+        """
+        Get the area to export: the drawing size, grown to include every stroke
+        
+        Returns:
+            tuple: (x0, y0, x1, y1) with x1, y1 exclusive
+        """
+        x0, y0, x1, y1 = 0, 0, self.width, self.height
+        for stroke in self.strokes:
+            sx0, sy0, sx1, sy1 = stroke.bbox
+            x0, y0 = min(x0, sx0), min(y0, sy0)
+            x1, y1 = max(x1, sx1 + 1), max(y1, sy1 + 1)
+        return x0, y0, x1, y1
+    
+    def render(self, scale=1.0, line_type=cv2.LINE_AA):
+        """
+        Render the whole drawing at any scale
+        
+        Args:
+            scale: Output pixels per drawing pixel
+            line_type: OpenCV line type (antialiased by default)
+        
+        Returns:
+            np.ndarray: BGR image of bounds() times scale
+        """
+        x0, y0, x1, y1 = self.bounds()
+        image = np.empty((int(round((y1 - y0) * scale)), int(round((x1 - x0) * scale)), 3),
+                         dtype=np.uint8)
+        image[:] = self.background
+        layer_image = np.empty_like(image)
+        for index, layer in enumerate(self.layers):
+            strokes = [stroke for stroke in self.strokes if stroke.layer == index]
+            if not layer.visible or not strokes:
+                continue
+            layer_image[:] = self.background
+            for stroke in strokes:
+                stroke.draw(layer_image, offset=(x0, y0), scale=scale, line_type=line_type)
+            blend_layer(image, layer_image, self.background, layer.opacity)
+        return image
+    
+    def to_svg(self):
+        """
+        Export the drawing as SVG
+        
+        Returns:
+            str: SVG document
+        """
+        def rgb(color):
+            return f"rgb({color[2]},{color[1]},{color[0]})"
+        
+        x0, y0, x1, y1 = self.bounds()
+        lines = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{x1 - x0}" height="{y1 - y0}" '
+            f'viewBox="{x0} {y0} {x1 - x0} {y1 - y0}">',
+            f'<rect x="{x0}" y="{y0}" width="{x1 - x0}" height="{y1 - y0}" '
+            f'fill="{rgb(self.background)}"/>',
+        ]
+        # An eraser clears only what its layer holds so far: everything drawn
+        # on the layer before it is wrapped in a group masked by its discs
+        masks = []
+        for index, layer in enumerate(self.layers):
+            strokes = [stroke for stroke in self.strokes if stroke.layer == index]
+            if not layer.visible or not strokes:
+                continue
+            body = []
+            for stroke in strokes:
+                if stroke.tool == ERASER:
+                    if not body:
+                        continue
+                    mask_id = f'erase-{len(masks)}'
+                    discs = ''.join(f'<circle cx="{x}" cy="{y}" r="{stroke.size}"/>'
+                                    for x, y in stroke.dabs)
+                    masks.append(f'<mask id="{mask_id}" maskUnits="userSpaceOnUse" x="{x0}" y="{y0}" '
+                                 f'width="{x1 - x0}" height="{y1 - y0}">'
+                                 f'<rect x="{x0}" y="{y0}" width="{x1 - x0}" height="{y1 - y0}" '
+                                 f'fill="white"/><g fill="black">{discs}</g></mask>')
+                    body = [f'<g mask="url(#{mask_id})">'] + body + ['</g>']
+                elif stroke.count == 1:
+                    x, y = stroke.points[0]
+                    body.append(f'<circle cx="{x}" cy="{y}" r="{max(stroke.size // 2, 1)}" '
+                                f'fill="{rgb(stroke.color)}"/>')
+                else:
+                    points = ' '.join(f'{x},{y}' for x, y in stroke.points)
+                    body.append(f'<polyline points="{points}" fill="none" stroke="{rgb(stroke.color)}" '
+                                f'stroke-width="{stroke.size}" stroke-linecap="round" '
+                                f'stroke-linejoin="round"/>')
+            lines.append(f'<g id="{layer.name}" opacity="{layer.opacity:g}">')
+            lines.extend(body)
+            lines.append('</g>')
+        if masks:
+            lines.insert(2, '<defs>' + ''.join(masks) + '</defs>')
+        lines.append('</svg>')
+        return '\n'.join(lines)
+    
+    def save_svg(self, path):
+        """Write the drawing as an SVG file"""
+        with open(path, 'w') as f:
+            f.write(self.to_svg())
+    
+    def save_png(self, path, scale=1.0):
+        """
+        Write the drawing as a PNG at any scale
+        
+        Returns:
+            bool: True if the file was written
+        """
+        return cv2.imwrite(path, self.render(scale))
+    
+    def timelapse(self, fps=30, duration=10.0, stroke_gap=0.25, scale=1.0):
+        """
+        Replay the drawing stroke by stroke
+        
+        Drawing time inside strokes keeps its recorded pace; pauses between
+        strokes are shortened to `stroke_gap`. The whole replay is stretched
+        or compressed to `duration` seconds.
+        
+        Args:
+            fps: Frames per second
+            duration: Length of the replay in seconds
+            stroke_gap: Seconds between strokes before rescaling
+            scale: Output scale
+        
+        Yields:
+            np.ndarray: The replay image (the same array, updated each frame)
+        """
+        # Replay clock of every point
+        clocks = []
+        elapsed = 0.0
+        for stroke in self.strokes:
+            times = stroke.times - stroke.times[0]
+            times = np.maximum.accumulate(times)
+            clocks.append(elapsed + times)
+            elapsed += float(times[-1]) + stroke_gap
+        
+        x0, y0, x1, y1 = self.bounds()
+        image = np.empty((int(round((y1 - y0) * scale)), int(round((x1 - x0) * scale)), 3),
+                         dtype=np.uint8)
+        image[:] = self.background
+        
+        # Every layer is replayed on its own image and the visible ones are
+        # flattened into the output whenever something was drawn
+        layer_images = {}
+        for stroke in self.strokes:
+            if stroke.layer not in layer_images:
+                layer_images[stroke.layer] = np.empty_like(image)
+                layer_images[stroke.layer][:] = self.background
+        shown = [(self.layers[index], layer_images[index]) for index in sorted(layer_images)
+                 if index < len(self.layers) and self.layers[index].visible]
+        mask = np.empty(image.shape[:2], dtype=np.uint8)
+        frames = max(int(round(fps * duration)), 1)
+        stretch = elapsed / frames if elapsed > 0 else 0.0
+        
+        stroke_index, point_index = 0, 0
+        for frame in range(1, frames + 1):
+            until = frame * stretch
+            drawn = False
+            while stroke_index < len(self.strokes):
+                stroke = self.strokes[stroke_index]
+                end = int(np.searchsorted(clocks[stroke_index], until, side='right'))
+                if frame == frames:
+                    end = stroke.count
+                if end > point_index:
+                    stroke.draw(layer_images[stroke.layer], start=point_index, end=end,
+                                offset=(x0, y0), scale=scale, line_type=cv2.LINE_AA)
+                    point_index = end
+                    drawn = True
+                if point_index < stroke.count:
+                    break
+                stroke_index, point_index = stroke_index + 1, 0
+            if drawn:
+                image[:] = self.background
+                for layer, layer_image in shown:
+                    blend_layer(image, layer_image, self.background, layer.opacity, mask)
+            yield image
+    
+    def save_timelapse(self, path, fps=30, duration=10.0, codec='mp4v', scale=1.0):
+        """
+        Write the time-lapse replay as a video
+        
+        Returns:
+            int: Frames written (0 if the writer could not be opened)
+        """
+        x0, y0, x1, y1 = self.bounds()
+        size = (int(round((x1 - x0) * scale)), int(round((y1 - y0) * scale)))
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*codec), fps, size)
+        if not writer.isOpened():
+            print(f"Error opening video writer: {path}")
+            return 0
+        written = 0
+        for image in self.timelapse(fps, duration, scale=scale):
+            writer.write(image)
+            written += 1
+        writer.release()
+        return written
+    
+    def save(self, path):
+        """
+        Save the stroke log as .npz (points and times concatenated, one row per stroke)
+        
+        Args:
+            path: Output file
+        """
+        strokes = self.strokes
+        counts = np.array([stroke.count for stroke in strokes], dtype=np.int64)
+        np.savez_compressed(
+            path,
+            size=np.array([self.width, self.height]),
+            background=np.array(self.background, dtype=np.uint8),
+            layer_names=np.array([layer.name for layer in self.layers]),
+            layer_visible=np.array([layer.visible for layer in self.layers], dtype=bool),
+            layer_opacity=np.array([layer.opacity for layer in self.layers], dtype=np.float32),
+            layers=np.array([stroke.layer for stroke in strokes], dtype=np.int32),
+            tools=np.array([stroke.tool for stroke in strokes], dtype='<U6'),
+            colors=np.array([stroke.color for stroke in strokes], dtype=np.uint8).reshape(-1, 3),
+            sizes=np.array([stroke.size for stroke in strokes], dtype=np.int32),
+            counts=counts,
+            points=np.concatenate([stroke.points for stroke in strokes]) if strokes
+            else np.empty((0, 2), dtype=np.int32),
+            times=np.concatenate([stroke.times for stroke in strokes]) if strokes
+            else np.empty(0),
+        )
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Load a stroke log written by save()
+        
+        Returns:
+            StrokeDocument: Drawing with the saved strokes (empty history)
+        """
+        with np.load(path) as data:
+            width, height = (int(v) for v in data['size'])
+            if 'layer_names' in data:
+                layers = [Layer(str(name), visible, opacity) for name, visible, opacity
+                          in zip(data['layer_names'], data['layer_visible'], data['layer_opacity'])]
+                stroke_layers = data['layers']
+            else:
+                # Logs from before layers: everything on one opaque layer
+                layers = [Layer('ink')]
+                stroke_layers = np.zeros(len(data['tools']), dtype=np.int32)
+            document = cls(width, height, tuple(int(c) for c in data['background']), layers)
+            offsets = np.concatenate([[0], np.cumsum(data['counts'])])
+            for i, tool in enumerate(data['tools']):
+                start, end = offsets[i], offsets[i + 1]
+                document.strokes.append(Stroke(str(tool), data['colors'][i], int(data['sizes'][i]),
+                                               data['points'][start:end], data['times'][start:end],
+                                               int(stroke_layers[i])))
+        return document
+
+
+def main():
+    """Export entry point"""
+    parser = argparse.ArgumentParser(description="Export an Air Drawing stroke log")
+    parser.add_argument('drawing', help="Stroke log (.npz) saved by StrokeDocument.save")
+    parser.add_argument('--svg', help="Write an SVG file")
+    parser.add_argument('--png', help="Write a PNG file")
+    parser.add_argument('--scale', type=float, default=1.0, help="PNG / time-lapse scale")
+    parser.add_argument('--timelapse', help="Write a time-lapse video")
+    parser.add_argument('--duration', type=float, default=10.0, help="Time-lapse length in seconds")
+    parser.add_argument('--fps', type=int, default=30, help="Time-lapse frame rate")
+    args = parser.parse_args()
+    
+    document = StrokeDocument.load(args.drawing)
+    print(f"{len(document.strokes)} strokes, {document.width}x{document.height}")
+    if args.svg:
+        document.save_svg(args.svg)
+        print(f"SVG written to {args.svg}")
+    if args.png:
+        document.save_png(args.png, args.scale)
+        print(f"PNG written to {args.png}")
+    if args.timelapse:
+        frames = document.save_timelapse(args.timelapse, args.fps, args.duration, scale=args.scale)
+        print(f"Time-lapse written to {args.timelapse} ({frames} frames)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Text Sprites Module
+Cache of pre-rendered text sprites that replaces per-frame cv2.putText calls
+
+HUD and menu strings are mostly the same from frame to frame, yet
+cv2.putText rasterizes (and antialiases) every glyph again each time.
+TextCache rasterizes a (string, font, scale, color, thickness, outline)
+combination once, keeps it as a premultiplied sprite plus its inverse
+coverage, and afterwards only blends the sprite into the frame:
+
+    roi = sprite + roi * (255 - alpha) / 255
+
+Both images come from drawing the text onto a black and onto a white
+background; their difference is exactly how much of the frame shows
+through, so the blit matches putText (antialiasing included) to within
+rounding. Dynamic strings such as scores are kept in an LRU of bounded
+size.
+
+    python text_sprites.py            # putText vs cached blit cost
+"""
+
+import argparse
+import time
+from collections import OrderedDict
+import cv2
+import numpy as np
+
+
+class TextSprite:
+    """One rasterized string"""
+    
+    __slots__ = ('image', 'inverse_alpha', 'dx', 'dy')
+    
+    def __init__(self, image, inverse_alpha, dx, dy):
+        """
+        Args:
+            image: Premultiplied BGR text on black
+            inverse_alpha: 255 - coverage per pixel (3 channels)
+            dx: Sprite left edge relative to the text origin
+            dy: Sprite top edge relative to the text origin (baseline)
+        """
+        self.image = image
+        self.inverse_alpha = inverse_alpha
+        self.dx = dx
+        self.dy = dy
+
+
+class TextCache:
+    """LRU cache of text sprites with a putText-compatible drawing call"""
+    
+    def __init__(self, max_entries=256):
+        """
+        Initialize the cache
+        
+        Args:
+            max_entries: Sprites kept before the least recently used is dropped
+        """
+        self.max_entries = max_entries
+        self._sprites = OrderedDict()
+        self._sizes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def clear(self):
+        """Drop all sprites and sizes"""
+        self._sprites.clear()
+        self._sizes.clear()
+    
+    def get_text_size(self, text, font_face, font_scale, thickness):
+        """
+        Cached cv2.getTextSize
+        
+        Returns:
+            tuple: ((width, height), baseline) like cv2.getTextSize
+        """
+        key = (text, font_face, font_scale, thickness)
+        sizes = self._sizes
+        size = sizes.get(key)
+        if size is None:
+            size = cv2.getTextSize(text, font_face, font_scale, thickness)
+            sizes[key] = size
+            if len(sizes) > self.max_entries:
+                sizes.popitem(last=False)
+        else:
+            sizes.move_to_end(key)
+        return size
+    
+    def _render(self, text, font_face, font_scale, color, thickness, line_type,
+                outline_color, outline_thickness):
+        """Rasterize one string into a sprite cropped to its visible pixels"""
+        (width, height), baseline = cv2.getTextSize(text, font_face, font_scale,
+                                                    max(thickness, outline_thickness))
+        pad = max(thickness, outline_thickness) + 4
+        origin = (pad, pad + height)
+        shape = (height + baseline + 2 * pad, width + 2 * pad, 3)
+        
+        # Same strokes on black and on white: the difference is the frame's share
+        on_black = np.zeros(shape, dtype=np.uint8)
+        on_white = np.full(shape, 255, dtype=np.uint8)
+        for image in (on_black, on_white):
+            if outline_color is not None and outline_thickness > 0:
+                cv2.putText(image, text, origin, font_face, font_scale, outline_color,
+                            outline_thickness, line_type)
+            cv2.putText(image, text, origin, font_face, font_scale, color, thickness, line_type)
+        inverse_alpha = cv2.subtract(on_white, on_black)
+        
+        # Crop to the pixels the text touches
+        ys, xs = np.nonzero(inverse_alpha.min(axis=2) < 255)
+        if len(xs) == 0:
+            return None
+        top, bottom = ys.min(), ys.max() + 1
+        left, right = xs.min(), xs.max() + 1
+        return TextSprite(
+            np.ascontiguousarray(on_black[top:bottom, left:right]),
+            np.ascontiguousarray(inverse_alpha[top:bottom, left:right]),
+            int(left) - origin[0],
+            int(top) - origin[1],
+        )
+    
+    def get_sprite(self, text, font_face, font_scale, color, thickness=1, line_type=cv2.LINE_8,
+                   outline_color=None, outline_thickness=0):
+        """
+        Get (rendering if needed) the sprite for a string
+        
+        Returns:
+            TextSprite: Sprite, or None if the string draws nothing
+        """
+        key = (text, font_face, font_scale, tuple(color), thickness, line_type,
+               tuple(outline_color) if outline_color is not None else None, outline_thickness)
+        sprites = self._sprites
+        if key in sprites:
+            self.hits += 1
+            sprites.move_to_end(key)
+            return sprites[key]
+        
+        self.misses += 1
+        sprite = self._render(text, font_face, font_scale, color, thickness, line_type,
+                              outline_color, outline_thickness)
+        sprites[key] = sprite
+        if len(sprites) > self.max_entries:
+            sprites.popitem(last=False)
+        return sprite
+    
+    def put_text(self, frame, text, org, font_face, font_scale, color, thickness=1,
+                 line_type=cv2.LINE_8, outline_color=None, outline_thickness=0):
+        """
+        Draw text like cv2.putText, from the cached sprite
+        
+        Args:
+            frame: BGR uint8 image to draw on (modified in place)
+            text: String to draw
+            org: Bottom-left corner of the text (baseline start)
+            font_face: OpenCV font
+            font_scale: Font scale
+            color: Text color
+            thickness: Stroke thickness
+            line_type: OpenCV line type
+            outline_color: Color of an outline drawn under the text (None for no outline)
+            outline_thickness: Stroke thickness of the outline
+        
+        Returns:
+            np.ndarray: The frame
+        """
+        sprite = self.get_sprite(text, font_face, font_scale, color, thickness, line_type,
+                                 outline_color, outline_thickness)
+        if sprite is None:
+            return frame
+        
+        # Clip the sprite to the frame
+        sprite_h, sprite_w = sprite.image.shape[:2]
+        x = int(org[0]) + sprite.dx
+        y = int(org[1]) + sprite.dy
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + sprite_w, frame.shape[1]), min(y + sprite_h, frame.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return frame
+        
+        image = sprite.image
+        inverse_alpha = sprite.inverse_alpha
+        if (x0, y0, x1, y1) != (x, y, x + sprite_w, y + sprite_h):
+            image = image[y0 - y:y1 - y, x0 - x:x1 - x]
+            inverse_alpha = inverse_alpha[y0 - y:y1 - y, x0 - x:x1 - x]
+        
+        roi = frame[y0:y1, x0:x1]
+        cv2.multiply(roi, inverse_alpha, dst=roi, scale=1 / 255)
+        cv2.add(roi, image, dst=roi)
+        return frame
+
+
+# Shared cache used by the games' HUDs and menus
+TEXT_CACHE = TextCache()
+
+
+def put_text(frame, text, org, font_face, font_scale, color, thickness=1,
+             line_type=cv2.LINE_8, outline_color=None, outline_thickness=0):
+    """Draw text through the shared cache (same arguments as cv2.putText)"""
+    return TEXT_CACHE.put_text(frame, text, org, font_face, font_scale, color, thickness,
+                               line_type, outline_color, outline_thickness)
+
+
+def get_text_size(text, font_face, font_scale, thickness):
+    """cv2.getTextSize through the shared cache"""
+    return TEXT_CACHE.get_text_size(text, font_face, font_scale, thickness)
+
+
+def benchmark(frames=2000):
+    """
+    Compare cv2.putText with cached sprites on typical HUD strings
+    
+    Args:
+        frames: Draw calls per string
+    
+    Returns:
+        list: (text, putText microseconds, sprite microseconds, max pixel difference) tuples
+    """
+    strings = [
+        ("GESTURE GAME COLLECTION", cv2.FONT_HERSHEY_DUPLEX, 2, 3),
+        ("C: Next Color | T: Toggle Tool | +/-: Brush Size", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1),
+        ("Score: 120", cv2.FONT_HERSHEY_SIMPLEX, 1, 2),
+    ]
+    cache = TextCache()
+    background = np.full((480, 640, 3), 90, dtype=np.uint8)
+    results = []
+    for text, font, scale, thickness in strings:
+        frame = background.copy()
+        start = time.perf_counter()
+        for _ in range(frames):
+            cv2.putText(frame, text, (20, 200), font, scale, (0, 255, 255), thickness)
+        direct = (time.perf_counter() - start) / frames * 1e6
+        
+        frame = background.copy()
+        start = time.perf_counter()
+        for _ in range(frames):
+            cache.put_text(frame, text, (20, 200), font, scale, (0, 255, 255), thickness)
+        cached = (time.perf_counter() - start) / frames * 1e6
+        
+        expected = cv2.putText(background.copy(), text, (20, 200), font, scale, (0, 255, 255), thickness)
+        actual = cache.put_text(background.copy(), text, (20, 200), font, scale, (0, 255, 255), thickness)
+        difference = int(cv2.absdiff(expected, actual).max())
+        results.append((text, direct, cached, difference))
+    return results
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark cached text sprites against cv2.putText")
+    parser.add_argument('--frames', type=int, default=2000, help="Draw calls per string")
+    args = parser.parse_args()
+    
+    for text, direct, cached, difference in benchmark(args.frames):
+        print(f"{text[:32]:32s}  putText {direct:7.1f} us  sprite {cached:6.1f} us  "
+              f"{direct / cached:4.1f}x  max diff {difference}")
+
+
+if __name__ == "__main__":
+    main()
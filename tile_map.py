@@ -0,0 +1,270 @@
+"""
+Tile Map Module
+Sparse, unbounded raster made of fixed-size tiles with an LRU that spills to disk
+
+Only tiles that contain ink exist: a tile is allocated the first time
+something other than the background is written into it and freed again
+when it is erased back to the background, so memory follows how much has
+been drawn rather than how large the canvas is. At most `max_resident`
+tiles are kept in memory (least recently used first out); the rest live in
+a memory-mapped spill file and are paged back in when read.
+"""
+
+import tempfile
+from collections import OrderedDict
+import numpy as np
+
+
+class TileMap:
+    """Sparse world-space raster with in-memory LRU tiles and a memory-mapped spill file"""
+    
+    def __init__(self, tile_size=128, background=(255, 255, 255), max_resident=256):
+        """
+        Initialize an empty map
+        
+        Args:
+            tile_size: Tile edge in pixels
+            background: BGR color of unallocated space
+            max_resident: Tiles kept in memory before spilling to disk
+        """
+        self.tile_size = tile_size
+        self.background = tuple(background)
+        self.max_resident = max_resident
+        self.tile_shape = (tile_size, tile_size, 3)
+        # Scalar fill value for gray backgrounds (much faster than a per-channel broadcast)
+        self._fill = background[0] if len(set(background)) == 1 else np.array(background, dtype=np.uint8)
+        
+        # Allocated tiles: the resident ones in LRU order, the rest by spill slot
+        self._resident = OrderedDict()
+        self._changed = set()
+        self._slots = {}
+        self._free_slots = []
+        
+        # Spill file (created on first eviction, grown by doubling)
+        self._spill_file = None
+        self._spill = None
+        self._capacity = 0
+    
+    def __len__(self):
+        return len(self._slots.keys() | self._resident.keys())
+    
+    def __bool__(self):
+        return bool(self._resident or self._slots)
+    
+    @property
+    def resident_bytes(self):
+        """Bytes of tiles held in memory"""
+        return len(self._resident) * int(np.prod(self.tile_shape))
+    
+    @property
+    def spilled_tiles(self):
+        """Number of allocated tiles that are only on disk"""
+        return len(self._slots.keys() - self._resident.keys())
+    
+    def keys(self):
+        """Get the keys (tile x, tile y) of all allocated tiles"""
+        return set(self._resident) | set(self._slots)
+    
+    def _grow_spill(self):
+        """Create or enlarge the spill file"""
+        tile_bytes = int(np.prod(self.tile_shape))
+        capacity = max(self._capacity * 2, 64)
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix='tile_map_')
+        else:
+            self._spill.flush()
+        self._spill_file.truncate(capacity * tile_bytes)
+        self._spill = np.memmap(self._spill_file, dtype=np.uint8, mode='r+',
+                                shape=(capacity,) + self.tile_shape)
+        self._free_slots.extend(range(capacity - 1, self._capacity - 1, -1))
+        self._capacity = capacity
+    
+    def _make_resident(self, key, tile):
+        """Add a tile to the LRU, spilling the least recently used beyond the limit"""
+        resident = self._resident
+        resident[key] = tile
+        while len(resident) > self.max_resident:
+            old_key, old_tile = resident.popitem(last=False)
+            if old_key in self._changed or old_key not in self._slots:
+                if old_key not in self._slots:
+                    if not self._free_slots:
+                        self._grow_spill()
+                    self._slots[old_key] = self._free_slots.pop()
+                self._spill[self._slots[old_key]] = old_tile
+                self._changed.discard(old_key)
+    
+    def _tile(self, key):
+        """
+        Get an allocated tile (paging it in from disk if needed)
+        
+        Args:
+            key: (tile x, tile y)
+        
+        Returns:
+            np.ndarray: Writable tile, or None if the tile is not allocated
+        """
+        resident = self._resident
+        tile = resident.get(key)
+        if tile is not None:
+            resident.move_to_end(key)
+            return tile
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        tile = np.array(self._spill[slot])
+        self._make_resident(key, tile)
+        return tile
+    
+    def _allocate(self, key):
+        """Create a background tile"""
+        tile = np.empty(self.tile_shape, dtype=np.uint8)
+        tile[:] = self._fill
+        self._make_resident(key, tile)
+        self._changed.add(key)
+        return tile
+    
+    def _free(self, key):
+        """Drop a tile (it is background again)"""
+        self._resident.pop(key, None)
+        self._changed.discard(key)
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._free_slots.append(slot)
+    
+    def _tile_range(self, x0, y0, x1, y1):
+        """Tile index ranges covering a box (x1, y1 exclusive)"""
+        size = self.tile_size
+        return range(x0 // size, (x1 - 1) // size + 1), range(y0 // size, (y1 - 1) // size + 1)
+    
+    def read(self, x0, y0, x1, y1, out=None):
+        """
+        Copy a box of the map (background where nothing is allocated)
+        
+        Args:
+            x0, y0: Top-left world corner (inclusive)
+            x1, y1: Bottom-right world corner (exclusive)
+            out: Optional (y1 - y0, x1 - x0, 3) array to fill
+        
+        Returns:
+            np.ndarray: The box
+        """
+        if out is None:
+            out = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        out[:] = self._fill
+        size = self.tile_size
+        columns, rows = self._tile_range(x0, y0, x1, y1)
+        for ty in rows:
+            for tx in columns:
+                tile = self._tile((tx, ty))
+                if tile is None:
+                    continue
+                left, top = tx * size, ty * size
+                ax0, ay0 = max(x0, left), max(y0, top)
+                ax1, ay1 = min(x1, left + size), min(y1, top + size)
+                out[ay0 - y0:ay1 - y0, ax0 - x0:ax1 - x0] = tile[ay0 - top:ay1 - top, ax0 - left:ax1 - left]
+        return out
+    
+    def write(self, x0, y0, image):
+        """
+        Store a box of pixels, allocating tiles on first ink and freeing erased ones
+        
+        Args:
+            x0, y0: World position of the image's top-left corner
+            image: BGR pixels
+        """
+        height, width = image.shape[:2]
+        x1, y1 = x0 + width, y0 + height
+        size = self.tile_size
+        background = self.background
+        columns, rows = self._tile_range(x0, y0, x1, y1)
+        for ty in rows:
+            for tx in columns:
+                key = (tx, ty)
+                left, top = tx * size, ty * size
+                ax0, ay0 = max(x0, left), max(y0, top)
+                ax1, ay1 = min(x1, left + size), min(y1, top + size)
+                block = image[ay0 - y0:ay1 - y0, ax0 - x0:ax1 - x0]
+                inked = (block != background).any()
+                
+                tile = self._tile(key)
+                if tile is None:
+                    if not inked:
+                        continue
+                    tile = self._allocate(key)
+                tile[ay0 - top:ay1 - top, ax0 - left:ax1 - left] = block
+                self._changed.add(key)
+                if not inked and not (tile != background).any():
+                    self._free(key)
+    
+    def keys_touched(self, boxes):
+        """
+        Get the keys of the tiles (allocated or not) covered by some boxes
+        
+        Args:
+            boxes: (N, 4) rows of (x0, y0, x1, y1), inclusive
+        
+        Returns:
+            set: (tile x, tile y) keys
+        """
+        keys = set()
+        for tx0, ty0, tx1, ty1 in np.asarray(boxes, dtype=np.int64).reshape(-1, 4) // self.tile_size:
+            for ty in range(int(ty0), int(ty1) + 1):
+                keys.update((tx, ty) for tx in range(int(tx0), int(tx1) + 1))
+        return keys
+    
+    def runs(self, keys):
+        """
+        Group tile keys into boxes, one per horizontal run of tiles
+        
+        Args:
+            keys: Iterable of (tile x, tile y)
+        
+        Returns:
+            list: (x0, y0, x1, y1) world boxes (x1, y1 exclusive)
+        """
+        rows = {}
+        for tx, ty in keys:
+            rows.setdefault(ty, []).append(tx)
+        size = self.tile_size
+        boxes = []
+        for ty in sorted(rows):
+            columns = sorted(rows[ty])
+            start = columns[0]
+            for i, tx in enumerate(columns):
+                if i + 1 == len(columns) or columns[i + 1] != tx + 1:
+                    boxes.append((start * size, ty * size, (tx + 1) * size, (ty + 1) * size))
+                    if i + 1 < len(columns):
+                        start = columns[i + 1]
+        return boxes
+    
+    def clear(self):
+        """Drop every tile (the spill file is kept for reuse)"""
+        self._resident.clear()
+        self._changed.clear()
+        self._free_slots.extend(self._slots.values())
+        self._slots.clear()
+    
+    def bounds(self):
+        """
+        Get the world box covered by allocated tiles
+        
+        Returns:
+            tuple: (x0, y0, x1, y1) with x1, y1 exclusive, or None if empty
+        """
+        keys = self.keys()
+        if not keys:
+            return None
+        xs = [key[0] for key in keys]
+        ys = [key[1] for key in keys]
+        size = self.tile_size
+        return (min(xs) * size, min(ys) * size, (max(xs) + 1) * size, (max(ys) + 1) * size)
+    
+    def close(self):
+        """Release the spill file"""
+        if self._spill_file is not None:
+            self._spill = None
+            self._spill_file.close()
+            self._spill_file = None
+            self._capacity = 0
+            self._free_slots = []
+            self._slots.clear()
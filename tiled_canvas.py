@@ -0,0 +1,136 @@
+"""
+Tiled Canvas Module
+Drawing canvas split into tiles, with an ink mask kept up to date per tile
+
+The canvas is one contiguous image (so OpenCV can draw on it and blend it
+directly), divided into tiles so an owner can rebuild just the tiles a
+change covers. The canvas keeps an ink mask (pixels that differ from the
+background) and which tiles contain ink, both updated only where tiles
+were rebuilt, so the canvas can be composited over video by touching
+inked tiles only.
+"""
+
+import cv2
+import numpy as np
+
+
+class TiledCanvas:
+    """Contiguous canvas image with per-tile rebuilds and an ink mask"""
+    
+    def __init__(self, width, height, tile_size=64, background=(255, 255, 255)):
+        """
+        Initialize the canvas
+        
+        Args:
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            tile_size: Tile edge in pixels
+            background: BGR color of an empty canvas
+        """
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.background = tuple(background)
+        self.rows = (height + tile_size - 1) // tile_size
+        self.cols = (width + tile_size - 1) // tile_size
+        
+        self.image = np.empty((height, width, 3), dtype=np.uint8)
+        self.image[:] = self.background
+        
+        # Ink mask (255 where a pixel differs from the background; padded to
+        # whole tiles) and the tiles that contain any ink
+        self.ink = np.zeros((self.rows * tile_size, self.cols * tile_size), dtype=np.uint8)
+        self.inked = np.zeros((self.rows, self.cols), dtype=bool)
+        self._background_bounds = np.array(self.background, dtype=np.uint8)
+    
+    def update_ink(self, tiles):
+        """
+        Recompute the ink mask of a tile range after drawing
+        
+        Args:
+            tiles: (r0, r1, c0, c1) tile rows and columns (end exclusive)
+        """
+        r0, r1, c0, c1 = tiles
+        size = self.tile_size
+        y0, y1 = r0 * size, min(r1 * size, self.height)
+        x0, x1 = c0 * size, min(c1 * size, self.width)
+        ink = self.ink[y0:y1, x0:x1]
+        cv2.inRange(self.image[y0:y1, x0:x1], self._background_bounds, self._background_bounds, ink)
+        cv2.bitwise_not(ink, ink)
+        
+        block = self.ink[r0 * size:r1 * size, c0 * size:c1 * size]
+        self.inked[r0:r1, c0:c1] = block.reshape(r1 - r0, size, c1 - c0, size).any(axis=(1, 3))
+    
+    def ink_regions(self):
+        """
+        Get boxes that cover every inked tile (one per horizontal run of tiles)
+        
+        Returns:
+            list: (y0, y1, x0, x1) pixel boxes
+        """
+        return self.tile_runs(self.inked)
+    
+    def tile_runs(self, mask):
+        """
+        Get pixel boxes covering the tiles set in a mask (one per horizontal run)
+        
+        Args:
+            mask: (rows, cols) boolean tile mask
+        
+        Returns:
+            list: (y0, y1, x0, x1) pixel boxes
+        """
+        size = self.tile_size
+        regions = []
+        for row in np.flatnonzero(mask.any(axis=1)):
+            padded = np.concatenate(([False], mask[row], [False]))
+            edges = np.flatnonzero(padded[1:] != padded[:-1])
+            y0, y1 = row * size, min((row + 1) * size, self.height)
+            for start, end in zip(edges[::2], edges[1::2]):
+                regions.append((y0, y1, start * size, min(end * size, self.width)))
+        return regions
+    
+    def tile_mask(self, boxes):
+        """
+        Get the tiles touched by any of a set of boxes
+        
+        Args:
+            boxes: (N, 4) rows of (x0, y0, x1, y1), inclusive
+        
+        Returns:
+            np.ndarray: (rows, cols) boolean tile mask
+        """
+        mask = np.zeros((self.rows, self.cols), dtype=bool)
+        boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+        inside = ((boxes[:, 2] >= 0) & (boxes[:, 0] < self.width) &
+                  (boxes[:, 3] >= 0) & (boxes[:, 1] < self.height))
+        boxes = boxes[inside]
+        boxes[:, 0::2] = np.clip(boxes[:, 0::2], 0, self.width - 1)
+        boxes[:, 1::2] = np.clip(boxes[:, 1::2], 0, self.height - 1)
+        for c0, r0, c1, r1 in boxes // self.tile_size:
+            mask[r0:r1 + 1, c0:c1 + 1] = True
+        return mask
+    
+    def redraw_tiles(self, mask, render):
+        """
+        Rebuild the tiles set in a mask and refresh their ink
+        
+        Args:
+            mask: (rows, cols) boolean tile mask
+            render: Function render(image, x0, y0, x1, y1) that redraws a box
+                (x1, y1 exclusive) of the image
+        """
+        size = self.tile_size
+        for y0, y1, x0, x1 in self.tile_runs(mask):
+            render(self.image, x0, y0, x1, y1)
+            self.update_ink((y0 // size, y0 // size + 1, x0 // size, (x1 + size - 1) // size))
+    
+    def fill(self, color=None):
+        """
+        Fill the whole canvas (the background color by default)
+        
+        Args:
+            color: BGR fill color
+        """
+        self.image[:] = self.background if color is None else color
+        self.update_ink((0, self.rows, 0, self.cols))